@@ -0,0 +1,4 @@
+"""Benchmarks of the hot paths of typed_json_dataclass.
+
+Run them with ``python -m benchmarks.run``.
+"""
@@ -0,0 +1,173 @@
+"""Dataclasses and payloads in the shapes that are benchmarked."""
+from dataclasses import dataclass, field, make_dataclass
+from typing import List, Optional
+
+from typed_json_dataclass import TypedJsonMixin
+from typed_json_dataclass.utils import to_camel
+
+WIDE_FIELD_COUNT = 50
+LIST_LENGTH = 1000
+NESTING_DEPTH = 10
+TREE_BREADTH = 3
+
+
+@dataclass
+class Flat(TypedJsonMixin):
+    user_id: int
+    user_name: str
+    email_address: str
+    account_balance: float
+    is_active: bool
+
+
+@dataclass
+class Level(TypedJsonMixin):
+    level_number: int
+    level_name: str
+    child_level: 'Level' = None
+
+
+@dataclass
+class Inner(TypedJsonMixin):
+    inner_id: int
+    inner_name: str
+
+
+@dataclass
+class Nested(TypedJsonMixin):
+    outer_id: int
+    first_inner: Inner
+    second_inner: Inner
+    inner_list: List[Inner]
+
+
+def _wide_name(i):
+    return f'column_{chr(97 + i // 26)}{chr(97 + i % 26)}'
+
+
+Wide = make_dataclass(
+    'Wide',
+    [(_wide_name(i), int if i % 2 else str) for i in range(WIDE_FIELD_COUNT)],
+    bases=(TypedJsonMixin,),
+)
+
+
+@dataclass
+class LargeList(TypedJsonMixin):
+    list_name: str
+    int_values: List[int]
+    str_values: List[str]
+
+
+@dataclass
+class OptionalHeavy(TypedJsonMixin):
+    optional_id: Optional[int] = None
+    optional_name: Optional[str] = None
+    optional_score: Optional[float] = None
+    optional_flag: Optional[bool] = None
+    optional_inner: Optional[Inner] = None
+    optional_label: Optional[str] = None
+    optional_note: Optional[str] = None
+    optional_count: Optional[int] = None
+
+
+@dataclass
+class TreeNode(TypedJsonMixin):
+    node_name: str
+    children: List['TreeNode'] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Case:
+    """A benchmarked shape.
+
+    :name: The name the benchmarks of the shape are reported under
+    :cls: The dataclass of the shape
+    :instance: An instance of ``cls``
+    :payload: The dict ``instance`` is decoded from, or None when ``cls`` can
+              not be decoded from a dict
+    """
+    name: str
+    cls: type
+    instance: object
+    payload: dict = None
+
+
+def _flat():
+    payload = {'user_id': 1, 'user_name': 'alice',
+               'email_address': 'alice@example.com',
+               'account_balance': 12.5, 'is_active': True}
+    return Case('flat', Flat, Flat(**payload), payload)
+
+
+def _nested():
+    def inner(i):
+        return {'inner_id': i, 'inner_name': f'inner {i}'}
+
+    payload = {'outer_id': 1, 'first_inner': inner(1),
+               'second_inner': inner(2),
+               'inner_list': [inner(i) for i in range(10)]}
+    return Case('nested', Nested, Nested.from_dict(payload), payload)
+
+
+def _deep():
+    payload = None
+    for i in range(NESTING_DEPTH):
+        payload = {'level_number': i, 'level_name': f'level {i}',
+                   'child_level': payload}
+    return Case('deep_self_ref', Level, Level.from_dict(payload), payload)
+
+
+def _wide():
+    payload = {_wide_name(i): i if i % 2 else str(i)
+               for i in range(WIDE_FIELD_COUNT)}
+    return Case('wide', Wide, Wide(**payload), payload)
+
+
+def _large_list():
+    payload = {'list_name': 'numbers',
+               'int_values': list(range(LIST_LENGTH)),
+               'str_values': [str(i) for i in range(LIST_LENGTH)]}
+    return Case('large_list', LargeList, LargeList(**payload), payload)
+
+
+def _optional_heavy():
+    payload = {'optional_id': 1, 'optional_name': None,
+               'optional_score': 0.5, 'optional_flag': None,
+               'optional_inner': None, 'optional_label': 'a',
+               'optional_note': None, 'optional_count': None}
+    return Case('optional_heavy', OptionalHeavy,
+                OptionalHeavy.from_dict(payload), payload)
+
+
+def _tree():
+    def build(depth):
+        children = [build(depth - 1) for _ in range(TREE_BREADTH)] \
+            if depth else []
+        return {'node_name': f'node {depth}', 'children': children}
+
+    payload = build(4)
+    return Case('self_ref_tree', TreeNode, TreeNode.from_dict(payload),
+                payload)
+
+
+def build_cases():
+    """Build all benchmarked shapes.
+
+    :returns: A list of Case
+    """
+    return [_flat(), _nested(), _deep(), _wide(), _large_list(),
+            _optional_heavy(), _tree()]
+
+
+def camel_payload(payload):
+    """Convert the keys of a payload, and of its nested dicts, to camelCase.
+
+    Like ``recursive_rename``, the keys of dicts in lists are kept.
+
+    :payload: A dict with snake_case keys
+    :returns: A new dict with camelCase keys
+    """
+    if isinstance(payload, dict):
+        return {to_camel(k): camel_payload(v) for k, v in payload.items()}
+    return payload
@@ -0,0 +1,196 @@
+"""Measure the throughput and memory of the hot paths.
+
+Every benchmark is timed with timeit, and the peak memory allocated by a
+single call is traced with tracemalloc. The results can be saved as a
+baseline, and later runs can be compared against it::
+
+    python -m benchmarks.run --save baseline.json
+    python -m benchmarks.run --compare baseline.json
+
+Comparing exits with a non-zero status when a benchmark got slower than the
+threshold allows.
+"""
+import argparse
+import json
+import platform
+import re
+import sys
+import timeit
+import tracemalloc
+
+from benchmarks.fixtures import build_cases, camel_payload, Wide
+from typed_json_dataclass import MappingMode
+from typed_json_dataclass.utils import (
+    _to_camel,
+    _to_snake,
+    recursive_rename,
+    to_camel,
+    to_snake,
+)
+
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_MIN_TIME = 0.2
+DEFAULT_REPEAT = 5
+
+
+def _case_benchmarks(case):
+    """Build the benchmarks of a single shape.
+
+    :case: The Case to benchmark
+    :returns: A list of (name, function) tuples
+    """
+    instance = case.instance
+    benchmarks = [
+        ('post_init', instance.__post_init__),
+        ('to_dict', instance.to_dict),
+        ('to_dict_camel_case',
+         lambda: instance.to_dict(mapping_mode=MappingMode.CamelCase)),
+        ('to_json', instance.to_json),
+    ]
+    if case.payload is not None:
+        cls = case.cls
+        payload = case.payload
+        camel = camel_payload(payload)
+        raw_json = instance.to_json()
+        benchmarks += [
+            ('from_dict', lambda: cls.from_dict(payload)),
+            ('from_dict_snake_case',
+             lambda: cls.from_dict(camel,
+                                   mapping_mode=MappingMode.SnakeCase)),
+            ('from_json', lambda: cls.from_json(raw_json)),
+        ]
+    return [(f'{case.name}.{name}', function)
+            for name, function in benchmarks]
+
+
+def _name_benchmarks():
+    """Build the benchmarks of the conversion of names.
+
+    :returns: A list of (name, function) tuples
+    """
+    snake_names = list(Wide.__dataclass_fields__)
+    camel_names = [to_camel(name) for name in snake_names]
+    camel_dict = camel_payload(next(case.payload for case in build_cases()
+                                    if case.name == 'nested'))
+
+    def convert_all(method, names):
+        return lambda: [method(name) for name in names]
+
+    return [
+        ('names.to_camel', convert_all(to_camel, snake_names)),
+        ('names.to_camel_uncached', convert_all(_to_camel, snake_names)),
+        ('names.to_snake', convert_all(to_snake, camel_names)),
+        ('names.to_snake_uncached', convert_all(_to_snake, camel_names)),
+        ('names.recursive_rename',
+         lambda: recursive_rename(camel_dict, to_snake)),
+    ]
+
+
+def all_benchmarks():
+    """Build every benchmark.
+
+    :returns: A list of (name, function) tuples
+    """
+    benchmarks = []
+    for case in build_cases():
+        benchmarks += _case_benchmarks(case)
+    return benchmarks + _name_benchmarks()
+
+
+def measure(function, min_time=DEFAULT_MIN_TIME, repeat=DEFAULT_REPEAT):
+    """Measure a benchmark.
+
+    :function: The function to call, without arguments
+    :min_time: The minimum number of seconds a single timing runs for
+    :repeat: The number of timings, of which the fastest is used
+    :returns: A dict with the ops_per_sec of the function and the peak_bytes
+              allocated by a single call
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    best = min(timer.repeat(repeat=repeat, number=number))
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {'ops_per_sec': number / best, 'peak_bytes': peak_bytes}
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Compare results with a baseline.
+
+    :results: A dict of benchmark names to the result of measure
+    :baseline: A dict of benchmark names to the result of measure
+    :threshold: The relative loss of throughput that counts as a regression
+    :returns: A dict of benchmark names to the relative change in throughput,
+              and a list of the names of the benchmarks that regressed
+    """
+    changes = {}
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]['ops_per_sec']
+        changes[name] = result['ops_per_sec'] / expected - 1
+        if changes[name] < -threshold:
+            regressions.append(name)
+    return changes, regressions
+
+
+def _report(results, changes, regressions):
+    width = max(len(name) for name in results)
+    print(f'{"benchmark":<{width}}  {"ops/sec":>12}  {"peak KiB":>9}  '
+          f'{"change":>8}')
+    for name, result in results.items():
+        change = f'{changes[name]:+8.1%}' if name in changes else ' ' * 8
+        marker = '  REGRESSION' if name in regressions else ''
+        print(f'{name:<{width}}  {result["ops_per_sec"]:>12,.0f}  '
+              f'{result["peak_bytes"] / 1024:>9.1f}  {change}{marker}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-k', dest='pattern',
+                        help='Only run benchmarks matching this regex')
+    parser.add_argument('--save', metavar='PATH',
+                        help='Save the results as a baseline')
+    parser.add_argument('--compare', metavar='PATH',
+                        help='Compare the results with a saved baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Relative slowdown that counts as a regression')
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME,
+                        help='Minimum seconds per timing')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='Number of timings per benchmark')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, function in all_benchmarks():
+        if args.pattern is None or re.search(args.pattern, name):
+            results[name] = measure(function, args.min_time, args.repeat)
+    if not results:
+        parser.error('No benchmark matches the pattern')
+
+    changes, regressions = {}, []
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)['benchmarks']
+        changes, regressions = compare(results, baseline, args.threshold)
+    _report(results, changes, regressions)
+
+    if args.save:
+        with open(args.save, 'w') as baseline_file:
+            json.dump({'python': platform.python_version(),
+                       'benchmarks': results}, baseline_file, indent=2,
+                      sort_keys=True)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import array
+import json
+import sys
+import types
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+from typed_json_dataclass import (
+    TypedJsonMixin,
+    ValidationLevel,
+    array_field,
+)
+from typed_json_dataclass.arrays import ArraySpec
+
+
+@dataclass
+class Samples(TypedJsonMixin):
+    sensor: str
+    values: List[float] = array_field('d')
+    counts: List[int] = array_field('b', default=None)
+
+
+@dataclass
+class CodegenSamples(TypedJsonMixin, codegen=True):
+    values: List[float] = array_field('f')
+
+
+@dataclass
+class Device(TypedJsonMixin):
+    samples: Samples
+
+
+class FakeDtype:
+    def __init__(self, kind, name):
+        self.kind = kind
+        self.name = name
+
+    def __eq__(self, other):
+        return self.name == other.name
+
+    def __str__(self):
+        return self.name
+
+
+class FakeNdarray:
+    def __init__(self, values, dtype, ndim=1):
+        self.values = values
+        self.dtype = dtype
+        self.ndim = ndim
+
+    def astype(self, dtype):
+        convert = float if dtype.kind == 'f' else int
+        return FakeNdarray([convert(v) for v in self.values], dtype)
+
+    def tolist(self):
+        return list(self.values)
+
+    def __eq__(self, other):
+        return FakeNdarray([a == b for a, b in zip(self.values, other.values)],
+                           FakeDtype('b', 'bool'))
+
+    def __bool__(self):
+        raise ValueError('The truth value of an array with more than one '
+                         'element is ambiguous')
+
+
+def fake_array(values):
+    types_found = {type(v) for v in values}
+    if list in types_found:
+        return FakeNdarray(values, FakeDtype('O', 'object'), ndim=2)
+    if types_found <= {bool, int}:
+        return FakeNdarray(values, FakeDtype('i', 'int64'))
+    if types_found <= {bool, int, float}:
+        return FakeNdarray(values, FakeDtype('f', 'float64'))
+    return FakeNdarray(values, FakeDtype('U', 'str'))
+
+
+@pytest.fixture
+def numpy(monkeypatch):
+    module = types.ModuleType('numpy')
+    module.ndarray = FakeNdarray
+    module.dtype = lambda typecode: (FakeDtype('f', 'float64')
+                                     if typecode in 'fd'
+                                     else FakeDtype('i', 'int64'))
+    module.array = fake_array
+    module.empty = lambda size, dtype: FakeNdarray([], dtype)
+    module.array_equal = lambda a, b: a.values == b.values
+    monkeypatch.setitem(sys.modules, 'numpy', module)
+    return module
+
+
+def test_that_lists_are_stored_in_arrays():
+    samples = Samples.from_dict({'sensor': 'a', 'values': [1.0, 2, 3.5],
+                                 'counts': [1, 2]})
+    assert samples.values == array.array('d', [1.0, 2.0, 3.5])
+    assert samples.counts == array.array('b', [1, 2])
+
+
+def test_that_arrays_are_kept():
+    values = array.array('d', [1.0])
+    assert Samples('a', values).values is values
+
+
+@pytest.mark.parametrize('values, counts', [
+    ([1.0, 'x'], None),
+    ([1.0, None], None),
+    ([[1.0]], None),
+    ([1.0], [1.5]),
+    ([1.0], [300]),
+])
+def test_that_invalid_elements_raise(values, counts):
+    with pytest.raises(TypeError, match='Samples.'):
+        Samples('a', values, counts)
+
+
+def test_that_values_that_are_not_lists_raise():
+    with pytest.raises(TypeError, match='but value 5 with type'):
+        Samples('a', 5)
+
+
+def test_that_arrays_are_serialized_as_lists():
+    samples = Samples('a', [1.0, 2.5], [3])
+    assert samples.to_dict() == {'sensor': 'a', 'values': [1.0, 2.5],
+                                 'counts': [3]}
+    assert json.loads(samples.to_json()) == samples.to_dict()
+    assert Device(samples).to_dict() == {'samples': samples.to_dict()}
+
+
+def test_that_replaced_values_are_serialized():
+    samples = Samples('a', [1.0])
+    samples.values = (1.0, 2.0)
+    assert samples.to_dict()['values'] == (1.0, 2.0)
+
+
+def test_that_generated_decoders_store_arrays():
+    samples = CodegenSamples.from_dict({'values': [0.5]})
+    assert samples.values == array.array('f', [0.5])
+
+    with pytest.raises(TypeError):
+        CodegenSamples.from_dict({'values': ['x']})
+
+
+def test_that_trusted_level_still_stores_arrays():
+    samples = Samples.from_dict({'sensor': 1, 'values': [1.0]},
+                                validation_level=ValidationLevel.Trusted)
+    assert samples.sensor == 1
+    assert samples.values == array.array('d', [1.0])
+
+
+def test_that_array_fields_keep_other_options():
+    @dataclass
+    class Tagged(TypedJsonMixin):
+        values: List[int] = array_field('q', default_factory=list,
+                                        metadata={'unit': 'ms'})
+
+    field_def = Tagged.__dataclass_fields__['values']
+    assert field_def.metadata['unit'] == 'ms'
+    assert Tagged().values == array.array('q')
+
+
+def test_that_invalid_typecodes_raise():
+    with pytest.raises(ValueError, match="Invalid numeric typecode 'u'"):
+        array_field('u')
+
+
+def test_that_numpy_must_be_installed(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+    with pytest.raises(ImportError):
+        array_field('d', numpy=True)
+
+
+def test_that_lists_are_stored_in_numpy_arrays(numpy):
+    @dataclass
+    class NumpySamples(TypedJsonMixin):
+        values: List[float] = array_field('d', numpy=True)
+        counts: List[int] = array_field('q', numpy=True, default=None)
+
+    samples = NumpySamples.from_dict({'values': [1, 2.5], 'counts': []})
+    assert isinstance(samples.values, numpy.ndarray)
+    assert samples.values.values == [1.0, 2.5]
+    assert samples.counts.values == []
+    assert samples.to_dict() == {'values': [1.0, 2.5], 'counts': []}
+    assert NumpySamples(samples.values).values is samples.values
+
+    with pytest.raises(TypeError, match='Cannot store str values'):
+        NumpySamples(['1.0'])
+    with pytest.raises(TypeError):
+        NumpySamples([1.0], [1.5])
+    with pytest.raises(TypeError):
+        NumpySamples([[1.0]])
+
+
+def test_that_numpy_arrays_are_compared(numpy):
+    @dataclass
+    class Readings(TypedJsonMixin):
+        name: str
+        values: List[float] = array_field('d', numpy=True, default=None)
+        units: List[str] = None
+        note: str = field(default='', compare=False)
+
+    readings = Readings.from_dict({'name': 'a', 'values': [1.0, 2.0],
+                                   'units': ['s']})
+    assert readings == Readings.from_dict({'name': 'a',
+                                           'values': [1.0, 2.0],
+                                           'units': ['s'],
+                                           'note': 'other'})
+    assert readings != Readings.from_dict({'name': 'a',
+                                           'values': [1.0, 3.0]})
+    assert readings != Readings.from_dict({'name': 'b',
+                                           'values': [1.0, 2.0]})
+    assert readings != Readings('a')
+    assert Readings('a') != readings
+    assert Readings('a') == Readings('a')
+    assert readings != 'a'
+
+
+def test_that_real_numpy_arrays_are_compared():
+    numpy = pytest.importorskip('numpy')
+
+    @dataclass
+    class Readings(TypedJsonMixin):
+        values: List[float] = array_field('d', numpy=True)
+        counts: List[int] = array_field('q', numpy=True, default=None)
+
+    readings = Readings.from_dict({'values': [1.0, 2.5], 'counts': [1, 2]})
+    assert isinstance(readings.values, numpy.ndarray)
+    assert readings.to_dict() == {'values': [1.0, 2.5], 'counts': [1, 2]}
+    assert Readings.from_dict(readings.to_dict()) == readings
+    assert readings != Readings.from_dict({'values': [1.0, 2.5],
+                                           'counts': [1, 3]})
+    assert readings != Readings([1.0, 2.5])
+
+
+def test_that_specs_convert_lists():
+    assert ArraySpec('i').convert([1]) == array.array('i', [1])
+    assert ArraySpec('i').array_type() is array.array
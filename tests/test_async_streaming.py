@@ -0,0 +1,132 @@
+import asyncio
+import json
+from dataclasses import dataclass
+
+import pytest
+from typed_json_dataclass import MappingMode, TypedJsonMixin, ValidationLevel
+from typed_json_dataclass.streaming import (
+    aiter_chunks,
+    aiter_line_batches,
+)
+
+
+@dataclass
+class Request(TypedJsonMixin):
+    request_id: int
+    request_path: str = '/'
+
+
+REQUESTS = [Request(i, f'/{i}') for i in range(20)]
+
+
+async def chunks_of(document, size):
+    for i in range(0, len(document), size):
+        yield document[i:i + size]
+
+
+async def stream_of(document):
+    reader = asyncio.StreamReader()
+    reader.feed_data(document)
+    reader.feed_eof()
+    return reader
+
+
+async def collect(async_iterator):
+    return [element async for element in async_iterator]
+
+
+def jsonl_document():
+    return ''.join(request.to_json() + '\n' for request in REQUESTS)
+
+
+def array_document():
+    return json.dumps([request.to_dict() for request in REQUESTS])
+
+
+@pytest.mark.parametrize('size', [1, 7, 10000])
+def test_that_json_lines_are_decoded_from_async_iterables(size):
+    document = jsonl_document()
+    assert asyncio.run(collect(Request.aiter_jsonl(
+        chunks_of(document, size)))) == REQUESTS
+    assert asyncio.run(collect(Request.aiter_jsonl(
+        chunks_of(document.encode('utf-8'), size)))) == REQUESTS
+
+
+def test_that_json_lines_are_decoded_from_stream_readers():
+    async def decode():
+        reader = await stream_of(jsonl_document().encode('utf-8'))
+        return await collect(Request.aiter_jsonl(reader, chunk_size=16))
+    assert asyncio.run(decode()) == REQUESTS
+
+
+def test_that_blank_lines_and_missing_final_newlines_are_handled():
+    document = '\n{"request_id": 1}\r\n\n{"request_id": 2}'
+    requests = asyncio.run(collect(Request.aiter_jsonl(
+        chunks_of(document, 5))))
+    assert requests == [Request(1), Request(2)]
+
+
+@pytest.mark.parametrize('size', [1, 7, 10000])
+def test_that_json_arrays_are_decoded_from_async_iterables(size):
+    document = array_document()
+    assert asyncio.run(collect(Request.aiter_json_array(
+        chunks_of(document, size)))) == REQUESTS
+
+
+def test_that_json_arrays_are_decoded_from_stream_readers():
+    async def decode():
+        reader = await stream_of(array_document().encode('utf-8'))
+        return await collect(Request.aiter_json_array(reader, chunk_size=16))
+    assert asyncio.run(decode()) == REQUESTS
+
+
+def test_that_options_are_applied():
+    document = '[{"requestId": "a"}]'
+    requests = asyncio.run(collect(Request.aiter_json_array(
+        chunks_of(document, 4), mapping_mode=MappingMode.SnakeCase,
+        validation_level=ValidationLevel.Trusted)))
+    assert requests[0].request_id == 'a'
+
+    with pytest.raises(TypeError):
+        asyncio.run(collect(Request.aiter_jsonl(
+            chunks_of('{"request_id": "a"}', 4))))
+
+
+def test_that_invalid_documents_raise():
+    document = '[{"request_id": 1}'
+    with pytest.raises(json.JSONDecodeError):
+        asyncio.run(collect(Request.aiter_json_array(chunks_of(document, 2))))
+
+
+def test_that_control_is_given_back_between_chunks():
+    ticks = []
+    decoded = []
+
+    async def tick():
+        while True:
+            ticks.append(len(decoded))
+            await asyncio.sleep(0)
+
+    async def decode():
+        ticker = asyncio.ensure_future(tick())
+        async for request in Request.aiter_jsonl(
+                chunks_of(jsonl_document(), 100)):
+            decoded.append(request)
+        ticker.cancel()
+
+    asyncio.run(decode())
+    assert len(decoded) == 20
+    # The ticker ran while the requests were decoded, not only afterwards
+    assert any(0 < count < 20 for count in ticks)
+
+
+def test_that_chunks_are_read_until_the_end():
+    async def read_all():
+        reader = await stream_of(b'abcde')
+        return await collect(aiter_chunks(reader, 2))
+    assert asyncio.run(read_all()) == [b'ab', b'cd', b'e']
+
+
+def test_that_lines_are_batched_per_chunk():
+    batches = asyncio.run(collect(aiter_line_batches(chunks_of('a\nb\nc', 3))))
+    assert batches == [['a'], ['b'], ['c']]
@@ -0,0 +1,193 @@
+import io
+import json
+import sys
+import types
+from dataclasses import dataclass
+from typing import Dict
+
+import pytest
+from typed_json_dataclass import (
+    JsonBackend,
+    TypedJsonMixin,
+    get_backend,
+    register_backend,
+    set_default_backend,
+)
+from typed_json_dataclass import backends
+
+
+@dataclass
+class Reading(TypedJsonMixin):
+    sensor: str
+    value: float
+
+
+@dataclass
+class CompactReading(TypedJsonMixin, json_backend='compact'):
+    sensor: str
+
+
+COMPACT = JsonBackend(
+    'compact',
+    json.loads,
+    lambda obj: json.dumps(obj, separators=(',', ':')),
+    lambda obj: json.dumps(obj, separators=(',', ':')).encode('utf-8'),
+)
+
+
+@dataclass
+class Histogram(TypedJsonMixin):
+    counts: Dict[int, int]
+    edges: Dict[float, str] = None
+
+
+def check_keys(obj):
+    """Reject keys that are not str, like orjson and rapidjson do"""
+    if isinstance(obj, list):
+        values = obj
+    elif isinstance(obj, dict):
+        if not all(isinstance(key, str) for key in obj):
+            raise TypeError('Dict key must be str')
+        values = obj.values()
+    else:
+        return
+    for value in values:
+        check_keys(value)
+
+
+def fake_module(name):
+    module = types.ModuleType(name)
+    module.loads = json.loads
+    if name == 'orjson':
+        module.OPT_NON_STR_KEYS = 4
+
+        def dumps(obj, option=0):
+            if not option & module.OPT_NON_STR_KEYS:
+                check_keys(obj)
+            return json.dumps(obj).encode('utf-8')
+    elif name == 'rapidjson':
+        module.MM_COERCE_KEYS_TO_STRINGS = 8
+
+        def dumps(obj, mapping_mode=0):
+            if not mapping_mode & module.MM_COERCE_KEYS_TO_STRINGS:
+                check_keys(obj)
+            return json.dumps(obj)
+    else:
+        dumps = json.dumps
+    module.dumps = dumps
+    return module
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(backends, '_backends', {})
+    monkeypatch.setattr(backends, '_default_name', 'json')
+    register_backend(COMPACT)
+
+
+def test_that_the_stdlib_is_the_default():
+    assert get_backend().name == 'json'
+    assert Reading('a', 1.5).to_json() == '{"sensor": "a", "value": 1.5}'
+    assert get_backend() is get_backend('json')
+
+
+def test_that_classes_can_select_a_backend():
+    assert CompactReading('a').to_json() == '{"sensor":"a"}'
+    assert CompactReading('a').to_json_bytes() == b'{"sensor":"a"}'
+    assert CompactReading.from_json(b'{"sensor": "a"}') == CompactReading('a')
+
+
+def test_that_the_default_backend_can_be_changed():
+    set_default_backend('compact')
+    assert Reading('a', 1.5).to_json() == '{"sensor":"a","value":1.5}'
+    assert Reading.from_json_array('[{"sensor":"a","value":1.5}]') == [
+        Reading('a', 1.5)
+    ]
+    assert Reading.from_json_lines(b'{"sensor":"a","value":1.5}\n') == [
+        Reading('a', 1.5)
+    ]
+
+
+def test_that_dump_jsonl_uses_the_bytes_of_the_backend():
+    text = io.StringIO()
+    binary = io.BytesIO()
+    CompactReading.dump_jsonl([CompactReading('a')], text)
+    CompactReading.dump_jsonl([CompactReading('a')], binary)
+    assert text.getvalue() == '{"sensor":"a"}\n'
+    assert binary.getvalue() == b'{"sensor":"a"}\n'
+
+
+def test_that_stdlib_bytes_are_utf8():
+    assert Reading('é', 1.0).to_json_bytes() == \
+        b'{"sensor": "\\u00e9", "value": 1.0}'
+
+
+def test_that_unknown_backends_raise():
+    with pytest.raises(ValueError) as e_info:
+        set_default_backend('unknown')
+    assert str(e_info.value) == "Unknown json backend 'unknown'"
+    assert get_backend().name == 'json'
+
+
+@pytest.mark.parametrize('name', ['orjson', 'rapidjson', 'ujson'])
+def test_that_optional_backends_are_imported_on_use(monkeypatch, name):
+    monkeypatch.setitem(sys.modules, name, fake_module(name))
+    backend = get_backend(name)
+    assert backend.name == name
+    assert backend.loads(b'[1]') == [1]
+    assert backend.dumps([1]) == '[1]'
+    assert backend.dumps_bytes([1]) == b'[1]'
+
+
+def test_that_missing_optional_backends_raise(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'ujson', None)
+    with pytest.raises(ImportError):
+        get_backend('ujson')
+
+
+@pytest.mark.parametrize('installed, expected', [
+    (['orjson', 'rapidjson', 'ujson'], 'orjson'),
+    (['rapidjson', 'ujson'], 'rapidjson'),
+    (['ujson'], 'ujson'),
+    ([], 'json'),
+])
+def test_that_auto_picks_the_fastest_installed_backend(monkeypatch,
+                                                       installed, expected):
+    for name in ['orjson', 'rapidjson', 'ujson']:
+        module = fake_module(name) if name in installed else None
+        monkeypatch.setitem(sys.modules, name, module)
+    set_default_backend('auto')
+    assert get_backend().name == expected
+    assert Reading.from_json('{"sensor": "a", "value": 1.0}') == \
+        Reading('a', 1.0)
+
+
+def test_with_the_real_orjson():
+    pytest.importorskip('orjson')
+    backend = get_backend('orjson')
+    assert backend.dumps({'a': [1, 'é']}) == '{"a":[1,"é"]}'
+
+
+def check_number_keys(name):
+    set_default_backend(name)
+    histogram = Histogram({1: 2, 3: 4}, {0.5: 'a'})
+    raw_json = histogram.to_json()
+    assert json.loads(raw_json) == {'counts': {'1': 2, '3': 4},
+                                    'edges': {'0.5': 'a'}}
+    assert histogram.to_json_bytes() == raw_json.encode('utf-8')
+    assert Histogram.from_json(raw_json) == histogram
+    assert Histogram.to_json_many([histogram], lines=True) == raw_json + '\n'
+
+
+@pytest.mark.parametrize('name', ['json', 'orjson', 'rapidjson', 'ujson'])
+def test_that_every_backend_encodes_number_keys(monkeypatch, name):
+    if name != 'json':
+        monkeypatch.setitem(sys.modules, name, fake_module(name))
+    check_number_keys(name)
+
+
+@pytest.mark.parametrize('name', ['orjson', 'rapidjson', 'ujson'])
+def test_that_real_backends_encode_number_keys(name):
+    pytest.importorskip(name)
+    check_number_keys(name)
+
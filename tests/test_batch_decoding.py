@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+
+import pytest
+from typed_json_dataclass import TypedJsonMixin, MappingMode
+
+
+@dataclass
+class Event(TypedJsonMixin):
+    event_id: int
+    event_name: str = None
+
+
+@dataclass
+class GeneratedEvent(TypedJsonMixin, codegen=True):
+    event_id: int
+
+
+def test_from_dicts_returns_a_list_of_instances():
+    assert Event.from_dicts([{'event_id': 1}, {'event_id': 2}]) == [
+        Event(1), Event(2)
+    ]
+
+
+def test_from_dicts_with_mapping_mode():
+    assert Event.from_dicts(
+        [{'eventId': 1, 'eventName': 'start'}],
+        mapping_mode=MappingMode.SnakeCase) == [Event(1, 'start')]
+
+
+def test_from_dicts_with_generated_decoder():
+    assert GeneratedEvent.from_dicts([{'event_id': 1}]) == [GeneratedEvent(1)]
+
+
+def test_from_dicts_as_iterator_is_consumed_lazily():
+    instances = Event.from_dicts(iter([{'event_id': 1}, {'event_id': 'x'}]),
+                                 as_iterator=True)
+    assert next(instances) == Event(1)
+    with pytest.raises(TypeError):
+        next(instances)
+
+
+def test_from_dicts_checks_the_mapping_mode_eagerly():
+    with pytest.raises(ValueError) as e_info:
+        Event.from_dicts([], mapping_mode='Invalid', as_iterator=True)
+    assert str(e_info.value) == 'Invalid mapping mode'
+
+
+def test_from_json_array():
+    assert Event.from_json_array('[{"event_id": 1}, {"event_id": 2}]') == [
+        Event(1), Event(2)
+    ]
+
+
+def test_from_json_array_requires_an_array():
+    with pytest.raises(TypeError) as e_info:
+        Event.from_json_array('{"event_id": 1}')
+    assert ("Expected a json array, but found a <class 'dict'> "
+            'instead') == str(e_info.value)
+
+
+def test_from_json_lines_skips_blank_lines():
+    raw_lines = '{"event_id": 1}\n\n{"eventId": 2}\n'
+    assert Event.from_json_lines(raw_lines,
+                                 mapping_mode=MappingMode.SnakeCase) == [
+        Event(1), Event(2)
+    ]
+
+
+def test_from_json_lines_accepts_an_iterable_of_lines():
+    raw_lines = [b'{"event_id": 1}\n', b'{"event_id": 2}\n']
+    instances = Event.from_json_lines(raw_lines, as_iterator=True)
+    assert list(instances) == [Event(1), Event(2)]
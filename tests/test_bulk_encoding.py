@@ -0,0 +1,143 @@
+import io
+import json
+from dataclasses import dataclass
+
+import pytest
+from typed_json_dataclass import (
+    JsonBackend,
+    MappingMode,
+    TypedJsonMixin,
+    register_backend,
+)
+from typed_json_dataclass.bulk import iter_encoded
+
+
+@dataclass
+class Record(TypedJsonMixin):
+    record_id: int
+    record_name: str = None
+
+
+@dataclass
+class NamedRecord(Record):
+    label: str = 'x'
+
+
+@dataclass
+class CompactRecord(TypedJsonMixin, json_backend='compact'):
+    record_id: int
+
+
+register_backend(JsonBackend(
+    'compact',
+    json.loads,
+    lambda obj: json.dumps(obj, separators=(',', ':')),
+    lambda obj: json.dumps(obj, separators=(',', ':')).encode('utf-8'),
+))
+
+RECORDS = [Record(i, f'r{i}' if i % 2 else None) for i in range(10)]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 10, 100])
+@pytest.mark.parametrize('workers', [None, 3])
+def test_that_arrays_match_dumping_all_dicts_at_once(chunk_size, workers):
+    expected = json.dumps([record.to_dict() for record in RECORDS])
+    assert Record.to_json_many(RECORDS, chunk_size=chunk_size,
+                               workers=workers) == expected
+
+
+@pytest.mark.parametrize('workers', [None, 2])
+def test_that_json_lines_have_one_object_per_line(workers):
+    expected = ''.join(record.to_json() + '\n' for record in RECORDS)
+    assert Record.to_json_many(RECORDS, lines=True, chunk_size=4,
+                               workers=workers) == expected
+
+
+def test_that_empty_inputs_are_encoded():
+    assert Record.to_json_many([]) == '[]'
+    assert Record.to_json_many([], lines=True) == ''
+
+
+def test_that_options_are_applied():
+    records = [Record(1), Record(2, 'b')]
+    assert json.loads(Record.to_json_many(
+        records, keep_none=True, mapping_mode=MappingMode.CamelCase)) == [
+        {'recordId': 1, 'recordName': None},
+        {'recordId': 2, 'recordName': 'b'},
+    ]
+
+    with pytest.raises(ValueError):
+        Record.to_json_many(records, mapping_mode='Invalid')
+    with pytest.raises(ValueError, match='chunk_size'):
+        Record.to_json_many(records, chunk_size=0)
+
+
+def test_that_bytes_can_be_produced():
+    assert Record.to_json_many([Record(1)], as_bytes=True) == \
+        b'[{"record_id": 1}]'
+    assert Record.to_json_many([Record(1)], as_bytes=True, lines=True) == \
+        b'{"record_id": 1}\n'
+
+
+def test_that_the_separator_of_the_backend_is_used():
+    records = [CompactRecord(1), CompactRecord(2)]
+    assert CompactRecord.to_json_many(records, chunk_size=1) == \
+        '[{"record_id":1},{"record_id":2}]'
+
+
+def test_that_subclasses_keep_their_own_fields():
+    assert json.loads(Record.to_json_many([Record(1), NamedRecord(2)])) == [
+        {'record_id': 1},
+        {'record_id': 2, 'label': 'x'},
+    ]
+
+
+@pytest.mark.parametrize('lines', [False, True])
+def test_that_files_are_written_in_chunks(lines):
+    writes = []
+    fileobj = io.StringIO()
+    fileobj.write = writes.append
+    assert Record.dump_json_many(RECORDS, fileobj, lines=lines,
+                                 chunk_size=4) == 10
+
+    expected = Record.to_json_many(RECORDS, lines=lines)
+    assert ''.join(writes) == expected
+    assert len(writes) == (3 if lines else 5)
+
+
+def test_that_binary_files_get_bytes():
+    fileobj = io.BytesIO()
+    assert Record.dump_json_many(RECORDS, fileobj, workers=2) == 10
+    assert Record.from_json_array(fileobj.getvalue()) == RECORDS
+
+
+def test_that_parts_are_produced_lazily():
+    def records():
+        yield Record(1)
+        raise RuntimeError('Stop')
+
+    parts = iter_encoded(records(), dumps=json.dumps, keep_none=False,
+                         format_method=None, lines=False, chunk_size=1)
+    assert next(parts) == '['
+    assert next(parts) == '{"record_id": 1}'
+    with pytest.raises(RuntimeError):
+        next(parts)
+
+
+def test_that_workers_only_read_a_few_chunks_ahead():
+    read = []
+
+    def records():
+        for i in range(100000):
+            read.append(i)
+            yield Record(i)
+
+    parts = iter_encoded(records(), dumps=json.dumps, keep_none=False,
+                         format_method=None, lines=True, chunk_size=10,
+                         workers=2)
+    assert next(parts) == ''.join(Record(i).to_json() + '\n'
+                                  for i in range(10))
+    # Two chunks per worker are in flight
+    assert len(read) == 40
+    parts.close()
+    assert len(read) == 40
@@ -0,0 +1,36 @@
+from dataclasses import InitVar, dataclass
+
+from typed_json_dataclass import TypedJsonMixin, invalidate_caches
+
+
+@dataclass
+class Mutated(TypedJsonMixin):
+    name: str
+
+
+@dataclass
+class MutatedParent(TypedJsonMixin):
+    child: Mutated
+
+
+@dataclass
+class WithInitVar:
+    init: InitVar[str]
+
+
+def test_that_caches_are_kept_until_invalidated(monkeypatch):
+    assert not MutatedParent._contains_non_default_init_vars()
+    assert MutatedParent({'name': 'a'}).to_dict() == {'child': {'name': 'a'}}
+
+    monkeypatch.setattr(Mutated, '__dataclass_fields__',
+                        WithInitVar.__dataclass_fields__)
+    assert not MutatedParent._contains_non_default_init_vars()
+
+    invalidate_caches()
+    assert MutatedParent._typed_json_cache == {}
+    assert Mutated._typed_json_cache == {}
+    assert MutatedParent._contains_non_default_init_vars()
+
+    monkeypatch.undo()
+    invalidate_caches()
+    assert not MutatedParent._contains_non_default_init_vars()
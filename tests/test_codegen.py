@@ -0,0 +1,164 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pytest
+from typed_json_dataclass import TypedJsonMixin, MappingMode
+
+
+@dataclass
+class Label(TypedJsonMixin, codegen=True):
+    label_name: str
+
+
+@dataclass
+class PlainLabel(TypedJsonMixin):
+    label_name: str
+
+
+@dataclass
+class Paragraph(TypedJsonMixin, codegen=True):
+    paragraph_text: str
+    main_label: Label = None
+    plain_label: PlainLabel = None
+    labels: List[Label] = field(default_factory=list)
+    word_count: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class FrozenLabel(TypedJsonMixin, codegen=True):
+    label_name: str
+
+
+@dataclass
+class CustomPostInit(TypedJsonMixin, codegen=True):
+    label_name: str
+
+    def __post_init__(self):
+        self.label_name = self.label_name.upper()
+        super().__post_init__()
+
+
+def test_that_codegen_is_opt_in():
+    assert not PlainLabel._codegen
+    assert Label._codegen
+
+
+def test_that_generated_decoders_are_cached_per_mapping_mode():
+    decoder = Label._compiled_from_dict(MappingMode.NoMap)
+    assert decoder is Label._compiled_from_dict(MappingMode.NoMap)
+    assert decoder is not Label._compiled_from_dict(MappingMode.SnakeCase)
+
+
+def test_that_generated_decoder_builds_instances():
+    actual = Paragraph.from_dict({
+        'paragraph_text': 'text',
+        'main_label': {'label_name': 'main'},
+        'plain_label': {'label_name': 'plain'},
+        'labels': [{'label_name': 'a'}, Label('b')],
+        'word_count': 1,
+    })
+    assert actual == Paragraph('text', Label('main'), PlainLabel('plain'),
+                               [Label('a'), Label('b')], 1)
+
+
+def test_that_generated_decoder_applies_defaults():
+    first = Paragraph.from_dict({'paragraph_text': 'text'})
+    second = Paragraph.from_dict({'paragraph_text': 'text'})
+    assert first == Paragraph('text')
+    assert first.labels is not second.labels
+
+
+def test_that_generated_decoder_accepts_subclasses_of_primitives():
+    assert Paragraph.from_dict({'paragraph_text': 'text',
+                                'word_count': True}).word_count is True
+
+
+def test_that_generated_decoder_handles_other_mappings():
+    raw_dict = OrderedDict([('label_name', 'a')])
+    assert Label.from_dict(raw_dict) == Label('a')
+
+
+def test_that_generated_decoder_raises_on_wrong_types():
+    with pytest.raises(TypeError) as e_info:
+        Paragraph.from_dict({'paragraph_text': 0})
+    assert ("Paragraph.paragraph_text is expected to be <class 'str'>, but "
+            "value 0 with type <class 'int'> was found "
+            'instead') == str(e_info.value)
+
+
+def test_that_generated_decoder_raises_on_missing_keys():
+    with pytest.raises(TypeError) as e_info:
+        Paragraph.from_dict({})
+    assert 'paragraph_text' in str(e_info.value)
+
+
+def test_that_generated_decoder_raises_on_unexpected_keys():
+    with pytest.raises(TypeError) as e_info:
+        Paragraph.from_dict({'paragraph_text': 'text', 'other': 0})
+    assert "unexpected keyword argument 'other'" in str(e_info.value)
+
+
+def test_that_generated_decoder_raises_on_nested_errors():
+    with pytest.raises(TypeError) as e_info:
+        Paragraph.from_dict({'paragraph_text': 'text',
+                             'labels': [{'label_name': 0}]})
+    assert ("Label.label_name is expected to be <class 'str'>, but value 0 "
+            "with type <class 'int'> was found instead") == str(e_info.value)
+
+
+def test_that_generated_decoder_renames_keys():
+    actual = Paragraph.from_dict({
+        'paragraphText': 'text',
+        'mainLabel': {'labelName': 'main'},
+        'plainLabel': {'labelName': 'plain'},
+        'WordCount': 2,
+    }, mapping_mode=MappingMode.SnakeCase)
+    assert actual == Paragraph('text', Label('main'), PlainLabel('plain'),
+                               word_count=2)
+
+
+def test_that_generated_decoder_renames_with_already_built_children():
+    actual = Paragraph.from_dict({'paragraphText': 'text',
+                                  'mainLabel': Label('main')},
+                                 mapping_mode=MappingMode.SnakeCase)
+    assert actual == Paragraph('text', Label('main'))
+
+
+def test_that_generated_decoder_reports_renamed_nested_dicts():
+    with pytest.raises(TypeError) as e_info:
+        Paragraph.from_dict({'paragraphText': 'text',
+                             'mainLabel': {'labelName': 0}},
+                            mapping_mode=MappingMode.SnakeCase)
+    assert ("Paragraph.main_label is expected to be <class "
+            "'test_codegen.Label'>, but value {'label_name': 0} is a dict "
+            'with unexpected keys') == str(e_info.value)
+
+
+def test_that_generated_decoder_supports_frozen_dataclasses():
+    assert FrozenLabel.from_dict({'label_name': 'a'}) == FrozenLabel('a')
+    assert FrozenLabel.from_dict(
+        {'labelName': 'a'},
+        mapping_mode=MappingMode.SnakeCase) == FrozenLabel('a')
+
+
+def test_that_custom_post_init_is_still_called():
+    assert not CustomPostInit._can_bypass_init()
+    assert CustomPostInit.from_dict({'label_name': 'a'}).label_name == 'A'
+    assert CustomPostInit.from_dict(
+        {'labelName': 'a'},
+        mapping_mode=MappingMode.SnakeCase).label_name == 'A'
+
+
+@dataclass
+class CamelCaseLabel(TypedJsonMixin, codegen=True):
+    labelName: str
+
+
+def test_that_generated_decoder_renames_to_camel_case():
+    assert CamelCaseLabel.from_dict(
+        {'label_name': 'a'},
+        mapping_mode=MappingMode.CamelCase) == CamelCaseLabel('a')
+    with pytest.raises(TypeError):
+        Label.from_dict({'label_name': 'a'},
+                        mapping_mode=MappingMode.CamelCase)
@@ -0,0 +1,308 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, \
+    Tuple, TypeVar, Union
+
+import pytest
+from typed_json_dataclass import MappingMode, TypedJsonMixin, ValidationLevel
+from typed_json_dataclass.containers import dict_depth, is_container
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class Tag(TypedJsonMixin):
+    name: str
+
+
+@dataclass
+class Account(TypedJsonMixin):
+    account_id: int
+    balances: Dict[str, float] = None
+    owners: Dict[str, Tag] = None
+    by_year: Dict[int, List[int]] = None
+    point: Tuple[int, int] = None
+    history: Tuple[float, ...] = None
+    tags: Set[str] = None
+    frozen_tags: FrozenSet[Tag] = None
+
+
+@dataclass
+class Nested(TypedJsonMixin):
+    matrix: List[Dict[str, int]] = None
+    optional_values: Dict[str, Optional[int]] = None
+    mixed: Tuple[Union[int, Tag], ...] = None
+    anything: Dict[str, Any] = None
+    sequences: Dict[str, Sequence[int]] = None
+    empty: Tuple[()] = None
+    children: Dict[str, 'Nested'] = None
+    others: Dict[str, 'Later'] = None
+    weights: Dict[float, str] = None
+    later_set: FrozenSet['Later'] = None
+
+
+@dataclass
+class Later(TypedJsonMixin):
+    value: int
+
+
+@dataclass
+class Unions(TypedJsonMixin):
+    counts: Optional[Dict[str, int]] = None
+    pair: Union[Tuple[int, int], str, None] = None
+    untyped: Optional[Dict] = None
+
+
+@dataclass
+class TrustedAccount(TypedJsonMixin,
+                     validation_level=ValidationLevel.Trusted):
+    balances: Dict[str, float] = None
+    owners: Dict[str, Tag] = None
+    point: Tuple[int, int] = None
+    pair: Optional[Tuple[int, int]] = None
+    tags: Set[str] = None
+
+
+@dataclass
+class Invalid(TypedJsonMixin):
+    native: Dict[str, dict] = None
+    untyped: Dict = None
+    generic: Dict[str, T] = None
+    untyped_tuple: Tuple = None
+
+
+@dataclass
+class Lazy(TypedJsonMixin, lazy=True):
+    tag: Tag = None
+
+
+@dataclass
+class LazyHolder(TypedJsonMixin):
+    by_name: Dict[str, Lazy] = None
+    pair: Tuple[Lazy, ...] = None
+
+
+@dataclass
+class KeyedChild(TypedJsonMixin):
+    child_name: str
+
+
+@dataclass
+class Keyed(TypedJsonMixin):
+    by_name: Dict[str, KeyedChild] = None
+    grid: Optional[Dict[str, Dict[str, int]]] = None
+    subtrees: Dict[str, 'Keyed'] = None
+
+
+@dataclass
+class GeneratedKeyed(TypedJsonMixin, codegen=True):
+    by_name: Dict[str, KeyedChild] = None
+    grid: Optional[Dict[str, Dict[str, int]]] = None
+    subtrees: Dict[str, 'GeneratedKeyed'] = None
+
+
+def test_that_matching_values_are_kept_as_they_are():
+    balances = {'EUR': 1.5}
+    account = Account(1, balances, tags={'a'})
+    assert account.balances is balances
+    assert account.tags == {'a'}
+
+
+def test_that_json_values_are_converted():
+    account = Account.from_dict({
+        'account_id': 1,
+        'owners': {'main': {'name': 'Ann'}},
+        'by_year': {'2020': [1, 2]},
+        'point': [1, 2],
+        'history': [0.5, 1.5],
+        'tags': ['a', 'b', 'a'],
+        'frozen_tags': [{'name': 'x'}, {'name': 'x'}],
+    })
+    assert account.owners == {'main': Tag('Ann')}
+    assert account.by_year == {2020: [1, 2]}
+    assert account.point == (1, 2)
+    assert account.history == (0.5, 1.5)
+    assert account.tags == {'a', 'b'}
+    assert account.frozen_tags == frozenset({Tag('x')})
+
+
+def test_that_values_round_trip_through_json():
+    account = Account(1, {'eur': 1.5}, {'main': Tag('Ann')}, {2020: [1]},
+                      (1, 2), (0.5,), {'a'}, frozenset({Tag('x')}))
+    assert Account.from_json(account.to_json()) == account
+    assert json.loads(account.to_json())['frozen_tags'] == [{'name': 'x'}]
+    assert Account.from_json(
+        account.to_json(mapping_mode=MappingMode.CamelCase),
+        mapping_mode=MappingMode.SnakeCase) == account
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'balances': {'EUR': '1'}},
+    {'balances': {1: 1.0}},
+    {'balances': [1.0]},
+    {'owners': {'main': 'Ann'}},
+    {'owners': ['Ann']},
+    {'by_year': {'year': [1]}},
+    {'by_year': {(1,): [1]}},
+    {'point': [1, 2, 3]},
+    {'point': (1, 'a')},
+    {'history': 'abc'},
+    {'history': [1]},
+    {'tags': [['a']]},
+    {'tags': [1]},
+])
+def test_that_mismatches_raise(kwargs):
+    with pytest.raises(TypeError) as e_info:
+        Account(1, **kwargs)
+    field_name, value = next(iter(kwargs.items()))
+    assert str(e_info.value).startswith(
+        f'Account.{field_name} is {value} which does not match')
+
+
+def test_that_errors_give_the_reason():
+    with pytest.raises(TypeError) as e_info:
+        Account(1, owners={'main': {'name': 1}})
+    assert str(e_info.value) == (
+        "Account.owners is {'main': {'name': 1}} which does not match "
+        'typing.Dict[str, test_containers.Tag]: Tag.name is expected to '
+        "be <class 'str'>, but value 1 with type <class 'int'> was found "
+        'instead')
+
+    with pytest.raises(TypeError, match="unhashable type: 'Later'"):
+        Nested(later_set=[Later(1)])
+
+
+def test_that_nested_type_hints_are_checked():
+    nested = Nested.from_dict({
+        'matrix': [{'a': 1}, {}],
+        'optional_values': {'a': None, 'b': 1},
+        'mixed': [1, {'name': 'x'}],
+        'anything': {'a': [object()]},
+        'sequences': {'a': [1]},
+        'empty': [],
+        'children': {'a': {'children': {}}},
+        'others': {'a': Later(1)},
+        'weights': {'0.5': 'half'},
+    })
+    assert nested.matrix == [{'a': 1}, {}]
+    assert nested.mixed == (1, Tag('x'))
+    assert nested.empty == ()
+    assert nested.children == {'a': Nested(children={})}
+    assert nested.weights == {0.5: 'half'}
+
+    for kwargs in [{'matrix': [{'a': 'b'}]}, {'matrix': {}},
+                   {'optional_values': {'a': 'b'}},
+                   {'mixed': ['a']}, {'mixed': [{'tag': 'x'}]},
+                   {'mixed': 'ab'},
+                   {'sequences': {'a': 1}}, {'empty': [1]},
+                   {'others': {'a': 1}}, {'weights': {'half': 'a'}}]:
+        with pytest.raises(TypeError, match='which does not match'):
+            Nested(**kwargs)
+
+
+def test_that_union_members_are_converted():
+    assert Unions({'a': 1}, [1, 2]).pair == (1, 2)
+    assert Unions(pair='a').pair == 'a'
+    assert Unions(untyped={'a': 1}).untyped == {'a': 1}
+    with pytest.raises(TypeError, match='Unions.counts was defined to be'):
+        Unions({'a': 'b'})
+    with pytest.raises(TypeError, match='Unions.pair was defined to be'):
+        Unions(pair=[1])
+
+
+def test_that_the_trusted_level_only_converts():
+    account = TrustedAccount({'EUR': 'a'}, {'main': {'name': 'Ann'}},
+                             [1, 'a'], [1, 2], ['a'])
+    assert account == TrustedAccount({'EUR': 'a'}, {'main': Tag('Ann')},
+                                     (1, 'a'), (1, 2), {'a'})
+    assert TrustedAccount(balances=[1], point=1).point == 1
+    assert TrustedAccount(tags=[['a']]).tags == [['a']]
+
+
+def test_that_unsupported_type_hints_raise():
+    with pytest.raises(TypeError) as e_info:
+        Invalid(native={})
+    assert str(e_info.value) == (
+        'Invalid.native was detected to use a native Python collection in '
+        'its type definition. We should only use typing collections like '
+        'typing.Dict[] for these')
+
+    for kwargs in [{'untyped': {}}, {'generic': {}},
+                   {'untyped_tuple': ()}]:
+        with pytest.raises(TypeError, match='is missing information'):
+            Invalid(**kwargs)
+
+
+def test_that_nested_lazy_instances_are_materialized():
+    holder = LazyHolder.from_dict({'by_name': {'a': {'tag': {'name': 1}}},
+                                   'pair': [{'tag': {'name': 2}}]})
+    with pytest.raises(TypeError, match='Lazy.tag'):
+        holder.materialize()
+    holder.by_name['a'].tag = Tag('a')
+    with pytest.raises(TypeError, match='Lazy.tag'):
+        holder.materialize()
+
+
+@pytest.mark.parametrize('cls', [Keyed, GeneratedKeyed])
+@pytest.mark.parametrize('mapping_mode', [MappingMode.SnakeCase,
+                                          MappingMode.CamelCase])
+def test_that_typed_dict_keys_are_not_renamed(cls, mapping_mode):
+    keyed = cls(by_name={'HelloWorld': KeyedChild('a'),
+                         'snake_key': KeyedChild('b')},
+                grid={'ABC': {'SomeKey': 1, 'other_key': 2}},
+                subtrees={'LeftSide': cls(grid={'XY': {'Z': 3}})})
+    snake = mapping_mode is MappingMode.SnakeCase
+    renamed = 'child_name' if snake else 'childName'
+    raw = keyed.to_dict(mapping_mode=mapping_mode)
+    assert raw == {
+        'by_name' if snake else 'byName': {
+            'HelloWorld': {renamed: 'a'},
+            'snake_key': {renamed: 'b'},
+        },
+        'grid': {'ABC': {'SomeKey': 1, 'other_key': 2}},
+        'subtrees': {'LeftSide': {
+            'by_name' if snake else 'byName': None,
+            'grid': {'XY': {'Z': 3}},
+            'subtrees': None,
+        }},
+    }
+    assert cls.from_dict(raw, mapping_mode=MappingMode.SnakeCase) == keyed
+    assert keyed.to_mapping_view(mapping_mode=mapping_mode) == raw
+    assert json.loads(''.join(keyed.iter_json(
+        mapping_mode=mapping_mode))) == raw
+    assert cls.from_json(keyed.to_json(mapping_mode=mapping_mode),
+                         mapping_mode=MappingMode.SnakeCase) == keyed
+
+
+def test_that_untyped_dict_keys_are_renamed():
+    raw = {'grid': {'SomeKey': {'InnerKey': 1}}}
+    unions = Unions.from_dict({'untyped': raw},
+                              mapping_mode=MappingMode.SnakeCase)
+    assert unions.untyped == {'grid': {'some_key': {'inner_key': 1}}}
+    view = unions.to_mapping_view(mapping_mode=MappingMode.CamelCase)
+    grid = view['untyped']['grid']
+    assert grid['someKey'] == {'innerKey': 1}
+    assert list(grid['someKey']) == ['innerKey']
+
+
+@pytest.mark.parametrize('field_type,expected', [
+    (Dict[str, int], 1),
+    (Optional[Dict[str, Dict[str, int]]], 2),
+    (Dict[str, List[Dict[str, int]]], 1),
+    (List[Dict[str, int]], 0),
+    (int, 0),
+])
+def test_dict_depth(field_type, expected):
+    assert dict_depth(field_type) == expected
+
+
+@pytest.mark.parametrize('field_type,expected', [
+    (Dict[str, int], True),
+    (List[List[Tuple[int, ...]]], True),
+    (FrozenSet[int], True),
+    (List[int], False),
+    (List, False),
+    (Optional[Dict[str, int]], False),
+])
+def test_is_container(field_type, expected):
+    assert is_container(field_type) is expected
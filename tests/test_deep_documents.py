@@ -0,0 +1,189 @@
+import sys
+from dataclasses import dataclass
+from typing import List, Optional, Union
+
+import pytest
+from typed_json_dataclass import MappingMode, TypedJsonMixin, ValidationLevel
+from typed_json_dataclass.utils import recursive_rename, to_snake
+
+# Deeper than the recursion limit, so any recursion per level would fail
+DEPTH = sys.getrecursionlimit() * 3
+
+
+@dataclass
+class Node(TypedJsonMixin):
+    node_value: int
+    next_node: 'Node' = None
+
+
+@dataclass
+class Tree(TypedJsonMixin):
+    children: List['Tree']
+
+
+@dataclass
+class Forest(TypedJsonMixin):
+    trees: List[Tree]
+    first: Tree = None
+
+
+@dataclass
+class Category(TypedJsonMixin, codegen=True):
+    category_id: int
+    parent: 'Category' = None
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+@dataclass
+class Item(TypedJsonMixin):
+    item_id: int
+
+
+@dataclass
+class Basket(TypedJsonMixin):
+    items: List[Item]
+    origin: Point = None
+    grid: List[List[int]] = None
+    slots: List[Optional[int]] = None
+    labels: List[Union[int, str]] = None
+    cells: List[List[Union[int, List[str]]]] = None
+
+
+@dataclass
+class TrustedBasket(TypedJsonMixin, validation_level=ValidationLevel.Trusted):
+    items: List[Item]
+
+
+def deep_dict(depth, key):
+    raw_dict = {}
+    for i in range(depth):
+        raw_dict = {key: raw_dict, 'nodeValue': i}
+    return raw_dict
+
+
+def test_that_deep_dicts_are_renamed():
+    renamed = recursive_rename(deep_dict(DEPTH, 'nextNode'), to_snake)
+    depth = 0
+    while renamed:
+        assert set(renamed) == {'next_node', 'node_value'}
+        renamed = renamed['next_node']
+        depth += 1
+    assert depth == DEPTH
+
+
+@pytest.mark.parametrize('mapping_mode', [MappingMode.NoMap,
+                                          MappingMode.SnakeCase])
+def test_that_deep_self_referencing_documents_are_decoded(mapping_mode):
+    key = 'next_node' if mapping_mode is MappingMode.NoMap else 'nextNode'
+    raw_dict = {'node_value': -1}
+    for i in range(DEPTH):
+        raw_dict = {key: raw_dict, 'node_value': i}
+
+    node = Node.from_dict(raw_dict, mapping_mode=mapping_mode)
+    for i in reversed(range(-1, DEPTH)):
+        assert isinstance(node, Node)
+        assert node.node_value == i
+        node = node.next_node
+    assert node is None
+
+
+def test_that_lists_of_self_references_are_decoded():
+    raw_dict = {'children': []}
+    for _ in range(DEPTH):
+        raw_dict = {'children': [{'children': []}, raw_dict]}
+
+    tree = Tree.from_dict(raw_dict)
+    for _ in range(DEPTH):
+        assert tree.children[0] == Tree([])
+        tree = tree.children[1]
+    assert tree == Tree([])
+
+
+def test_that_deep_documents_in_other_classes_are_decoded():
+    raw_dict = {'children': []}
+    for _ in range(DEPTH):
+        raw_dict = {'children': [raw_dict]}
+
+    forest = Forest.from_dict({'trees': [raw_dict], 'first': raw_dict})
+    tree = forest.first
+    for _ in range(DEPTH):
+        tree = tree.children[0]
+    assert tree == Tree([])
+    assert forest.trees[0] is not forest.first
+
+
+def test_that_generated_decoders_are_not_used_for_deep_documents():
+    raw_dict = {'parent': {'parent': {'category_id': 1}, 'category_id': 2},
+                'category_id': 3}
+    category = Category.from_dict(raw_dict)
+    assert category.parent.parent == Category(1)
+    assert Category.from_dict(raw_dict, mapping_mode=MappingMode.SnakeCase) \
+        == category
+
+
+def test_that_self_references_are_constructed_from_dicts():
+    assert Node(1, {'node_value': 2}).next_node == Node(2)
+    assert Tree([{'children': []}]).children == [Tree([])]
+    assert Tree.from_dict({'children': None}) == Tree(None)
+
+
+def test_that_invalid_self_references_raise():
+    with pytest.raises(TypeError) as e_info:
+        Node.from_dict({'node_value': 1, 'next_node': {'node_value': 'a'}})
+    assert str(e_info.value) == (
+        f"Node.next_node is expected to be {Node}, but value "
+        "{'node_value': 'a'} is a dict with unexpected keys")
+
+    raw_dict = {'node_value': 'a'}
+    for i in range(DEPTH):
+        raw_dict = {'next_node': raw_dict, 'node_value': i}
+    with pytest.raises(TypeError, match="Node.node_value is expected"):
+        Node.from_dict(raw_dict)
+
+
+def test_that_raw_documents_are_not_modified():
+    raw_dict = {'children': [{'children': [{'children': []}]}]}
+    tree = Tree.from_dict(raw_dict)
+    assert tree == Tree([Tree([Tree([])])])
+    assert raw_dict == {'children': [{'children': [{'children': []}]}]}
+
+
+def test_that_errors_match_direct_instantiation():
+    raw_dict = {'items': [{'item_id': 1}, {'item_id': 'a'}]}
+    with pytest.raises(TypeError) as direct_error:
+        Basket(**raw_dict)
+    with pytest.raises(TypeError) as decoded_error:
+        Basket.from_dict(raw_dict)
+    assert str(decoded_error.value) == str(direct_error.value)
+
+
+def test_that_direct_instantiation_still_constructs_nested_dicts():
+    assert Basket([{'item_id': 1}]).items == [Item(1)]
+    assert TrustedBasket([{'item_id': 1}]).items == [Item(1)]
+
+
+def test_that_nested_lists_are_checked_level_by_level():
+    assert Basket([], grid=[[1, 2], [3]]).grid == [[1, 2], [3]]
+    with pytest.raises(TypeError, match='does not match'):
+        Basket([], grid=[[1], 2])
+    with pytest.raises(TypeError, match='does not match'):
+        Basket([], grid=[[1], ['a']])
+
+
+def test_that_union_elements_are_not_unrolled_as_lists():
+    basket = Basket([], slots=[None, 1], labels=[1, 'a'],
+                    cells=[[1, ['a']], []])
+    assert basket.slots == [None, 1]
+    assert basket.labels == [1, 'a']
+    assert basket.cells == [[1, ['a']], []]
+    with pytest.raises(TypeError, match='Basket.slots is'):
+        Basket([], slots=['a'])
+    with pytest.raises(TypeError, match='Basket.labels is'):
+        Basket([], labels=[None])
+    with pytest.raises(TypeError, match='Basket.cells is'):
+        Basket([], cells=[[['a', 1]]])
@@ -0,0 +1,174 @@
+import pickle
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pytest
+from typed_json_dataclass import TypedJsonMixin, ValidationError
+
+
+class Expensive:
+    reprs = 0
+
+    def __repr__(self):
+        Expensive.reprs += 1
+        return 'Expensive()'
+
+
+@dataclass
+class Account(TypedJsonMixin):
+    account_id: int
+    owner: str
+    scores: List[int] = None
+
+
+@dataclass
+class Inner(TypedJsonMixin):
+    inner_id: int
+
+
+@dataclass
+class StrictAccount(TypedJsonMixin, collect_errors=True):
+    account_id: int
+    owner: str
+    scores: List[int] = None
+    inner: Inner = None
+
+
+@dataclass
+class StrictOwner(TypedJsonMixin, collect_errors=True):
+    owner_name: str
+    account: StrictAccount = None
+    accounts: List[StrictAccount] = None
+    previous: 'StrictOwner' = None
+    by_name: Dict[str, StrictAccount] = None
+    history: Optional[List[StrictAccount]] = None
+
+
+@dataclass
+class LazyStrictAccount(TypedJsonMixin, collect_errors=True, lazy=True):
+    account_id: int
+    inner: Inner = None
+
+
+@dataclass
+class GeneratedStrictAccount(TypedJsonMixin, collect_errors=True,
+                             codegen=True):
+    account_id: int
+    owner: str
+
+
+def test_that_errors_are_type_errors_with_structure():
+    with pytest.raises(TypeError) as e_info:
+        Account('1', 'bob')
+    error = e_info.value
+    assert isinstance(error, ValidationError)
+    assert error.path == 'Account.account_id'
+    assert error.expected_type is int
+    assert error.actual_type is str
+    assert error.errors == [error]
+    assert repr(error) == "ValidationError('Account.account_id')"
+    assert str(error) == ("Account.account_id is expected to be <class "
+                          "'int'>, but value 1 with type <class 'str'> was "
+                          'found instead')
+
+
+def test_that_messages_are_only_formatted_when_needed():
+    Expensive.reprs = 0
+    with pytest.raises(ValidationError) as e_info:
+        Account(Expensive(), 'bob')
+    assert Expensive.reprs == 0
+
+    assert 'value Expensive() with type' in str(e_info.value)
+    assert 'value Expensive() with type' in str(e_info.value)
+    assert Expensive.reprs == 1
+
+
+def test_that_all_errors_can_be_collected():
+    assert StrictAccount(1, 'bob', [1], {'inner_id': 2}).inner == Inner(2)
+
+    with pytest.raises(ValidationError) as e_info:
+        StrictAccount('1', 2, [3, 'a'], {'unknown': 1})
+    error = e_info.value
+    assert error.path == 'StrictAccount'
+    assert error.expected_type is None
+    assert [e.path for e in error.errors] == [
+        'StrictAccount.account_id', 'StrictAccount.owner',
+        'StrictAccount.scores', 'StrictAccount.inner']
+    assert str(error) == '\n'.join(str(e) for e in error.errors)
+
+
+def test_that_a_single_collected_error_is_raised_as_it_is():
+    with pytest.raises(ValidationError) as collected:
+        StrictAccount(1, 2)
+    with pytest.raises(ValidationError) as first:
+        Account(1, 2)
+    assert str(collected.value) == str(first.value).replace(
+        'Account', 'StrictAccount')
+    assert collected.value.errors == [collected.value]
+
+
+def test_that_errors_of_nested_instances_are_collected_with_their_path():
+    with pytest.raises(ValidationError) as e_info:
+        StrictOwner(
+            1,
+            {'account_id': 'a', 'owner': 2, 'inner': {'inner_id': 'b'}},
+            [{'account_id': 3, 'owner': 'c'}, {'account_id': 3, 'owner': 4}],
+            {'owner_name': 5, 'accounts': [{'account_id': 6, 'owner': 7}]},
+            by_name={'a.b': {'account_id': 'd', 'owner': 'e'}},
+            history=[{'account_id': 8, 'owner': 9}])
+    errors = e_info.value.errors
+    assert [e.path for e in errors] == [
+        'StrictOwner.owner_name', 'StrictOwner.account.account_id',
+        'StrictOwner.account.owner', 'StrictOwner.account.inner.inner_id',
+        'StrictOwner.accounts[1].owner', 'StrictOwner.previous.owner_name',
+        'StrictOwner.previous.accounts[0].owner',
+        "StrictOwner.by_name['a.b'].account_id",
+        'StrictOwner.history[0].owner']
+    assert str(errors[4]) == (
+        "StrictOwner.accounts[1].owner is expected to be <class 'str'>, but "
+        "value 4 with type <class 'int'> was found instead")
+    assert errors[1].expected_type is int
+    assert errors[1].actual_type is str
+    assert str(errors[1]) == (
+        "StrictOwner.account.account_id is expected to be <class 'int'>, but "
+        "value a with type <class 'str'> was found instead")
+
+    with pytest.raises(ValidationError) as e_info:
+        StrictAccount(1, 'bob', inner={'unknown': 1})
+    assert e_info.value.path == 'StrictAccount.inner'
+    assert 'is a dict with unexpected keys' in str(e_info.value)
+
+
+def test_that_errors_are_moved_into_enclosing_fields():
+    error = ValidationError('Child.age', int, str, 'Child.age is wrong')
+    assert [str(e) for e in error.within('Parent.child')] == [
+        'Parent.child.age is wrong']
+    error = ValidationError('Child.age', int, str, 'Not starting with it')
+    assert [(e.path, str(e)) for e in error.within('Parent.child')] == [
+        ('Parent.child.age', 'Not starting with it')]
+    assert ValidationError('Child', None, None, 'x').within(
+        'Parent.child')[0].path == 'Parent.child'
+    assert ValidationError('Parent.kids[0].age', int, str, 'x').within(
+        'Parent.kids')[0].path == 'Parent.kids[0].age'
+    assert error.within('Child.age') == [error]
+
+
+def test_that_lazy_and_generated_classes_collect_errors():
+    with pytest.raises(ValidationError) as e_info:
+        LazyStrictAccount.from_dict({'account_id': 'a', 'inner': {}})
+    assert [e.path for e in e_info.value.errors] == [
+        'LazyStrictAccount.account_id']
+    assert LazyStrictAccount(1, {'inner_id': 2}).inner == Inner(2)
+
+    with pytest.raises(ValidationError) as e_info:
+        GeneratedStrictAccount.from_dict({'account_id': 'a', 'owner': 1})
+    assert len(e_info.value.errors) == 2
+
+
+def test_that_errors_can_be_pickled():
+    with pytest.raises(ValidationError) as e_info:
+        StrictAccount('1', 2)
+    error = pickle.loads(pickle.dumps(e_info.value))
+    assert str(error) == str(e_info.value)
+    assert [e.path for e in error.errors] == [
+        'StrictAccount.account_id', 'StrictAccount.owner']
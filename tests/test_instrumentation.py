@@ -0,0 +1,172 @@
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+from typed_json_dataclass import MappingMode, TypedJsonMixin, instrumentation
+
+
+@dataclass
+class Tag(TypedJsonMixin):
+    tag_name: str
+
+
+@dataclass
+class Article(TypedJsonMixin):
+    article_id: int
+    tags: List[Tag] = None
+
+
+@dataclass
+class GeneratedArticle(TypedJsonMixin, codegen=True):
+    article_id: int
+
+
+@dataclass
+class GeneratedTag(TypedJsonMixin, codegen=True):
+    tag_name: str
+
+
+@dataclass
+class GeneratedTopic(TypedJsonMixin, codegen=True):
+    topic_name: str
+    parent: 'GeneratedTopic' = None
+
+
+@dataclass
+class TaggedArticle(TypedJsonMixin):
+    first_tag: GeneratedTag = None
+    tags: List[GeneratedTag] = None
+    topic: GeneratedTopic = None
+
+
+@dataclass
+class Thread(TypedJsonMixin):
+    body: str
+    replies: List['Thread'] = None
+
+
+ARTICLE = f'{__name__}.Article'
+TAG = f'{__name__}.Tag'
+
+
+@pytest.fixture(autouse=True)
+def instrumented():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def calls(counters):
+    return {event: counter['calls'] for event, counter in counters.items()
+            if counter['calls']}
+
+
+def test_that_validation_is_counted():
+    Article(1, [Tag('a'), Tag('b')])
+    with pytest.raises(TypeError):
+        Article('1')
+
+    counters = instrumentation.snapshot()
+    assert counters[ARTICLE]['post_init']['calls'] == 2
+    assert counters[ARTICLE]['post_init']['failures'] == 1
+    assert counters[TAG]['post_init'] == {
+        'calls': 2, 'failures': 0,
+        'seconds': counters[TAG]['post_init']['seconds'],
+    }
+    assert counters[ARTICLE]['post_init']['seconds'] > 0
+
+
+def test_that_decoding_and_renaming_are_counted():
+    Article.from_dicts([{'articleId': 1, 'tags': [{'tag_name': 'a'}]},
+                        {'articleId': 2}],
+                       mapping_mode=MappingMode.SnakeCase)
+    counters = instrumentation.snapshot()
+    assert calls(counters[ARTICLE]) == {
+        'post_init': 2, 'from_dict': 2, 'rename': 2}
+    assert calls(counters[TAG]) == {'post_init': 1}
+
+    GeneratedArticle.from_json('{"articleId": 1}',
+                               mapping_mode=MappingMode.SnakeCase)
+    assert calls(instrumentation.snapshot()[f'{__name__}.GeneratedArticle']) \
+        == {'post_init': 1, 'from_dict': 1, 'rename': 1}
+
+
+def test_that_nested_generated_classes_are_counted():
+    TaggedArticle.from_dict({
+        'first_tag': {'tag_name': 'a'},
+        'tags': [{'tag_name': 'b'}, {'tag_name': 'c'}],
+        'topic': {'topic_name': 'x', 'parent': {'topic_name': 'y'}},
+    })
+    counters = instrumentation.snapshot()
+    assert calls(counters[f'{__name__}.GeneratedTag']) == {'post_init': 3}
+    assert calls(counters[f'{__name__}.GeneratedTopic']) == {'post_init': 2}
+
+    instrumentation.disable()
+    instrumentation.reset()
+    article = TaggedArticle.from_dict({'first_tag': {'tag_name': 'a'}})
+    assert article.first_tag == GeneratedTag('a')
+    assert instrumentation.snapshot() == {}
+
+
+def test_that_invalid_documents_are_not_decoded_twice():
+    raw_dict = {'body': 'a', 'replies': [
+        {'body': 'b'},
+        {'body': 'c', 'replies': [{'body': 'd'}] * 10},
+        {'body': 1},
+    ]}
+    with pytest.raises(TypeError) as decoded_error:
+        Thread.from_dict(raw_dict)
+
+    # The ten nested replies are only instantiated once, the error of the
+    # invalid reply is raised by instantiating the document and its replies
+    counters = instrumentation.snapshot()[f'{__name__}.Thread']['post_init']
+    assert (counters['calls'], counters['failures']) == (15, 3)
+
+    with pytest.raises(TypeError) as direct_error:
+        Thread(**raw_dict)
+    assert str(decoded_error.value) == str(direct_error.value)
+
+
+def test_that_encoding_is_counted():
+    Article(1).to_json()
+    assert calls(instrumentation.snapshot()[ARTICLE]) == {
+        'post_init': 1, 'to_dict': 1}
+
+
+def test_that_callbacks_get_every_event():
+    events = []
+    instrumentation.add_callback(events.append)
+    try:
+        Article.from_dict({'article_id': 1})
+        with pytest.raises(TypeError):
+            Tag.from_dict({'tag_name': 1})
+    finally:
+        instrumentation.remove_callback(events.append)
+    Article(2)
+
+    assert [(event.cls, event.name, event.failed) for event in events] == [
+        (Article, 'post_init', False),
+        (Article, 'from_dict', False),
+        (Tag, 'post_init', True),
+        (Tag, 'from_dict', True),
+    ]
+    assert all(event.seconds >= 0 for event in events)
+
+
+def test_that_nothing_is_counted_while_disabled():
+    instrumentation.disable()
+    Article.from_dict({'article_id': 1}).to_dict()
+    GeneratedArticle.from_dict({'article_id': 1})
+    assert instrumentation.snapshot() == {}
+
+
+def test_that_snapshots_are_copies():
+    Tag('a')
+    counters = instrumentation.snapshot()
+    counters[TAG]['post_init']['calls'] = 10
+    assert instrumentation.snapshot()[TAG]['post_init']['calls'] == 1
+
+    instrumentation.reset()
+    assert instrumentation.snapshot() == {}
@@ -0,0 +1,136 @@
+import json
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+from typed_json_dataclass import (
+    InternTable,
+    TypedJsonMixin,
+    ValidationLevel,
+    intern_field,
+)
+from typed_json_dataclass.interning import (
+    InternStats,
+    default_intern_table,
+    holds_strings,
+)
+
+STATUS_TABLE = InternTable()
+ORDER_TABLE = InternTable()
+
+
+@dataclass
+class Payment(TypedJsonMixin):
+    payment_id: str
+    status: str = intern_field(STATUS_TABLE, default='new')
+
+
+@dataclass
+class Order(TypedJsonMixin, intern_strings=ORDER_TABLE):
+    order_id: int
+    region: str
+    currency: Optional[str] = None
+    tags: List[str] = None
+    amount: float = 0.0
+
+
+@dataclass
+class CodegenOrder(TypedJsonMixin, codegen=True, intern_strings=True):
+    region: str
+
+
+@pytest.fixture(autouse=True)
+def empty_tables():
+    for table in (STATUS_TABLE, ORDER_TABLE, default_intern_table):
+        table.clear()
+
+
+def decode_twice(cls, raw_json, **kwargs):
+    return (cls.from_json(raw_json, **kwargs),
+            cls.from_json(raw_json, **kwargs))
+
+
+def test_that_interned_fields_share_their_strings():
+    first, second = decode_twice(Payment,
+                                 '{"payment_id": "p1", "status": "paid"}')
+    assert first.status is second.status
+    assert first.payment_id is not second.payment_id
+    assert STATUS_TABLE.stats() == InternStats(hits=1, misses=1, size=1,
+                                               maxsize=STATUS_TABLE.maxsize)
+
+
+def test_that_classes_intern_all_string_fields():
+    raw_json = json.dumps({'order_id': 1, 'region': 'eu-west',
+                           'currency': 'EUR', 'tags': ['a', 'b']})
+    first, second = decode_twice(Order, raw_json)
+    assert first == second
+    assert first.region is second.region
+    assert first.currency is second.currency
+    assert first.tags[0] is second.tags[0]
+    assert ORDER_TABLE.stats().size == 4
+
+
+def test_that_values_are_still_checked():
+    with pytest.raises(TypeError):
+        Order(1, 2)
+    with pytest.raises(TypeError):
+        Order(1, 'eu', tags=['a', 1])
+    with pytest.raises(TypeError):
+        Payment('p1', 1)
+
+
+def test_that_trusted_level_still_interns():
+    raw_json = '{"order_id": 1, "region": "eu", "tags": ["a", 1]}'
+    first, second = decode_twice(Order, raw_json,
+                                 validation_level=ValidationLevel.Trusted)
+    assert first.region is second.region
+    assert first.tags == ['a', 1]
+    assert first.tags[0] is second.tags[0]
+
+    order = Order.from_dict({'order_id': 1, 'region': 2, 'tags': 'a'},
+                            validation_level=ValidationLevel.Trusted)
+    assert order.region == 2
+    assert order.tags == 'a'
+
+
+def test_that_generated_decoders_intern():
+    first, second = decode_twice(CodegenOrder, '{"region": "eu"}')
+    assert first.region is second.region
+    assert default_intern_table.stats().hits == 1
+
+
+def test_that_full_tables_stop_growing():
+    table = InternTable(maxsize=1)
+    first = table.intern(''.join(['a', 'b']))
+    assert table.intern(''.join(['a', 'b'])) is first
+
+    other = ''.join(['c', 'd'])
+    assert table.intern(other) is other
+    assert table.intern(''.join(['c', 'd'])) is not other
+    assert table.stats() == InternStats(hits=1, misses=3, size=1, maxsize=1)
+
+
+def test_that_intern_fields_keep_other_options():
+    @dataclass
+    class Tagged(TypedJsonMixin):
+        status: str = intern_field(metadata={'doc': 'The status'},
+                                   default='new')
+
+    field_def = Tagged.__dataclass_fields__['status']
+    assert field_def.metadata['doc'] == 'The status'
+    assert Tagged().status == 'new'
+    assert Tagged('paid').status == 'paid'
+    assert default_intern_table.stats().size == 2
+
+
+@pytest.mark.parametrize('field_type, expected', [
+    (str, True),
+    (Optional[str], True),
+    (List[str], True),
+    (int, False),
+    (Optional[int], False),
+    (List[int], False),
+    (List, False),
+])
+def test_which_types_hold_strings(field_type, expected):
+    assert holds_strings(field_type) == expected
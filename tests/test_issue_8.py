@@ -155,3 +155,33 @@ def test_dc_with_init_var_in_child_should_contain_init_var(cls) -> None:
 
 def test_dc_without_init_var_should_not_contain_init_var() -> None:
     assert not DataclassWithoutInitVar._contains_non_default_init_vars()
+
+
+@dataclass
+class PlainDataclassWithInitVar:
+    init: InitVar[str]
+
+
+@dataclass
+class DataclassWithPlainChild(TypedJsonMixin):
+    child_dc: PlainDataclassWithInitVar = None
+
+
+def test_init_vars_of_plain_dataclass_children_are_detected() -> None:
+    assert DataclassWithPlainChild._contains_non_default_init_vars()
+
+
+def test_init_var_check_is_computed_once(monkeypatch) -> None:
+    assert not DataclassWithoutInitVar._contains_non_default_init_vars()
+    monkeypatch.setattr(DataclassWithoutInitVar, '__dataclass_fields__', {})
+    assert not DataclassWithoutInitVar._contains_non_default_init_vars()
+    assert (DataclassWithoutInitVar._typed_json_cache['init_vars']
+            is False)
+
+
+def test_init_var_check_with_previous_classes_is_not_cached() -> None:
+    previous_classes = set()
+    assert DataclassWithNestedInitVar._contains_non_default_init_vars(
+        previous_classes)
+    assert previous_classes == {DataclassWithNestedInitVar,
+                                DataclassWithInitVar}
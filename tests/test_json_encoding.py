@@ -0,0 +1,131 @@
+import io
+import json
+import sys
+from dataclasses import dataclass, field
+from decimal import Decimal
+from enum import IntEnum
+from typing import Dict, List, Optional, Union
+
+import pytest
+from typed_json_dataclass import MappingMode, TypedJsonMixin, array_field, \
+    union_field
+
+DEPTH = sys.getrecursionlimit() * 3
+
+
+class Color(IntEnum):
+    RED = 1
+
+
+@dataclass
+class Line(TypedJsonMixin):
+    line_text: str
+    line_amount: Optional[float] = None
+
+
+@dataclass
+class Report(TypedJsonMixin):
+    report_title: str
+    lines: List[Line] = field(default_factory=list)
+    totals: Dict[str, float] = None
+    readings: List[float] = array_field('d', default=None)
+    first_line: Line = None
+    anything: object = None
+
+
+@dataclass
+class Node(TypedJsonMixin):
+    node_value: int
+    next_node: 'Node' = None
+
+
+@dataclass
+class Owner(TypedJsonMixin):
+    pet: Union[Line, Node] = union_field('kind')
+
+
+def with_anything(value):
+    # Skips the validation of __post_init__, which rejects plain lists
+    report = Report('r')
+    report.anything = value
+    return report
+
+
+INSTANCES = [
+    Report('r'),
+    Report('Ünïcode "quoted" \n', [Line('a', 1.5), Line('b')],
+           {'sum_total': 1.5}, [0.5], Line('c', -2.0)),
+    Report('r', anything={'someKey': [{'inner_key': (1, None, True)}]}),
+    Report('r', anything={1: 'a', 2.5: 'b'}),
+    Report('r', anything={True: 'c', None: 'd'}),
+    Report('r', anything={False: 'e', 0.5: 'f'}),
+    with_anything([float('nan'), float('inf'), -float('inf'), 1e300]),
+    Report('r', anything=Color.RED),
+    Report('r', anything=frozenset({1})),
+    with_anything([[], {}, [[]]]),
+    Owner(Line('a')),
+]
+
+
+@pytest.mark.parametrize('instance', INSTANCES)
+@pytest.mark.parametrize('keep_none', [True, False])
+@pytest.mark.parametrize('mapping_mode', list(MappingMode))
+def test_that_chunks_match_to_json(instance, keep_none, mapping_mode):
+    expected = instance.to_json(keep_none=keep_none,
+                                mapping_mode=mapping_mode)
+    chunks = list(instance.iter_json(keep_none=keep_none,
+                                     mapping_mode=mapping_mode))
+    assert ''.join(chunks) == expected
+    small_chunks = list(instance.iter_json(keep_none=keep_none,
+                                           mapping_mode=mapping_mode,
+                                           chunk_size=8))
+    assert ''.join(small_chunks) == expected
+    assert all(chunk for chunk in small_chunks)
+
+
+def test_that_chunks_have_about_the_requested_size():
+    report = Report('r', [Line(str(i)) for i in range(1000)])
+    chunks = list(report.iter_json(chunk_size=100))
+    assert len(chunks) > 100
+    assert all(100 <= len(chunk) < 120 for chunk in chunks[:-1])
+
+    with pytest.raises(ValueError):
+        next(report.iter_json(chunk_size=0))
+
+
+def test_that_bytes_are_produced():
+    report = INSTANCES[1]
+    chunks = list(report.iter_json(as_bytes=True))
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    assert b''.join(chunks) == report.to_json_bytes()
+
+
+def test_that_files_are_written():
+    report = INSTANCES[1]
+    text = io.StringIO()
+    report.dump_json(text, mapping_mode=MappingMode.CamelCase, chunk_size=4)
+    assert text.getvalue() == report.to_json(
+        mapping_mode=MappingMode.CamelCase)
+
+    binary = io.BytesIO()
+    report.dump_json(binary)
+    assert binary.getvalue() == report.to_json_bytes()
+
+
+def test_that_deep_documents_are_encoded():
+    node = Node(-1)
+    for i in range(DEPTH):
+        node = Node(i, node)
+    encoded = ''.join(node.iter_json())
+    assert encoded.startswith(f'{{"node_value": {DEPTH - 1}, "next_node": ')
+    assert encoded.endswith('{"node_value": -1, "next_node": null}' +
+                            '}' * DEPTH)
+
+
+def test_that_values_json_cannot_encode_raise():
+    with pytest.raises(TypeError, match='Decimal is not JSON serializable'):
+        ''.join(Report('r', anything=Decimal('1')).iter_json())
+    with pytest.raises(TypeError, match='keys must be'):
+        ''.join(Report('r', anything={(1, 2): 'a'}).iter_json())
+    assert json.loads(''.join(Report('r').iter_json())) == {
+        'report_title': 'r', 'lines': []}
@@ -0,0 +1,71 @@
+import io
+from dataclasses import InitVar, dataclass
+
+import pytest
+from typed_json_dataclass import TypedJsonMixin, MappingMode
+
+
+@dataclass
+class LogLine(TypedJsonMixin):
+    log_level: str
+    log_message: str = None
+
+
+@dataclass
+class WithInitVar(TypedJsonMixin):
+    init: InitVar[str]
+    value: str = ''
+
+    def __post_init__(self, init):
+        self.value = init
+        super().__post_init__()
+
+
+LOG_LINES = [LogLine('INFO', 'started'), LogLine('ERROR')]
+
+
+def test_iter_jsonl_yields_instances_lazily():
+    fileobj = io.StringIO('{"log_level": "INFO"}\n\n{"log_level": 0}\n')
+    instances = LogLine.iter_jsonl(fileobj)
+    assert next(instances) == LogLine('INFO')
+    with pytest.raises(TypeError):
+        next(instances)
+
+
+def test_iter_jsonl_from_binary_file_with_mapping_mode():
+    fileobj = io.BytesIO(b'{"logLevel": "INFO", "logMessage": "started"}\n')
+    assert list(LogLine.iter_jsonl(
+        fileobj, mapping_mode=MappingMode.SnakeCase)) == [LOG_LINES[0]]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3])
+def test_dump_jsonl_writes_one_line_per_instance(chunk_size):
+    fileobj = io.StringIO()
+    assert LogLine.dump_jsonl(LOG_LINES, fileobj,
+                              chunk_size=chunk_size) == 2
+    assert fileobj.getvalue() == (
+        '{"log_level": "INFO", "log_message": "started"}\n'
+        '{"log_level": "ERROR"}\n'
+    )
+
+
+def test_dump_jsonl_to_binary_file_with_options():
+    fileobj = io.BytesIO()
+    LogLine.dump_jsonl(LOG_LINES[1:], fileobj, keep_none=True,
+                       mapping_mode=MappingMode.CamelCase)
+    assert fileobj.getvalue() == b'{"logLevel": "ERROR", "logMessage": null}\n'
+
+
+def test_dump_jsonl_checks_options():
+    with pytest.raises(ValueError):
+        LogLine.dump_jsonl(LOG_LINES, io.StringIO(), mapping_mode='Invalid')
+    with pytest.warns(UserWarning, match='init-only variables'):
+        WithInitVar.dump_jsonl([WithInitVar('a')], io.StringIO())
+
+
+def test_jsonl_round_trip_through_a_file(tmp_path):
+    path = tmp_path / 'logs.jsonl'
+    with open(path, 'w') as fileobj:
+        LogLine.dump_jsonl(LOG_LINES * 5, fileobj, chunk_size=3)
+    with open(path, 'rb') as fileobj:
+        assert list(LogLine.iter_jsonl(fileobj)) == LOG_LINES * 5
@@ -0,0 +1,218 @@
+import copy
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pytest
+from typed_json_dataclass import TypedJsonMixin, MappingMode, \
+    invalidate_caches
+
+
+@dataclass
+class Header(TypedJsonMixin):
+    route_key: str
+
+
+@dataclass
+class Item(TypedJsonMixin, lazy=True):
+    item_name: str
+    header: Header = None
+
+
+@dataclass
+class Message(TypedJsonMixin, lazy=True):
+    header: Header
+    items: List[Item] = field(default_factory=list)
+    trailer: Header = None
+    size: int = 0
+
+
+@dataclass
+class Envelope(TypedJsonMixin, lazy=True):
+    header: Optional[Header] = None
+    items: Optional[List[Item]] = None
+
+
+@dataclass
+class CodegenHeader(TypedJsonMixin, codegen=True):
+    route_key: str
+
+
+@dataclass
+class CodegenMessage(TypedJsonMixin, codegen=True, lazy=True):
+    header: CodegenHeader
+
+
+def test_that_lazy_is_opt_in():
+    assert not Header._lazy
+    assert Message._lazy
+
+
+def test_that_nested_values_are_deferred():
+    message = Message.from_dict({'header': {'route_key': 'a'},
+                                 'items': [{'item_name': 'x'}]})
+    assert message.__dict__['_pending_fields'] == {
+        'header': {'route_key': 'a'},
+        'items': [{'item_name': 'x'}],
+    }
+    assert 'header' not in message.__dict__
+    assert 'items' not in message.__dict__
+
+
+def test_that_optional_nested_values_are_deferred():
+    envelope = Envelope.from_dict({'header': {'route_key': 1},
+                                   'items': [{'item_name': 'x'}]})
+    assert envelope.__dict__['_pending_fields'] == {
+        'header': {'route_key': 1},
+        'items': [{'item_name': 'x'}],
+    }
+    assert envelope.items == [Item('x')]
+    with pytest.raises(TypeError, match='Header.route_key'):
+        envelope.header
+    assert Envelope().header is None
+
+
+def test_that_deferred_fields_are_built_on_first_access():
+    message = Message.from_dict({'header': {'route_key': 'a'},
+                                 'items': [{'item_name': 'x'}]})
+    assert message.header == Header('a')
+    assert message.__dict__['header'] is message.header
+    assert message.__dict__['_pending_fields'] == {
+        'items': [{'item_name': 'x'}],
+    }
+
+    assert message.items == [Item('x')]
+    assert '_pending_fields' not in message.__dict__
+
+
+def test_that_copies_keep_their_deferred_fields():
+    message = Message.from_dict({'header': {'route_key': 'a'},
+                                 'trailer': {'route_key': 'b'},
+                                 'items': [{'item_name': 'x'}]})
+    copied = copy.copy(message)
+    assert message.header == Header('a')
+    assert message.items == [Item('x')]
+    assert copied.header == Header('a')
+    assert copied.trailer == Header('b')
+    assert copied.items == [Item('x')]
+    assert message.trailer == Header('b')
+
+
+def test_that_other_fields_are_checked_right_away():
+    with pytest.raises(TypeError):
+        Message.from_dict({'header': {'route_key': 'a'}, 'size': 'big'})
+
+    with pytest.raises(TypeError):
+        Message.from_dict({'header': 'a'})
+
+
+def test_that_instances_are_not_deferred():
+    message = Message(Header('a'))
+    assert message.__dict__['header'] == Header('a')
+    assert 'header' not in message.__dict__['_pending_fields']
+
+
+def test_that_lists_of_other_types_are_not_deferred():
+    @dataclass
+    class Tagged(TypedJsonMixin, lazy=True):
+        tags: List[str]
+
+    tagged = Tagged(['a'])
+    assert '_pending_fields' not in tagged.__dict__
+    assert tagged.materialize() == Tagged(['a'])
+
+
+def test_that_invalid_deferred_fields_raise_on_every_access():
+    message = Message.from_dict({'header': {'route_key': 'a'},
+                                 'items': [{'item_name': 1}]})
+    assert message.header == Header('a')
+
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            message.items
+    assert 'items' not in message.__dict__
+    assert message.__dict__['_pending_fields'] == {
+        'items': [{'item_name': 1}],
+    }
+
+
+def test_that_class_attributes_keep_their_defaults():
+    Message(Header('a'))
+    assert Message.trailer is None
+    assert not hasattr(Message, 'header')
+
+
+def test_that_lazy_fields_survive_cache_invalidation():
+    Message(Header('a'))
+    invalidate_caches()
+    message = Message.from_dict({'header': {'route_key': 'a'}})
+    assert message.header == Header('a')
+
+
+def test_that_deleted_fields_raise_attribute_errors():
+    message = Message.from_dict({'header': {'route_key': 'a'}})
+    message.header
+    del message.header
+    with pytest.raises(AttributeError, match='header'):
+        message.header
+
+
+def test_that_assigned_fields_replace_their_deferred_values():
+    message = Message.from_dict({'header': {'route_key': 'a'},
+                                 'trailer': {'route_key': 'b'}})
+    copied = copy.copy(message)
+    message.header = Header('x')
+    assert message.header == Header('x')
+    assert message.__dict__['_pending_fields'] == {
+        'items': [],
+        'trailer': {'route_key': 'b'},
+    }
+    del message.header
+    with pytest.raises(AttributeError, match='header'):
+        message.header
+
+    del message.trailer
+    assert message.__dict__['_pending_fields'] == {'items': []}
+    with pytest.raises(AttributeError, match='trailer'):
+        message.trailer
+    with pytest.raises(AttributeError, match='trailer'):
+        del message.trailer
+    assert copied.header == Header('a')
+    assert copied.trailer == Header('b')
+
+
+def test_that_materialize_builds_everything_recursively():
+    message = Message.from_dict({
+        'header': {'route_key': 'a'},
+        'items': [{'item_name': 'x', 'header': {'route_key': 'b'}}],
+    })
+    assert message.materialize() is message
+    assert '_pending_fields' not in message.__dict__
+    assert '_pending_fields' not in message.items[0].__dict__
+    assert message == Message(Header('a'), [Item('x', Header('b'))])
+
+
+def test_that_materialize_raises_on_invalid_fields():
+    message = Message.from_dict({'header': {'route_key': 1}})
+    with pytest.raises(TypeError):
+        message.materialize()
+
+
+def test_that_lazy_instances_serialize_their_deferred_fields():
+    raw_message = {'header': {'routeKey': 'a'},
+                   'items': [{'item_name': 'x'}]}
+    message = Message.from_dict(raw_message,
+                                mapping_mode=MappingMode.SnakeCase)
+    assert message.to_dict(mapping_mode=MappingMode.CamelCase) == {
+        'header': {'routeKey': 'a'},
+        'items': [{'item_name': 'x', 'header': None}],
+        'size': 0,
+    }
+
+
+def test_that_lazy_classes_do_not_bypass_init():
+    assert not CodegenMessage._can_bypass_init()
+
+    message = CodegenMessage.from_dict({'header': {'routeKey': 'a'}},
+                                       mapping_mode=MappingMode.SnakeCase)
+    assert 'header' in message.__dict__['_pending_fields']
+    assert message.header == CodegenHeader('a')
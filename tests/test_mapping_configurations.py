@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 import pytest
 from typed_json_dataclass import TypedJsonMixin, MappingMode
+from typed_json_dataclass.utils import to_camel
 
 
 @dataclass
@@ -162,3 +163,12 @@ def test_recursive_to_json_mapping():
     target = ParentObject('asdf', ChildObject('fdsa'))
     actual = target.to_json(mapping_mode=MappingMode.SnakeCase)
     assert expected == actual
+
+
+def test_field_name_table_contains_the_expected_raw_keys():
+    assert ParentObject._field_name_table(to_camel) == {
+        'objectId': 'objectId',
+        'object_id': 'objectId',
+        'child': 'child',
+    }
+    assert SnakeCaseObjects._field_name_table(to_camel) == {}
@@ -0,0 +1,86 @@
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+from typed_json_dataclass import MappingMode, TypedJsonMixin, ValidationLevel
+
+
+@dataclass
+class Tag(TypedJsonMixin):
+    tag_name: str
+
+
+@dataclass
+class Event(TypedJsonMixin):
+    event_id: int
+    tags: List[Tag] = None
+
+
+def event_lines(count):
+    return [json.dumps({'eventId': i, 'tags': [{'tag_name': str(i)}]})
+            for i in range(count)]
+
+
+def expected_events(count):
+    return [Event(i, [Tag(str(i))]) for i in range(count)]
+
+
+def test_that_lines_are_decoded_in_worker_processes():
+    events = Event.from_json_lines_parallel(
+        '\n'.join(event_lines(50)) + '\n\n', workers=2, chunk_size=7,
+        mapping_mode=MappingMode.SnakeCase)
+    assert events == expected_events(50)
+
+
+def test_that_an_executor_can_be_given():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        events = Event.from_json_lines_parallel(
+            event_lines(20), workers=1, chunk_size=3,
+            mapping_mode=MappingMode.SnakeCase, executor=executor)
+        assert events == expected_events(20)
+        # The executor is still usable
+        assert executor.submit(len, 'ab').result() == 2
+
+
+def test_that_iterators_decode_as_they_are_consumed():
+    lines = io.BytesIO('\n'.join(event_lines(10)).encode('utf-8'))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        events = Event.from_json_lines_parallel(
+            lines, chunk_size=4, mapping_mode=MappingMode.SnakeCase,
+            as_iterator=True, executor=executor)
+        assert next(events) == Event(0, [Tag('0')])
+        assert list(events) == expected_events(10)[1:]
+
+
+def test_that_closed_iterators_cancel_pending_chunks():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        events = Event.from_json_lines_parallel(
+            event_lines(100), workers=4, chunk_size=1,
+            mapping_mode=MappingMode.SnakeCase, as_iterator=True,
+            executor=executor)
+        assert next(events) == Event(0, [Tag('0')])
+        events.close()
+
+
+def test_that_errors_of_workers_are_raised():
+    with pytest.raises(TypeError, match='Event.event_id'):
+        Event.from_json_lines_parallel(['{"event_id": "a"}'], workers=1)
+
+
+def test_that_the_validation_level_is_used_by_the_workers():
+    events = Event.from_json_lines_parallel(
+        ['{"event_id": "a"}'], workers=1,
+        validation_level=ValidationLevel.Trusted)
+    assert events[0].event_id == 'a'
+    assert events[0].validation_level() is ValidationLevel.Trusted
+
+
+def test_that_options_are_checked_before_decoding():
+    with pytest.raises(ValueError, match='Invalid mapping mode'):
+        Event.from_json_lines_parallel([], mapping_mode='snake')
+
+    with pytest.raises(ValueError, match='chunk_size'):
+        Event.from_json_lines_parallel([], chunk_size=0)
@@ -0,0 +1,98 @@
+from collections import OrderedDict, namedtuple
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal
+from typing import List, Optional
+
+import pytest
+from typed_json_dataclass import TypedJsonMixin, MappingMode
+from typed_json_dataclass.utils import recursive_rename, to_camel, to_snake
+
+
+def legacy_to_dict(instance, keep_none, mapping_mode):
+    """The asdict based implementation that the serializers replace"""
+    self_dict = asdict(instance)
+    if not keep_none:
+        self_dict = {k: v for k, v in self_dict.items() if v is not None}
+    if mapping_mode == MappingMode.NoMap:
+        return self_dict
+    format_method = to_snake if mapping_mode == MappingMode.SnakeCase \
+        else to_camel
+    return recursive_rename(self_dict, format_method)
+
+
+Pair = namedtuple('Pair', ['left', 'right'])
+
+
+@dataclass
+class PlainChild:
+    childName: str
+    child_value: Optional[int] = None
+
+
+@dataclass
+class Child(TypedJsonMixin):
+    child_name: str
+    child_value: Optional[int] = None
+
+
+@dataclass
+class SpecialChild(Child):
+    special_flag: bool = True
+
+
+@dataclass
+class Parent(TypedJsonMixin):
+    parent_name: str
+    child: Child = None
+    children: List[Child] = field(default_factory=list)
+    tags: List[str] = None
+    anything: object = None
+
+
+def with_attribute(instance, name, value):
+    # Skips the validation of __post_init__
+    setattr(instance, name, value)
+    return instance
+
+
+INSTANCES = [
+    Parent('p'),
+    Parent('p', Child('c'), [Child('a'), Child('b', 2)], ['x', 'y'],
+           PlainChild('pc', 1)),
+    Parent('p', SpecialChild('s')),
+    Parent('p', anything={'someKey': {'inner_key': [{'listKey': 1}]}}),
+    Parent('p', anything=OrderedDict([('some_key', Child('c'))])),
+    Parent('p', anything=(1, [Child('c')])),
+    Parent('p', anything=Pair(Child('l'), 'r')),
+    Parent('p', anything=(PlainChild('pc'),)),
+    with_attribute(Parent('p'), 'tags', ('not', 'a', 'list')),
+    Parent('p', anything=1.5),
+    Parent('p', anything=Decimal('1.5')),
+]
+
+
+@pytest.mark.parametrize('instance', INSTANCES)
+@pytest.mark.parametrize('keep_none', [True, False])
+@pytest.mark.parametrize('mapping_mode', list(MappingMode))
+def test_that_serializers_match_asdict(instance, keep_none, mapping_mode):
+    expected = legacy_to_dict(instance, keep_none, mapping_mode)
+    actual = instance.to_dict(keep_none=keep_none, mapping_mode=mapping_mode)
+    assert expected == actual
+    assert list(expected) == list(actual)
+    assert type(expected['anything'] if 'anything' in expected else None) \
+        is type(actual['anything'] if 'anything' in actual else None)
+
+
+def test_that_serializers_are_cached_per_options():
+    Parent('p').to_dict(keep_none=True, mapping_mode=MappingMode.CamelCase)
+    serializers = Parent._typed_json_cache
+    assert ('to_dict', True, to_camel) in serializers
+    before = dict(serializers)
+    Parent('p').to_dict(keep_none=True, mapping_mode=MappingMode.CamelCase)
+    assert before == serializers
+
+
+def test_that_serialized_lists_are_copies():
+    parent = Parent('p', tags=['x'])
+    parent.to_dict()['tags'].append('y')
+    assert parent.tags == ['x']
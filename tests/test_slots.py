@@ -0,0 +1,162 @@
+import copy
+import pickle
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+from typed_json_dataclass import (
+    MappingMode,
+    TypedJsonMixin,
+    ValidationLevel,
+    slotted,
+)
+
+
+@slotted
+@dataclass
+class Label(TypedJsonMixin):
+    label_name: str
+
+
+@slotted
+@dataclass
+class TreeNode(TypedJsonMixin):
+    node_name: str
+    parent: 'TreeNode' = None
+    labels: List[Label] = field(default_factory=list)
+
+
+@slotted
+@dataclass(frozen=True)
+class FrozenLabel(TypedJsonMixin, codegen=True):
+    label_name: str
+
+
+@slotted
+@dataclass
+class UpperLabel(TypedJsonMixin):
+    label_name: str
+
+    def __post_init__(self):
+        self.label_name = self.label_name.upper()
+        super().__post_init__()
+
+    @property
+    def title(self):
+        return super().to_dict()['label_name'].title()
+
+
+@slotted
+@dataclass
+class ColoredLabel(Label):
+    color: str = 'red'
+
+
+def test_that_instances_have_no_dict():
+    label = Label('a')
+    assert not hasattr(label, '__dict__')
+    assert Label.__slots__ == ('label_name', '_call_level')
+    with pytest.raises(AttributeError):
+        label.unknown = 1
+
+
+def test_that_nested_and_self_referencing_types_are_decoded():
+    node = TreeNode.from_dict({
+        'nodeName': 'child',
+        'parent': TreeNode('root'),
+        'labels': [{'label_name': 'a'}, Label('b')],
+    }, mapping_mode=MappingMode.SnakeCase)
+    assert node == TreeNode('child', TreeNode('root'),
+                            [Label('a'), Label('b')])
+
+    with pytest.raises(TypeError):
+        TreeNode('child', Label('a'))
+    with pytest.raises(TypeError):
+        TreeNode('child', labels=[{'label_name': 1}])
+
+
+def test_that_instances_are_encoded():
+    node = TreeNode('child', TreeNode('root'), [Label('a')])
+    assert node.to_dict(mapping_mode=MappingMode.CamelCase) == {
+        'nodeName': 'child',
+        'parent': {'nodeName': 'root', 'parent': None, 'labels': []},
+        'labels': [{'label_name': 'a'}],
+    }
+    assert Label.from_json(Label('a').to_json()) == Label('a')
+
+
+def test_that_defaults_are_kept():
+    assert TreeNode('a').parent is None
+    assert TreeNode('a').labels == []
+    assert 'parent' in TreeNode.__slots__
+
+
+def test_that_frozen_classes_are_decoded_and_pickled():
+    label = FrozenLabel.from_dict({'label_name': 'a'})
+    assert label == FrozenLabel('a')
+    assert pickle.loads(pickle.dumps(label)) == label
+    assert copy.deepcopy(label) == label
+
+    trusted = FrozenLabel.from_dict({'label_name': 1},
+                                    validation_level=ValidationLevel.Trusted)
+    restored = pickle.loads(pickle.dumps(trusted))
+    assert restored.validation_level() is ValidationLevel.Trusted
+
+
+def test_that_instances_are_pickled():
+    node = TreeNode('child', TreeNode('root'))
+    assert pickle.loads(pickle.dumps(node)) == node
+
+
+def test_that_super_refers_to_the_slotted_class():
+    label = UpperLabel.from_dict({'label_name': 'a'})
+    assert label.label_name == 'A'
+    assert label.title == 'A'
+
+
+def test_that_subclasses_only_add_their_own_slots():
+    assert ColoredLabel.__slots__ == ('color',)
+    label = ColoredLabel.from_dict({'label_name': 'a'})
+    assert label == ColoredLabel('a', 'red')
+    assert not hasattr(label, '__dict__')
+
+
+def test_that_the_validation_level_is_recorded():
+    label = Label.from_dict({'label_name': 1},
+                            validation_level=ValidationLevel.Trusted)
+    assert label.validation_level() is ValidationLevel.Trusted
+    assert Label('a').validation_level() is ValidationLevel.Full
+
+
+def test_that_only_dataclasses_can_be_slotted():
+    class NotADataclass:
+        pass
+
+    with pytest.raises(TypeError, match='must be a dataclass'):
+        slotted(NotADataclass)
+
+
+def test_that_classes_are_only_slotted_once():
+    with pytest.raises(TypeError, match='already defines __slots__'):
+        slotted(Label)
+
+
+def test_that_lazy_classes_cannot_be_slotted():
+    @dataclass
+    class LazyLabel(TypedJsonMixin, lazy=True):
+        label_name: str
+
+    with pytest.raises(TypeError, match='is lazy'):
+        slotted(LazyLabel)
+
+
+def test_that_slots_are_given_as_a_string():
+    @dataclass
+    class Base:
+        __slots__ = 'base_name'
+
+    @dataclass
+    class Child(Base, TypedJsonMixin):
+        child_name: str = 'a'
+
+    assert slotted(Child).__slots__ == ('child_name', '_call_level')
@@ -0,0 +1,116 @@
+import io
+import json
+import re
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+from typed_json_dataclass import TypedJsonMixin, MappingMode
+from typed_json_dataclass.streaming import JsonArrayParser, iter_json_array
+
+
+@dataclass
+class Measurement(TypedJsonMixin):
+    sensor_name: str
+    values: List[float]
+
+
+DOCUMENT = ('[ {"sensor_name": "a \\"[,]\\"", "values": [1.5, -2e3]},\n'
+            '  {"sensor_name": "été", "values": []} , 12345, '
+            'true, null, "x", [[]] ]\n')
+ELEMENTS = json.loads(DOCUMENT)
+
+
+def feed_in_chunks(document, size):
+    parser = JsonArrayParser()
+    elements = []
+    for i in range(0, len(document), size):
+        elements += parser.feed(document[i:i + size])
+    return elements + parser.close()
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 1000])
+def test_that_elements_are_parsed_across_chunks(size):
+    assert feed_in_chunks(DOCUMENT, size) == ELEMENTS
+
+
+@pytest.mark.parametrize('size', [1, 2, 5])
+def test_that_utf8_bytes_are_parsed_across_chunks(size):
+    assert feed_in_chunks(DOCUMENT.encode('utf-8'), size) == ELEMENTS
+
+
+NUMBERS = '[1.5, 2e10, -3, 4.25e-2, 0, 10E+2,-0.5]'
+
+
+@pytest.mark.parametrize('size', range(1, len(NUMBERS) + 1))
+def test_that_numbers_are_parsed_across_chunks(size):
+    assert feed_in_chunks(NUMBERS, size) == json.loads(NUMBERS)
+
+
+def test_that_numbers_wait_for_a_delimiter():
+    parser = JsonArrayParser()
+    assert parser.feed('[1.') == []
+    assert parser.feed('5') == []
+    assert parser.feed('e') == []
+    assert parser.feed('-2\n') == [1.5e-2]
+    assert parser.feed(',-') == []
+    assert parser.feed('3]') == [-3]
+    assert parser.close() == []
+
+
+def test_that_elements_are_returned_as_soon_as_they_are_complete():
+    parser = JsonArrayParser()
+    assert parser.feed('[{"a": 1}, {"b"') == [{'a': 1}]
+    assert parser.feed(': 2}, 3') == [{'b': 2}]
+    assert parser.feed('4]') == [34]
+    assert parser.close() == []
+
+
+def test_that_large_elements_are_not_parsed_for_every_chunk():
+    parser = JsonArrayParser()
+    parser.feed('["' + 'x' * 100)
+    assert parser._retry_at == 2 * 101
+    assert parser.feed('x') == []
+    assert parser.feed('x' * 100 + '"]') == ['x' * 201]
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize('document', ['[]', ' [ ] ', '[\n]\n'])
+def test_that_empty_arrays_are_parsed(document):
+    assert feed_in_chunks(document, 1) == []
+
+
+@pytest.mark.parametrize('document, message', [
+    ('{"a": 1}', "Expecting '['"),
+    ('[1 2]', "Expecting ',' delimiter"),
+    ('[1,]', 'Expecting value'),
+    ('[1] 2', 'Extra data'),
+    ('[1, 2', 'Unterminated json array'),
+    ('', 'Unterminated json array'),
+    ('[{"a": }]', 'Expecting value'),
+])
+def test_that_invalid_documents_raise(document, message):
+    with pytest.raises(json.JSONDecodeError, match=re.escape(message)):
+        feed_in_chunks(document, 1)
+
+
+def test_iter_json_array_reads_files_in_chunks():
+    text = io.StringIO(DOCUMENT)
+    binary = io.BytesIO(DOCUMENT.encode('utf-8'))
+    assert list(iter_json_array(text, chunk_size=4)) == ELEMENTS
+    assert list(iter_json_array(binary, chunk_size=4)) == ELEMENTS
+
+
+def test_iter_json_array_reads_iterables_of_chunks():
+    chunks = iter(['[1,', ' 2', ']'])
+    assert list(iter_json_array(chunks)) == [1, 2]
+
+
+def test_that_instances_are_created_lazily():
+    document = io.BytesIO(b'[{"sensorName": "a", "values": [1.0]}, '
+                          b'{"sensorName": 0, "values": []}]')
+    instances = Measurement.iter_json_array(
+        document, mapping_mode=MappingMode.SnakeCase, chunk_size=8)
+    assert next(instances) == Measurement('a', [1.0])
+    with pytest.raises(TypeError):
+        next(instances)
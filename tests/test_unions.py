@@ -0,0 +1,296 @@
+import sys
+from dataclasses import dataclass, fields
+from typing import List, Optional, Union
+
+import pytest
+from typed_json_dataclass import MappingMode, TypedJsonMixin, \
+    ValidationError, ValidationLevel, union_field
+from typed_json_dataclass.unions import member_tags, optional_member, \
+    union_spec
+
+DEPTH = sys.getrecursionlimit() * 3
+
+
+@dataclass
+class Card(TypedJsonMixin):
+    number: str
+
+
+@dataclass
+class Transfer(TypedJsonMixin):
+    iban: str
+
+
+@dataclass
+class Voucher(TypedJsonMixin):
+    type: str
+    code: str
+
+
+@dataclass
+class Payment(TypedJsonMixin):
+    method: Union[Card, Transfer]
+    note: Optional[List[str]] = None
+    amount: Optional[int] = None
+
+
+@dataclass
+class TaggedPayment(TypedJsonMixin):
+    method: Union[Card, Transfer, Voucher] = union_field('type')
+
+
+@dataclass
+class RenamedTagPayment(TypedJsonMixin):
+    method: Union[Card, Transfer] = union_field(
+        'kind', tags={'card': Card, 'transfer': Transfer},
+        metadata={'owner': 'billing'})
+
+
+@dataclass
+class Cat(TypedJsonMixin):
+    lives: int
+
+
+@dataclass
+class Dog(TypedJsonMixin):
+    dog_name: str
+
+
+@dataclass
+class Owner(TypedJsonMixin):
+    pet: Union[Cat, Dog] = union_field('kind',
+                                       tags={'cat': Cat, 'dog': Dog})
+
+
+@dataclass
+class IntBox(TypedJsonMixin):
+    value: int
+
+
+@dataclass
+class StrBox(TypedJsonMixin):
+    value: str
+
+
+@dataclass
+class Box(TypedJsonMixin):
+    content: Union[IntBox, StrBox]
+
+
+@dataclass
+class Basket(TypedJsonMixin):
+    items: Union[List[Card], List[Transfer], None] = None
+    counts: Union[List[int], List[str], None] = None
+    other: Optional['Later'] = None
+
+
+@dataclass
+class Later(TypedJsonMixin):
+    value: int
+
+
+@dataclass
+class Node(TypedJsonMixin):
+    node_value: int
+    next_node: Optional['Node'] = None
+
+
+@dataclass
+class GeneratedNode(TypedJsonMixin, codegen=True):
+    node_value: int
+    next_node: Optional['GeneratedNode'] = None
+    children: Optional[List['GeneratedNode']] = None
+
+
+@dataclass
+class TrustedPayment(TypedJsonMixin,
+                     validation_level=ValidationLevel.Trusted):
+    method: Union[Card, Transfer]
+    cards: Optional[List[Card]] = None
+    amount: Optional[int] = None
+
+
+@dataclass
+class SampledPayment(TypedJsonMixin,
+                     validation_level=ValidationLevel.Sampled):
+    note: Optional[List[str]] = None
+
+
+def test_that_members_are_matched_by_type():
+    assert Payment(Card('1'), ['a'], 1).amount == 1
+    # bool is only accepted as a subclass of int
+    assert Payment(Card('1'), amount=True).amount is True
+    with pytest.raises(TypeError) as e_info:
+        Payment(Card('1'), amount='1')
+    assert str(e_info.value) == (
+        'Payment.amount was defined to be any of: '
+        "(<class 'int'>, <class 'NoneType'>) but was found to be "
+        "<class 'str'> instead")
+
+
+def test_that_list_members_are_checked():
+    assert Payment(Card('1'), note=['a', 'b']).note == ['a', 'b']
+    with pytest.raises(TypeError, match='Payment.note was defined to be'):
+        Payment(Card('1'), note=['a', 1])
+    assert Basket(counts=[1, 2]).counts == [1, 2]
+    assert Basket(counts=['a']).counts == ['a']
+    with pytest.raises(TypeError, match='Basket.counts was defined to be'):
+        Basket(counts=[1, 'a'])
+
+
+def test_that_dicts_become_the_first_member_they_instantiate():
+    payment = Payment.from_dict({'method': {'iban': 'DE00'}, 'note': None})
+    assert payment == Payment(Transfer('DE00'))
+    assert Payment.from_dict({'method': {'number': '1'}}).method == Card('1')
+    assert Payment.from_dict(payment.to_dict()) == payment
+
+    with pytest.raises(TypeError) as e_info:
+        Payment.from_dict({'method': {'code': 'x'}})
+    assert "but was found to be <class 'dict'> instead" in str(e_info.value)
+
+
+def test_that_dicts_in_list_members_are_instantiated():
+    basket = Basket.from_dict({'items': [{'iban': 'DE00'}, Transfer('DE01')]})
+    assert basket.items == [Transfer('DE00'), Transfer('DE01')]
+    assert Basket([{'number': '1'}]).items == [Card('1')]
+    with pytest.raises(TypeError, match='Basket.items was defined to be'):
+        Basket([{'code': 'x'}])
+
+
+def test_that_discriminators_select_the_member():
+    assert TaggedPayment.from_dict(
+        {'method': {'type': 'Transfer', 'iban': 'DE00'}}
+    ).method == Transfer('DE00')
+    # The key is kept for members that have a field of the same name
+    assert TaggedPayment.from_dict(
+        {'method': {'type': 'Voucher', 'code': 'x'}}
+    ).method == Voucher('Voucher', 'x')
+    assert RenamedTagPayment({'kind': 'card', 'number': '1'}).method \
+        == Card('1')
+
+
+def test_that_unknown_discriminators_raise():
+    with pytest.raises(TypeError) as e_info:
+        TaggedPayment({'type': 'Cash'})
+    assert str(e_info.value) == (
+        "TaggedPayment.method has 'Cash' as its 'type', which is not any of: "
+        "['Card', 'Transfer', 'Voucher']")
+
+    with pytest.raises(TypeError, match="has \\['a'\\] as its 'kind'"):
+        RenamedTagPayment({'kind': ['a']})
+
+    with pytest.raises(TypeError) as e_info:
+        RenamedTagPayment({'kind': 'card', 'iban': 'DE00'})
+    assert str(e_info.value) == (
+        f'RenamedTagPayment.method is expected to be {Card}, but value '
+        "{'kind': 'card', 'iban': 'DE00'} is a dict with unexpected keys")
+
+
+def test_that_errors_of_member_values_are_raised():
+    with pytest.raises(ValidationError) as e_info:
+        Owner.from_dict({'pet': {'kind': 'cat', 'lives': 'x'}})
+    assert e_info.value.path == 'Cat.lives'
+
+    with pytest.raises(ValidationError) as e_info:
+        Payment.from_dict({'method': {'number': 1}})
+    assert e_info.value.path == 'Card.number'
+
+    # Members after the one whose values do not match are still tried
+    assert Box({'value': 'a'}).content == StrBox('a')
+    with pytest.raises(ValidationError) as e_info:
+        Box({'value': 1.5})
+    assert e_info.value.path == 'IntBox.value'
+
+    with pytest.raises(ValidationError) as e_info:
+        Basket([{'number': 1}])
+    assert e_info.value.path == 'Card.number'
+    with pytest.raises(ValidationError) as e_info:
+        Basket([{'number': 1}, {'iban': 2}])
+    assert e_info.value.path == 'Card.number'
+
+
+def test_that_tags_are_written_for_members_without_the_field():
+    owner = Owner(Dog('rex'))
+    assert owner.to_dict() == {'pet': {'kind': 'dog', 'dog_name': 'rex'}}
+    assert Owner.from_dict(owner.to_dict()) == owner
+    assert Owner.from_json(owner.to_json()) == owner
+    assert owner.to_dict(mapping_mode=MappingMode.CamelCase) == {
+        'pet': {'kind': 'dog', 'dogName': 'rex'}}
+    assert Owner.from_dict(owner.to_dict(mapping_mode=MappingMode.CamelCase),
+                           mapping_mode=MappingMode.SnakeCase) == owner
+
+    # Members with a field of the discriminator write it themselves
+    voucher = TaggedPayment(Voucher('Voucher', 'x'))
+    assert voucher.to_dict() == {'method': {'type': 'Voucher', 'code': 'x'}}
+    for payment in [voucher, TaggedPayment(Card('1'))]:
+        assert TaggedPayment.from_dict(payment.to_dict()) == payment
+    assert member_tags(TaggedPayment, fields(TaggedPayment)[0]) == (
+        'type', {Card: 'Card', Transfer: 'Transfer'})
+    assert member_tags(Payment, fields(Payment)[0]) is None
+
+
+def test_that_union_fields_keep_their_metadata():
+    method = RenamedTagPayment.__dataclass_fields__['method']
+    assert method.metadata['owner'] == 'billing'
+    assert union_spec(method).members_by_tag([]) == {
+        'card': Card, 'transfer': Transfer}
+    assert union_spec(Payment.__dataclass_fields__['method']) is None
+
+
+def test_that_forward_refs_are_matched_by_name():
+    assert Basket(other=Later(1)).other == Later(1)
+    with pytest.raises(TypeError, match='Basket.other was defined to be'):
+        Basket(other=1)
+
+
+def test_that_optional_self_references_are_decoded():
+    assert Node(1, {'node_value': 2}).next_node == Node(2)
+
+    raw_dict = {'node_value': -1}
+    for i in range(DEPTH):
+        raw_dict = {'next_node': raw_dict, 'node_value': i}
+    node = Node.from_dict(raw_dict)
+    for i in reversed(range(-1, DEPTH)):
+        assert node.node_value == i
+        node = node.next_node
+    assert node is None
+
+
+def test_that_generated_self_references_are_decoded():
+    node = GeneratedNode(1, {'node_value': 2},
+                         [{'node_value': 3}, {'node_value': 4}])
+    assert node.next_node == GeneratedNode(2)
+    assert node.children == [GeneratedNode(3), GeneratedNode(4)]
+
+    raw_dict = {'node_value': -1}
+    for i in range(DEPTH):
+        raw_dict = {'next_node': raw_dict, 'node_value': i}
+    node = GeneratedNode.from_dict(raw_dict)
+    for i in reversed(range(-1, DEPTH)):
+        assert node.node_value == i
+        node = node.next_node
+    assert node is None
+
+
+def test_that_the_trusted_level_only_converts_dicts():
+    payment = TrustedPayment({'iban': 'DE00'}, [{'number': '1'}], amount='1')
+    assert payment == TrustedPayment(Transfer('DE00'), [Card('1')], '1')
+    assert TrustedPayment(1, cards=['a']).cards == ['a']
+    assert [name for name, _ in TrustedPayment._validation_plan(
+        ValidationLevel.Trusted)] == ['method', 'cards']
+
+
+def test_that_the_sampled_level_checks_list_members():
+    assert SampledPayment(['a']).note == ['a']
+    with pytest.raises(TypeError, match='SampledPayment.note was defined'):
+        SampledPayment([1])
+
+
+@pytest.mark.parametrize('field_type,member', [
+    (Optional[int], int),
+    (Union[int, str], None),
+    (Union[int, str, None], None),
+    (List[int], None),
+])
+def test_optional_members(field_type, member):
+    assert optional_member(field_type) is member
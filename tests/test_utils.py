@@ -1,5 +1,9 @@
 import pytest
 from typed_json_dataclass.utils import (
+    configure_name_cache,
+    iter_batches,
+    name_cache_info,
+    recursive_rename,
     to_snake as to_s,
     to_camel as to_c,
 )
@@ -26,3 +30,35 @@ def test_to_snake_case(target, expected):
 def test_to_camel_case(target, expected):
     actual = to_c(target)
     assert expected == actual
+
+
+def test_that_converted_names_are_cached():
+    configure_name_cache(maxsize=2)
+    try:
+        to_s('someName')
+        to_s('someName')
+        to_s('otherName')
+        to_s('thirdName')
+        to_c('some_name')
+        info = name_cache_info()
+        assert info['to_snake'].hits == 1
+        assert info['to_snake'].misses == 3
+        assert info['to_snake'].maxsize == 2
+        assert info['to_snake'].currsize == 2
+        assert info['to_camel'].misses == 1
+    finally:
+        configure_name_cache()
+    assert name_cache_info()['to_snake'].currsize == 0
+
+
+def test_that_known_names_are_used_only_for_the_top_level():
+    raw_dict = {'someKey': {'someKey': 1}, 'otherKey': 2}
+    assert recursive_rename(raw_dict, to_s, {'someKey': 'renamed'}) == {
+        'renamed': {'some_key': 1},
+        'other_key': 2,
+    }
+
+
+def test_that_elements_are_grouped_in_batches():
+    assert list(iter_batches('abcde', 2)) == [['a', 'b'], ['c', 'd'], ['e']]
+    assert list(iter_batches([], 2)) == []
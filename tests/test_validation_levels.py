@@ -0,0 +1,233 @@
+import io
+import random
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+from typed_json_dataclass import TypedJsonMixin, ValidationLevel
+from typed_json_dataclass.validation import SAMPLE_SIZE, current_level, \
+    sample
+
+
+@dataclass
+class Point(TypedJsonMixin):
+    x: float
+    y: float
+
+
+@dataclass
+class Telemetry(TypedJsonMixin):
+    source: str
+    readings: List[float] = field(default_factory=list)
+    matrix: List[List[int]] = field(default_factory=list)
+    points: List[Point] = field(default_factory=list)
+    origin: Point = None
+
+
+@dataclass
+class SampledTelemetry(TypedJsonMixin,
+                       validation_level=ValidationLevel.Sampled):
+    readings: List[float]
+    points: List[Point] = field(default_factory=list)
+
+
+@dataclass
+class TrustedTelemetry(TypedJsonMixin,
+                       validation_level=ValidationLevel.Trusted):
+    source: str
+    readings: List[float] = field(default_factory=list)
+    points: List[Point] = field(default_factory=list)
+    origin: Point = None
+
+
+@dataclass
+class SampledTree(TypedJsonMixin, validation_level=ValidationLevel.Sampled):
+    value: int
+    kids: List['SampledTree'] = None
+    child: 'SampledTree' = None
+
+
+@dataclass
+class TrustedTree(TypedJsonMixin, validation_level=ValidationLevel.Trusted):
+    value: int
+    kids: List['TrustedTree'] = None
+    child: 'TrustedTree' = None
+
+
+@dataclass
+class CodegenPoint(TypedJsonMixin, codegen=True):
+    x: float
+    y: float
+
+
+@dataclass
+class LazyTelemetry(TypedJsonMixin, lazy=True):
+    origin: Point
+
+
+@pytest.fixture
+def no_random_elements(monkeypatch):
+    """Make the sampled level only check the first and last elements."""
+    monkeypatch.setattr('typed_json_dataclass.validation.SAMPLE_SIZE', 0)
+
+
+def test_that_the_default_level_is_full():
+    assert Telemetry('a').validation_level() is ValidationLevel.Full
+    with pytest.raises(TypeError):
+        Telemetry('a', [1.0] * 100 + ['b'] + [1.0] * 100)
+
+
+def test_that_sample_keeps_short_lists():
+    values = list(range(SAMPLE_SIZE + 2))
+    assert sample(values) is values
+
+
+def test_that_sample_picks_first_last_and_random_elements():
+    values = list(range(100))
+    sampled = sample(values)
+    assert len(sampled) == SAMPLE_SIZE + 2
+    assert sampled[0] == 0
+    assert sampled[-1] == 99
+    assert len(set(sampled)) == len(sampled)
+
+
+def test_that_sampled_level_skips_unsampled_elements(no_random_elements):
+    readings = [1.0] * 100 + ['b'] + [1.0] * 100
+    telemetry = SampledTelemetry(readings)
+    assert telemetry.readings is readings
+    assert telemetry.validation_level() is ValidationLevel.Sampled
+
+
+def test_that_sampled_level_checks_first_and_last_elements(
+        no_random_elements):
+    with pytest.raises(TypeError):
+        SampledTelemetry(['b'] + [1.0] * 100)
+    with pytest.raises(TypeError):
+        SampledTelemetry([1.0] * 100 + ['b'])
+
+
+def test_that_sampled_level_checks_random_elements(monkeypatch):
+    monkeypatch.setattr(random, 'sample', lambda population, k: [50] * k)
+    readings = [1.0] * 100
+    readings[50] = 'b'
+    with pytest.raises(TypeError):
+        SampledTelemetry(readings)
+
+
+def test_that_sampled_level_checks_nested_lists(no_random_elements):
+    telemetry = Telemetry.from_dict(
+        {'source': 'a', 'matrix': [[1, 'b', 1], [1]]},
+        validation_level=ValidationLevel.Sampled)
+    assert telemetry.matrix == [[1, 'b', 1], [1]]
+
+    with pytest.raises(TypeError):
+        Telemetry.from_dict({'source': 'a', 'matrix': [[1], [1, 'b']]},
+                            validation_level=ValidationLevel.Sampled)
+
+
+def test_that_sampled_level_builds_every_nested_element(no_random_elements):
+    telemetry = SampledTelemetry.from_dict({
+        'readings': [],
+        'points': [{'x': 1.0, 'y': 2.0}] * 20,
+    })
+    assert telemetry.points == [Point(1.0, 2.0)] * 20
+
+
+@pytest.mark.parametrize('cls', [SampledTree, TrustedTree])
+def test_that_self_references_are_built_at_every_level(cls):
+    raw_tree = {'value': 1, 'kids': [{'value': 2, 'kids': [{'value': 3}]}],
+                'child': {'value': 4, 'child': {'value': 5}}}
+    expected = cls(1, [cls(2, [cls(3)])], cls(4, child=cls(5)))
+    assert cls(**raw_tree) == expected
+    assert cls.from_dict(raw_tree) == expected
+
+
+def test_that_trusted_level_skips_checks():
+    telemetry = TrustedTelemetry.from_dict({
+        'source': 1,
+        'readings': ['a', None],
+        'points': [{'x': 1.0, 'y': 2.0}, Point(3.0, 4.0)],
+        'origin': {'x': 0.0, 'y': 0.0},
+    })
+    assert telemetry == TrustedTelemetry(
+        1, ['a', None], [Point(1.0, 2.0), Point(3.0, 4.0)], Point(0.0, 0.0))
+    assert telemetry.validation_level() is ValidationLevel.Trusted
+
+
+def test_that_trusted_level_keeps_unexpected_values():
+    telemetry = TrustedTelemetry('a', points='p', origin='o')
+    assert telemetry.points == 'p'
+    assert telemetry.origin == 'o'
+
+
+def test_that_the_level_of_a_call_overrides_the_classes():
+    raw_telemetry = {'source': 1, 'origin': {'x': 'a', 'y': 0.0}}
+    with pytest.raises(TypeError):
+        Telemetry.from_dict(raw_telemetry)
+
+    telemetry = Telemetry.from_dict(raw_telemetry,
+                                    validation_level=ValidationLevel.Trusted)
+    assert telemetry.validation_level() is ValidationLevel.Trusted
+    assert telemetry.origin.validation_level() is ValidationLevel.Trusted
+    assert telemetry.origin.x == 'a'
+
+    telemetry = TrustedTelemetry.from_dict(
+        {'source': 'a'}, validation_level=ValidationLevel.Full)
+    assert telemetry.validation_level() is ValidationLevel.Full
+
+
+def test_that_the_level_of_a_call_is_reset():
+    Telemetry.from_dict({'source': 'a'},
+                        validation_level=ValidationLevel.Trusted)
+    assert current_level.get() is None
+    assert Telemetry('a').validation_level() is ValidationLevel.Full
+
+    with pytest.raises(TypeError):
+        Telemetry.from_dict({'source': 'a', 'origin': {}},
+                            validation_level=ValidationLevel.Trusted)
+    assert current_level.get() is None
+
+
+def test_that_invalid_levels_raise():
+    with pytest.raises(ValueError, match='Invalid validation level'):
+        Telemetry.from_dict({'source': 'a'}, validation_level='Trusted')
+
+
+def test_that_every_decoding_method_takes_a_level():
+    trusted = ValidationLevel.Trusted
+    results = [
+        Telemetry.from_json('{"source": 1}', validation_level=trusted),
+        *Telemetry.from_dicts([{'source': 1}], validation_level=trusted),
+        *Telemetry.from_json_array('[{"source": 1}]',
+                                   validation_level=trusted),
+        *Telemetry.from_json_lines('{"source": 1}\n',
+                                   validation_level=trusted),
+        *Telemetry.iter_jsonl(io.StringIO('{"source": 1}\n'),
+                              validation_level=trusted),
+        *Telemetry.iter_json_array(io.StringIO('[{"source": 1}]'),
+                                   validation_level=trusted),
+    ]
+    assert [telemetry.source for telemetry in results] == [1] * 6
+
+
+def test_that_generated_decoders_honour_the_level_of_a_call():
+    assert CodegenPoint._can_bypass_init()
+    point = CodegenPoint.from_dict({'x': 'a', 'y': 0.0},
+                                   validation_level=ValidationLevel.Trusted)
+    assert point.x == 'a'
+    assert point.validation_level() is ValidationLevel.Trusted
+
+
+def test_that_other_class_levels_do_not_bypass_init():
+    assert not SampledTelemetry._can_bypass_init()
+
+
+def test_that_lazy_fields_are_checked_at_the_level_of_the_instance():
+    lazy = LazyTelemetry.from_dict({'origin': {'x': 'a', 'y': 0.0}},
+                                   validation_level=ValidationLevel.Trusted)
+    assert lazy.origin.x == 'a'
+    assert lazy.origin.validation_level() is ValidationLevel.Trusted
+
+    lazy = LazyTelemetry.from_dict({'origin': {'x': 'a', 'y': 0.0}})
+    with pytest.raises(TypeError):
+        lazy.origin
@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+from typed_json_dataclass import TypedJsonMixin
+
+
+@dataclass
+class Point(TypedJsonMixin):
+    x: int
+    y: int
+
+
+@dataclass
+class Point3D(Point):
+    z: int = 0
+
+
+@dataclass
+class Polygon(TypedJsonMixin):
+    points: List[Point]
+
+
+def test_that_plan_is_built_once_per_class(monkeypatch):
+    Point(1, 2)
+    plan = Point._validation_plan()
+
+    def fail(field_def):
+        raise AssertionError('plan should not be compiled again')
+
+    monkeypatch.setattr(Point, '_compile_field_checker', fail)
+    Point(3, 4)
+    assert Point._validation_plan() is plan
+    assert [name for name, _ in plan] == ['x', 'y']
+
+
+def test_that_subclasses_get_their_own_plan():
+    Point(1, 2)
+    Point3D(1, 2, 3)
+    assert [name for name, _ in Point3D._validation_plan()] == ['x', 'y', 'z']
+    assert Point3D._validation_plan() is not Point._validation_plan()
+
+
+def test_that_subclass_plan_still_validates_inherited_fields():
+    with pytest.raises(TypeError) as e_info:
+        Point3D('1', 2, 3)
+    assert ("Point3D.x is expected to be <class 'int'>, but value 1 with "
+            "type <class 'str'> was found instead") == str(e_info.value)
+
+
+def test_that_plan_converts_nested_lists_of_dicts():
+    polygon = Polygon.from_dict({'points': [{'x': 0, 'y': 0},
+                                            {'x': 1, 'y': 1}]})
+    assert polygon == Polygon([Point(0, 0), Point(1, 1)])
+
+
+@dataclass
+class Matrix(TypedJsonMixin):
+    rows: List[List[int]]
+
+
+def test_that_nested_lists_reject_non_list_rows():
+    with pytest.raises(TypeError):
+        Matrix([[1, 2], 3])
@@ -0,0 +1,173 @@
+import json
+import sys
+import types
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional, Set, Union
+
+import pytest
+from typed_json_dataclass import MappingMode, TypedJsonMixin, array_field, \
+    union_field
+from typed_json_dataclass.views import DataclassView, DictView, SequenceView
+
+
+@dataclass
+class PlainChild:
+    childName: str
+    child_value: Optional[int] = None
+
+
+@dataclass
+class Child(TypedJsonMixin):
+    child_name: str
+    child_value: Optional[int] = None
+
+
+@dataclass
+class KindChild(TypedJsonMixin):
+    kind: str
+
+
+@dataclass
+class Parent(TypedJsonMixin):
+    parent_name: str
+    child: Child = None
+    children: List[Child] = field(default_factory=list)
+    by_name: Dict[str, Child] = None
+    labels: Set[str] = None
+    readings: List[float] = array_field('d', default=None)
+    anything: object = None
+    pet: Union[Child, PlainChild, KindChild] = union_field('kind',
+                                                           default=None)
+
+
+INSTANCES = [
+    Parent('p'),
+    Parent('p', Child('c'), [Child('a'), Child('b', 2)],
+           {'some_key': Child('d')}, {'x'}, [0.5, 1.5], PlainChild('pc', 1)),
+    Parent('p', anything={'someKey': {'inner_key': [{'listKey': 1}]}}),
+    Parent('p', anything=OrderedDict([('some_key', Child('c'))])),
+    Parent('p', anything=(1, [Child('c')])),
+    Parent('p', anything={1: 'a', 'b_c': frozenset({2})}),
+    Parent('p', anything=1.5),
+    Parent('p', anything=Decimal('1.5')),
+    Parent('p', pet=Child('c')),
+    Parent('p', pet=PlainChild('pc')),
+    Parent('p', pet=KindChild('KindChild')),
+]
+
+
+def plain(value):
+    """Copy a view into the dicts and lists that to_dict returns"""
+    if isinstance(value, Mapping):
+        return {k: plain(v) for k, v in value.items()}
+    if isinstance(value, SequenceView):
+        return [plain(v) for v in value]
+    return value
+
+
+@pytest.mark.parametrize('instance', INSTANCES)
+@pytest.mark.parametrize('keep_none', [True, False])
+@pytest.mark.parametrize('mapping_mode', list(MappingMode))
+def test_that_views_match_to_dict(instance, keep_none, mapping_mode):
+    expected = instance.to_dict(keep_none=keep_none,
+                                mapping_mode=mapping_mode)
+    view = instance.to_mapping_view(keep_none=keep_none,
+                                    mapping_mode=mapping_mode)
+    assert view == expected
+    assert list(view) == list(expected)
+    assert len(view) == len(expected)
+    assert json.dumps(plain(view), default=str) == json.dumps(expected,
+                                                               default=str)
+    for key in expected:
+        assert key in view
+        assert view[key] == expected[key]
+
+
+def test_that_views_are_read_only_and_live():
+    parent = Parent('p', Child('c'))
+    view = parent.to_mapping_view()
+    assert 'child' in view and 'anything' not in view
+    with pytest.raises(KeyError):
+        view['anything']
+    with pytest.raises(KeyError):
+        view['unknown']
+    with pytest.raises(TypeError):
+        view['parent_name'] = 'q'
+
+    parent.anything = 1
+    assert view['anything'] == 1
+    assert isinstance(view['child'], DataclassView)
+    assert view['child']['child_value'] is None
+
+
+def test_that_containers_are_viewed():
+    parent = Parent('p', children=[Child('a'), Child('b')],
+                    by_name={'first_child': Child('a')}, readings=[0.5])
+    view = parent.to_mapping_view(mapping_mode=MappingMode.CamelCase)
+    children = view['children']
+    assert isinstance(children, SequenceView)
+    assert children[1] == {'child_name': 'b', 'child_value': None}
+    assert children[:1] == [{'child_name': 'a', 'child_value': None}]
+    assert children == SequenceView(parent.children)
+    assert children != 'ab'
+    assert isinstance(view['byName'], DictView)
+    assert view['byName']['first_child'] == {'childName': 'a',
+                                             'childValue': None}
+    by_name = view['byName']
+    assert by_name['first_child'] is not by_name['first_child']
+    assert list(by_name) == ['first_child']
+    assert list(parent.to_mapping_view()['by_name']) == ['first_child']
+    assert parent.to_mapping_view()['by_name']['first_child']['child_name'] \
+        == 'a'
+    assert len(by_name) == 1
+    assert view['readings'] == [0.5]
+    assert isinstance(view['readings'], SequenceView)
+
+
+class FakeNdarray(list):
+    def tolist(self):
+        return list(self)
+
+
+def test_that_numpy_arrays_become_lists(monkeypatch):
+    module = types.ModuleType('numpy')
+    module.ndarray = FakeNdarray
+    monkeypatch.setitem(sys.modules, 'numpy', module)
+
+    @dataclass
+    class Samples(TypedJsonMixin):
+        values: List[int] = array_field('q', numpy=True)
+
+    values = Samples(FakeNdarray([1, 2])).to_mapping_view()['values']
+    assert values == [1, 2]
+    assert type(values) is list
+
+
+def test_that_views_have_a_repr():
+    child = Child('c')
+    assert repr(child.to_mapping_view()) == f'DataclassView({child!r})'
+    assert repr(DictView({'a': 1}, None)) == "DictView({'a': 1})"
+    assert repr(SequenceView([1])) == 'SequenceView([1])'
+
+
+def test_that_views_are_sequences_and_mappings():
+    view = Parent('p', children=[Child('a')]).to_mapping_view()
+    assert isinstance(view, Mapping)
+    assert isinstance(view['children'], Sequence)
+    assert len(view.items()) == len(view)
+    assert ('parent_name', 'p') in view.items()
+
+
+def test_that_union_members_have_their_tags():
+    view = Parent('p', pet=Child('c')).to_mapping_view(
+        mapping_mode=MappingMode.CamelCase)
+    pet = view['pet']
+    assert list(pet) == ['kind', 'childName', 'childValue']
+    assert pet['kind'] == 'Child'
+    assert pet['childName'] == 'c'
+    assert len(pet) == 3
+    assert dict(pet.items()) == {'kind': 'Child', 'childName': 'c',
+                                 'childValue': None}
@@ -1,10 +1,35 @@
+from typed_json_dataclass.arrays import array_field
+from typed_json_dataclass.backends import (
+    JsonBackend,
+    get_backend,
+    register_backend,
+    set_default_backend,
+)
+from typed_json_dataclass.cache import invalidate_caches
+from typed_json_dataclass.errors import ValidationError
+from typed_json_dataclass.interning import InternTable, intern_field
+from typed_json_dataclass.slots import slotted
 from typed_json_dataclass.typed_json_dataclass import (
     TypedJsonMixin,
     MappingMode,
 )
+from typed_json_dataclass.unions import union_field
+from typed_json_dataclass.validation import ValidationLevel
 
 __version__ = '0.2.2'
 __all__ = [
     'TypedJsonMixin',
     'MappingMode',
+    'ValidationLevel',
+    'ValidationError',
+    'invalidate_caches',
+    'array_field',
+    'slotted',
+    'InternTable',
+    'intern_field',
+    'union_field',
+    'JsonBackend',
+    'get_backend',
+    'register_backend',
+    'set_default_backend',
 ]
@@ -0,0 +1,139 @@
+"""Compact storage of numeric list fields.
+
+A field declared with ``array_field`` is still described by a type hint like
+``List[float]``, but its json list is stored in an ``array.array``, or in a
+numpy array when numpy is installed. The elements are checked by the array
+conversion itself, in C, instead of one by one.
+
+numpy arrays compare element-wise, so the ``__eq__`` that dataclasses
+generates cannot compare them. Classes with numpy array fields compare them
+with ``numpy.array_equal`` instead, see ``numpy_fields_equal``.
+"""
+import array
+import importlib
+from dataclasses import Field, dataclass, field, fields
+
+# The key of the ArraySpec in the metadata of a field
+METADATA_KEY = 'typed_json_array'
+
+_FLOAT_TYPECODES = frozenset('fd')
+_INT_TYPECODES = frozenset('bBhHiIlLqQ')
+
+# The numpy dtype kinds that may be converted to a float or an int array
+_FLOAT_KINDS = frozenset('fiub')
+_INT_KINDS = frozenset('iub')
+
+
+@dataclass(frozen=True)
+class ArraySpec:
+    """How the elements of a numeric list field are stored.
+
+    :typecode: The ``array.array`` typecode of the elements, which is also
+               used as the numpy dtype
+    :numpy: Whether the elements are stored in a numpy array instead of an
+            ``array.array``
+    """
+    typecode: str
+    numpy: bool = False
+
+    def convert(self, values):
+        """Store a list of numbers in an array.
+
+        :values: The list of numbers
+        :returns: The array
+        :raises TypeError: If an element is not a number of the expected kind
+        :raises ValueError: If the elements do not form a flat list
+        :raises OverflowError: If an element does not fit the typecode
+        """
+        if not self.numpy:
+            return array.array(self.typecode, values)
+
+        numpy = importlib.import_module('numpy')
+        dtype = numpy.dtype(self.typecode)
+        if not values:
+            return numpy.empty(0, dtype)
+        # Let numpy infer the type of all elements at once, and only then
+        # check it, since converting to the dtype directly would accept
+        # strings of numbers
+        converted = numpy.array(values)
+        allowed_kinds = (_FLOAT_KINDS if self.typecode in _FLOAT_TYPECODES
+                         else _INT_KINDS)
+        if converted.ndim != 1 or converted.dtype.kind not in allowed_kinds:
+            raise TypeError(f'Cannot store {converted.dtype} values in a '
+                            f'{dtype} array')
+        return converted.astype(dtype)
+
+    def array_type(self):
+        """Return the class of the arrays of this spec."""
+        if self.numpy:
+            return importlib.import_module('numpy').ndarray
+        return array.array
+
+
+def array_field(typecode, *, numpy=False, **kwargs):
+    """Declare a numeric list field that is stored in an array.
+
+    The type hint of the field should still be ``List[int]`` or
+    ``List[float]``. ``to_dict`` turns the array back into a list.
+
+    :typecode: The ``array.array`` typecode of the elements, like ``'d'`` for
+               floats or ``'q'`` for 64 bit integers
+    :numpy: Store the elements in a numpy array instead of an
+            ``array.array``. Requires numpy to be installed
+    :kwargs: Passed on to ``dataclasses.field``
+    :returns: The field
+    :raises ValueError: If the typecode is not a numeric one
+    :raises ImportError: If numpy is requested but not installed
+    """
+    if typecode not in _FLOAT_TYPECODES | _INT_TYPECODES:
+        raise ValueError(f'Invalid numeric typecode {typecode!r}')
+    if numpy:
+        importlib.import_module('numpy')
+    metadata = dict(kwargs.pop('metadata', None) or {})
+    metadata[METADATA_KEY] = ArraySpec(typecode, numpy)
+    return field(metadata=metadata, **kwargs)
+
+
+def array_spec(field_def):
+    """Return the ArraySpec of a field, or None for regular fields."""
+    return field_def.metadata.get(METADATA_KEY)
+
+
+def has_numpy_fields(cls):
+    """Check whether a class declares or inherits numpy array fields.
+
+    This also works before the class is turned into a dataclass, when its
+    fields are still ``dataclasses.Field`` class attributes.
+    """
+    field_defs = [value for value in vars(cls).values()
+                  if isinstance(value, Field)]
+    field_defs += getattr(cls, '__dataclass_fields__', {}).values()
+    return any(spec is not None and spec.numpy
+               for spec in map(array_spec, field_defs))
+
+
+def numpy_fields_equal(self, other):
+    """The ``__eq__`` of dataclasses with numpy array fields.
+
+    Compares the same fields as the generated ``__eq__``, with the numpy
+    arrays compared by ``numpy.array_equal``.
+    """
+    if other.__class__ is not self.__class__:
+        return NotImplemented
+    for field_def in fields(self):
+        if not field_def.compare:
+            continue
+        value = getattr(self, field_def.name)
+        other_value = getattr(other, field_def.name)
+        if value is other_value:
+            continue
+        spec = array_spec(field_def)
+        if spec is not None and spec.numpy:
+            if value is None or other_value is None:
+                return False
+            numpy = importlib.import_module('numpy')
+            if not numpy.array_equal(value, other_value):
+                return False
+        elif not value == other_value:
+            return False
+    return True
@@ -0,0 +1,131 @@
+"""Registry of the json implementations that the mixin can use.
+
+The ``json`` module of the standard library is always available, and is the
+default. orjson, rapidjson and ujson can be selected when they are installed,
+or picked automatically with the ``'auto'`` backend. Other implementations can
+be added with ``register_backend``.
+"""
+import importlib
+import json
+from dataclasses import dataclass
+from typing import Callable
+
+# The backends tried by 'auto', from the fastest to the slowest
+_AUTO_PREFERENCE = ('orjson', 'rapidjson', 'ujson', 'json')
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    """A json implementation.
+
+    :name: The name the backend is selected with
+    :loads: Parses a json str or bytes
+    :dumps: Serializes an object to a json str
+    :dumps_bytes: Serializes an object to utf-8 encoded json bytes
+    """
+    name: str
+    loads: Callable
+    dumps: Callable
+    dumps_bytes: Callable
+
+
+def _stdlib_backend():
+    return JsonBackend('json', json.loads, json.dumps,
+                       lambda obj: json.dumps(obj).encode('utf-8'))
+
+
+# orjson and rapidjson only accept str keys unless told otherwise, and the
+# keys of Dict[int, V] and Dict[float, V] fields are numbers
+
+
+def _orjson_backend():
+    orjson = importlib.import_module('orjson')
+    option = orjson.OPT_NON_STR_KEYS
+    return JsonBackend('orjson', orjson.loads,
+                       lambda obj: orjson.dumps(obj,
+                                                option=option).decode('utf-8'),
+                       lambda obj: orjson.dumps(obj, option=option))
+
+
+def _rapidjson_backend():
+    rapidjson = importlib.import_module('rapidjson')
+    mapping_mode = rapidjson.MM_COERCE_KEYS_TO_STRINGS
+
+    def dumps(obj):
+        return rapidjson.dumps(obj, mapping_mode=mapping_mode)
+    return JsonBackend('rapidjson', rapidjson.loads, dumps,
+                       lambda obj: dumps(obj).encode('utf-8'))
+
+
+def _ujson_backend():
+    ujson = importlib.import_module('ujson')
+    return JsonBackend('ujson', ujson.loads, ujson.dumps,
+                       lambda obj: ujson.dumps(obj).encode('utf-8'))
+
+
+_FACTORIES = {
+    'json': _stdlib_backend,
+    'orjson': _orjson_backend,
+    'rapidjson': _rapidjson_backend,
+    'ujson': _ujson_backend,
+}
+
+_backends = {}
+_default_name = 'json'
+
+
+def register_backend(backend):
+    """Make a backend available under its name.
+
+    :backend: The JsonBackend to register, replacing any backend that was
+              registered under the same name
+    """
+    _backends[backend.name] = backend
+
+
+def get_backend(name=None):
+    """Return the backend with the given name.
+
+    The optional backends are imported on first use.
+
+    :name: The name of the backend, ``'auto'`` for the fastest installed one,
+           or None for the default backend
+    :returns: The JsonBackend
+    :raises ValueError: If there is no backend with that name
+    :raises ImportError: If the backend is not installed
+    """
+    if name is None:
+        name = _default_name
+    try:
+        return _backends[name]
+    except KeyError:
+        pass
+
+    if name == 'auto':
+        for candidate in _AUTO_PREFERENCE[:-1]:
+            try:
+                backend = get_backend(candidate)
+            except ImportError:
+                continue
+            break
+        else:
+            backend = get_backend(_AUTO_PREFERENCE[-1])
+    else:
+        try:
+            factory = _FACTORIES[name]
+        except KeyError:
+            raise ValueError(f'Unknown json backend {name!r}') from None
+        backend = factory()
+    _backends[name] = backend
+    return backend
+
+
+def set_default_backend(name):
+    """Set the backend used by classes that did not select one.
+
+    :name: The name of the backend, or ``'auto'`` for the fastest installed
+           one
+    """
+    global _default_name
+    get_backend(name)
+    _default_name = name
@@ -0,0 +1,97 @@
+"""Encoding of many instances into one json document.
+
+The instances are encoded in chunks, so that the output can be written
+while it is produced, and so that the chunks can be encoded by a pool of
+threads when the json backend releases the GIL.
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from typed_json_dataclass.codegen import serializer_for
+from typed_json_dataclass.utils import iter_batches
+
+
+def iter_encoded(instances, *, dumps, keep_none, format_method, lines,
+                 chunk_size, workers=None):
+    """Encode instances as a json array or as json lines, piece by piece.
+
+    For an array, each chunk is encoded with a single call of ``dumps``, and
+    the chunks are joined with the separator ``dumps`` puts between list
+    elements, so the output is the same as dumping all dicts at once.
+
+    :instances: An iterable of dataclass instances
+    :dumps: The function that encodes a dict or list as json str or bytes
+    :keep_none: Whether fields that are None are kept
+    :format_method: The function to rename keys with, or None
+    :lines: Produce json lines instead of an array
+    :chunk_size: The number of instances encoded at once
+    :workers: The number of threads that encode chunks, or None to encode
+              them in the calling thread. Only a few chunks per thread are
+              in flight at any time, so that the instances are not read
+              into memory all at once
+    :returns: An iterator of the parts of the output, as str or bytes
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+
+    # Learn the brackets and the separator of lists from the backend, this
+    # also tells whether it produces str or bytes
+    sample = dumps([0, 0])
+    newline = '\n' if isinstance(sample, str) else b'\n'
+
+    def serialize_all(chunk):
+        return [serializer_for(type(instance), keep_none,
+                               format_method)(instance)
+                for instance in chunk]
+
+    if lines:
+        def encode(chunk):
+            return newline.join([dumps(raw_dict)
+                                 for raw_dict in serialize_all(chunk)]) + \
+                newline
+    else:
+        def encode(chunk):
+            return dumps(serialize_all(chunk))[1:-1]
+
+    chunks = iter_batches(instances, chunk_size)
+    if workers is None:
+        yield from _join(map(encode, chunks), sample, lines)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from _join(_encode_in_pool(executor, encode, chunks,
+                                         2 * workers), sample, lines)
+
+
+def _encode_in_pool(executor, encode, chunks, max_in_flight):
+    """Encode chunks in a pool, in order, with a bounded number in flight.
+
+    :executor: The executor to encode the chunks with
+    :encode: The function that encodes a chunk
+    :chunks: An iterator of chunks of instances
+    :max_in_flight: The number of chunks submitted but not yet yielded
+    :returns: An iterator of the encoded chunks
+    """
+    in_flight = deque()
+    try:
+        for chunk in chunks:
+            in_flight.append(executor.submit(encode, chunk))
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+def _join(encoded_chunks, sample, lines):
+    """Add the brackets and separators of an array around encoded chunks."""
+    if lines:
+        yield from encoded_chunks
+        return
+
+    separator = sample[2:-2]
+    yield sample[:1]
+    for i, encoded_chunk in enumerate(encoded_chunks):
+        yield separator + encoded_chunk if i else encoded_chunk
+    yield sample[-1:]
@@ -0,0 +1,38 @@
+"""Storage for everything that is computed once per class.
+
+The validation plans, the generated functions and the results of checks that
+only depend on the class definition are kept in a dict on each class.
+"""
+import weakref
+
+# Every class that has a cache, so that all of them can be invalidated
+_classes_with_cache = weakref.WeakSet()
+
+
+def class_cache(cls):
+    """Return the dict that holds everything cached for ``cls``.
+
+    The dict is looked up in the ``__dict__`` of the class rather than
+    inherited, so that subclasses get their own cache.
+
+    :cls: The class to get the cache for
+    :returns: The cache of the class, created if needed
+    """
+    cache = cls.__dict__.get('_typed_json_cache')
+    if cache is None:
+        cache = {}
+        cls._typed_json_cache = cache
+        _classes_with_cache.add(cls)
+    return cache
+
+
+def invalidate_caches():
+    """Drop everything that was cached for any class.
+
+    This is only needed when a class is changed after it has been used, for
+    example by adding fields to it. Since classes embed the generated
+    functions of the classes they refer to, the caches of all classes are
+    dropped, and rebuilt on their next use.
+    """
+    for cls in list(_classes_with_cache):
+        cls.__dict__['_typed_json_cache'].clear()
@@ -0,0 +1,324 @@
+"""Generation of specialised per-class functions.
+
+Like ``dataclasses`` does for ``__init__`` and friends, the functions in here
+build the source code of a function for one particular class and ``exec`` it,
+so that the resulting function only contains straight-line code for the
+fields of that class.
+"""
+from dataclasses import MISSING, fields
+
+from typed_json_dataclass.arrays import array_spec
+from typed_json_dataclass.cache import class_cache
+from typed_json_dataclass.containers import dict_depth
+from typed_json_dataclass.interning import intern_table
+from typed_json_dataclass.unions import member_tags
+from typed_json_dataclass.utils import recursive_rename
+from typed_json_dataclass.validation import current_level
+
+
+def _create_fn(name, args, body, namespace):
+    """Compile a function called ``name`` and return it.
+
+    :name: The name of the function
+    :args: The argument list of the function, as source code
+    :body: The lines of the body of the function, without indentation
+    :namespace: The globals the function is executed with
+    :returns: The compiled function
+    """
+    body = '\n'.join(f'    {line}' for line in body)
+    source = f'def {name}({args}):\n{body}\n'
+    local_vars = {}
+    exec(source, namespace, local_vars)
+    return local_vars[name]
+
+
+def _is_primitive(field_type):
+    """Check whether a value of ``field_type`` can be checked inline.
+
+    A value whose class is exactly the expected type always passes the
+    validation plan, as long as that type is not a collection that the plan
+    looks into.
+    """
+    return (isinstance(field_type, type) and
+            not issubclass(field_type, (list, dict)) and
+            not hasattr(field_type, '__dataclass_fields__'))
+
+
+def build_from_dict(cls, *, format_method, known_names, field_rules,
+                    nested_decoders, bypass_init):
+    """Generate a ``from_dict`` function for ``cls``.
+
+    The generated function renames the keys of the raw dict with
+    ``format_method`` (if any) using the table of known names, and
+    either calls the dataclass ``__init__`` or, when ``bypass_init`` is set,
+    assigns the fields itself and runs the full validation plan of ``cls``
+    inline.
+    Anything the inline code does not expect, such as missing or unexpected
+    keys, is handed to ``cls(**raw_dict)`` so that the error raised is exactly
+    the one of a regular instantiation.
+
+    :cls: The dataclass to generate the function for
+    :format_method: The function to rename keys with, or None
+    :known_names: A dict from the expected raw keys to the field names
+    :field_rules: A dict from field name to the RenameRule of the dicts of
+                  the field, see ``utils.RenameRule``
+    :nested_decoders: A dict from field name to the generated ``from_dict``
+                      of the nested dataclass, using the same format method
+    :bypass_init: Whether the function may skip ``__init__`` and
+                  ``__post_init__``
+    :returns: The generated function
+    """
+    namespace = {
+        '_cls': cls,
+        '_MISSING': MISSING,
+        '_new': object.__new__,
+        '_object_setattr': object.__setattr__,
+        '_format': format_method,
+        '_rename': recursive_rename,
+        '_rules': field_rules,
+        '_nested': frozenset(nested_decoders),
+        '_current_level': current_level.get,
+    }
+    body = []
+
+    if format_method is None:
+        body.append('kwargs = raw_dict')
+    else:
+        namespace['_names'] = known_names
+        body += [
+            'kwargs = {}',
+            'for key, value in raw_dict.items():',
+            '    name = _names.get(key)',
+            '    if name is None:',
+            '        name = _format(key)',
+            '    if name not in _nested and isinstance(value, dict):',
+            '        value = _rename(value, _format, None, _rules.get(name))',
+            '    kwargs[name] = value',
+        ]
+
+    if not bypass_init:
+        body.append('return _cls(**kwargs)')
+        return _create_fn('from_dict', 'raw_dict', body, namespace)
+
+    frozen = cls.__dataclass_params__.frozen
+    plan = dict(cls._validation_plan())
+    fields_defs = fields(cls)
+    required = sum(field_def.default is MISSING and
+                   field_def.default_factory is MISSING
+                   for field_def in fields_defs)
+
+    # The inline checks are the ones of the full validation level, so a call
+    # at any other level goes through __post_init__
+    body += [
+        'if kwargs.__class__ is not dict or _current_level() is not None:',
+        '    return _cls(**kwargs)',
+        f'found = {required}',
+    ]
+    for i, field_def in enumerate(fields_defs):
+        value = f'v{i}'
+        body.append(f'{value} = kwargs.get({field_def.name!r}, _MISSING)')
+        if field_def.default is not MISSING:
+            namespace[f'_default{i}'] = field_def.default
+            body += [f'if {value} is _MISSING:',
+                     f'    {value} = _default{i}',
+                     'else:',
+                     '    found += 1']
+        elif field_def.default_factory is not MISSING:
+            namespace[f'_factory{i}'] = field_def.default_factory
+            body += [f'if {value} is _MISSING:',
+                     f'    {value} = _factory{i}()',
+                     'else:',
+                     '    found += 1']
+        else:
+            body += [f'if {value} is _MISSING:',
+                     '    return _cls(**kwargs)']
+    body += [
+        'if found != len(kwargs):',
+        '    return _cls(**kwargs)',
+        'self = _new(_cls)',
+    ]
+    for i, field_def in enumerate(fields_defs):
+        if frozen:
+            body.append(f'_object_setattr(self, {field_def.name!r}, v{i})')
+        else:
+            body.append(f'self.{field_def.name} = v{i}')
+
+    # Run the checks in field order, just like __post_init__ would
+    for i, field_def in enumerate(fields_defs):
+        value = f'v{i}'
+        namespace[f'_check{i}'] = plan[field_def.name]
+        if field_def.name in nested_decoders:
+            namespace[f'_decode{i}'] = nested_decoders[field_def.name]
+            set_value = (f'_object_setattr(self, {field_def.name!r}, '
+                         f'{value})' if frozen
+                         else f'self.{field_def.name} = {value}')
+            body += [
+                f'if {value} is not None:',
+                f'    if isinstance({value}, dict):',
+                '        try:',
+                f'            {value} = _decode{i}({value})',
+                '        except TypeError:',
+                f'            _check{i}(self, _rename({value}, _format, None, '
+                f'_rules.get({field_def.name!r})))',
+                '        else:',
+                f'            {set_value}',
+                '    else:',
+                f'        _check{i}(self, {value})',
+            ]
+        elif (_is_primitive(field_def.type) and
+                intern_table(cls, field_def) is None):
+            namespace[f'_type{i}'] = field_def.type
+            body += [
+                f'if ({value} is not None and '
+                f'{value}.__class__ is not _type{i}):',
+                f'    _check{i}(self, {value})',
+            ]
+        else:
+            body += [f'if {value} is not None:',
+                     f'    _check{i}(self, {value})']
+    body.append('return self')
+    return _create_fn('from_dict', 'raw_dict', body, namespace)
+
+
+# Values of these classes are immutable, so they can be put in the resulting
+# dict as they are
+_ATOMIC = frozenset({str, int, float, bool, type(None)})
+
+
+def to_builtin(value, format_method, keep_keys=0):
+    """Convert a value into dicts, lists and primitives.
+
+    This behaves like ``dataclasses.asdict`` followed by ``recursive_rename``,
+    but in a single pass and without deep copying the values that are not
+    containers. Sets and frozensets become lists. Like ``recursive_rename``,
+    keys are only renamed in dicts that are reached through other dicts, and
+    never inside of lists.
+
+    :value: The value to convert
+    :format_method: The function to rename keys with, or None
+    :keep_keys: The number of levels of dicts whose keys are kept, for the
+                values of typed dicts, see ``containers.dict_depth``
+    :returns: The converted value
+    """
+    value_type = value.__class__
+    if value_type in _ATOMIC:
+        return value
+    if hasattr(value_type, '__dataclass_fields__'):
+        return serializer_for(value_type, True, format_method)(value)
+    if isinstance(value, (list, tuple)):
+        elements = [to_builtin(v, None) for v in value]
+        if value_type is list:
+            return elements
+        if hasattr(value, '_fields'):
+            # namedtuples take the elements as separate arguments
+            return value_type(*elements)
+        return value_type(elements)
+    if isinstance(value, (set, frozenset)):
+        # JSON has no sets, so they become lists
+        return [to_builtin(v, None) for v in value]
+    if isinstance(value, dict):
+        if format_method is None:
+            return value_type((to_builtin(k, None), to_builtin(v, None))
+                              for k, v in value.items())
+        if keep_keys:
+            return {k: to_builtin(v, format_method, keep_keys - 1)
+                    for k, v in value.items()}
+        # Only str keys can be names, other keys like ints are kept
+        return {format_method(k) if k.__class__ is str else k:
+                to_builtin(v, format_method)
+                for k, v in value.items()}
+    return value
+
+
+def serializer_for(cls, keep_none, format_method):
+    """Return the generated ``to_dict`` function of a dataclass.
+
+    The functions are generated on first use and stored on the class.
+
+    :cls: The dataclass to serialize
+    :keep_none: Whether fields that are None are kept
+    :format_method: The function to rename keys with, or None
+    :returns: A function that takes an instance and returns a dict
+    """
+    key = ('to_dict', keep_none, format_method)
+    try:
+        return cls.__dict__['_typed_json_cache'][key]
+    except KeyError:
+        serializer = build_to_dict(cls, keep_none=keep_none,
+                                   format_method=format_method)
+        class_cache(cls)[key] = serializer
+        return serializer
+
+
+def build_to_dict(cls, *, keep_none, format_method):
+    """Generate a ``to_dict`` function for ``cls``.
+
+    The output key of every field is computed once, and only fields whose
+    type is not known in advance go through ``to_builtin``. Arrays are turned
+    back into lists with ``tolist``. Nested dataclasses
+    always keep their None fields, just like with ``asdict``. The keys of
+    typed dicts are not renamed. The dicts of
+    the members of ``union_field`` fields get their discriminator added, see
+    ``unions.member_tags``.
+
+    :cls: The dataclass to generate the function for
+    :keep_none: Whether fields that are None are kept
+    :format_method: The function to rename keys with, or None
+    :returns: The generated function
+    """
+    namespace = {
+        '_ATOMIC': _ATOMIC,
+        '_format': format_method,
+        '_to_builtin': to_builtin,
+    }
+    body = ['result = {}']
+    for i, field_def in enumerate(fields(cls)):
+        value = f'v{i}'
+        key = field_def.name
+        if format_method is not None:
+            key = format_method(key)
+        field_type = field_def.type
+        spec = array_spec(field_def)
+        tagging = member_tags(cls, field_def)
+
+        if spec is not None:
+            namespace[f'_array{i}'] = spec.array_type()
+            expression = (f'{value}.tolist() '
+                          f'if isinstance({value}, _array{i}) '
+                          f'else _to_builtin({value}, _format)')
+        elif (isinstance(field_type, type) and
+                hasattr(field_type, '__dataclass_fields__')):
+            namespace[f'_type{i}'] = field_type
+            namespace[f'_serialize{i}'] = serializer_for(field_type, True,
+                                                         format_method)
+            expression = (f'_serialize{i}({value}) '
+                          f'if {value}.__class__ is _type{i} '
+                          f'else _to_builtin({value}, _format)')
+        elif tagging is not None and tagging[1]:
+            discriminator, namespace[f'_tags{i}'] = tagging
+            if format_method is not None:
+                discriminator = format_method(discriminator)
+            expression = (f'{{{discriminator!r}: _tags{i}[{value}.__class__], '
+                          f'**_to_builtin({value}, _format)}} '
+                          f'if {value}.__class__ in _tags{i} '
+                          f'else _to_builtin({value}, _format)')
+        elif format_method is not None and dict_depth(field_type):
+            expression = (f'_to_builtin({value}, _format, '
+                          f'{dict_depth(field_type)})')
+        elif getattr(field_type, '__origin__', None) is list:
+            expression = (f'[e if e.__class__ in _ATOMIC '
+                          f'else _to_builtin(e, None) for e in {value}] '
+                          f'if {value}.__class__ is list '
+                          f'else _to_builtin({value}, _format)')
+        else:
+            expression = (f'{value} if {value}.__class__ in _ATOMIC '
+                          f'else _to_builtin({value}, _format)')
+
+        body.append(f'{value} = self.{field_def.name}')
+        if keep_none:
+            body.append(f'result[{key!r}] = {expression}')
+        else:
+            body += [f'if {value} is not None:',
+                     f'    result[{key!r}] = {expression}']
+    body.append('return result')
+    return _create_fn('to_dict', 'self', body, namespace)
@@ -0,0 +1,333 @@
+"""Checking and converting values of Dict, Tuple, Set and FrozenSet fields.
+
+JSON only has objects and arrays, so the values of these fields are decoded
+as dicts and lists. The type hint of such a field is compiled once into a
+Converter, whose function takes a value and returns it converted to the
+type hint: lists become tuples, sets or frozensets, dicts of nested
+dataclasses become instances, and the str keys of ``Dict[int, V]`` become
+ints. Elements of plain types like str or int are checked in bulk, and a
+value that already matches its type hint is returned as it is.
+"""
+import typing
+from collections import namedtuple
+
+from typed_json_dataclass.unions import optional_member
+
+# The origins of the type hints compiled here
+CONTAINER_ORIGINS = frozenset({dict, tuple, set, frozenset})
+
+# Type hints that name a collection without the types of its elements
+NATIVE_COLLECTIONS = frozenset({dict, list, set, tuple, frozenset})
+
+# Key types that JSON objects can only hold as strings
+_NUMERIC_KEYS = frozenset({int, float})
+
+# The values that sets are created from
+_ITERABLES = (list, tuple, set, frozenset)
+
+# A compiled type hint. ``types`` is a tuple of the classes whose instances
+# match the type hint as they are, or None if values need to be converted.
+# ``convert`` takes a value and returns it converted, or raises Mismatch
+Converter = namedtuple('Converter', ['types', 'convert'])
+
+
+class Mismatch(Exception):
+    """Raised by converters for values that do not match their type hint.
+
+    :reason: The error that caused the mismatch, or None
+    :location: The indexes and keys of the element that did not match, like
+               ``"['a'][0]"``, or an empty str for the value itself
+    """
+
+    def __init__(self, reason=None):
+        super().__init__(reason)
+        self.reason = reason
+        self.location = ''
+
+    def within(self, index):
+        """Prepend the index or key of an enclosing element to the location.
+
+        :index: The index or key
+        :returns: The Mismatch itself
+        """
+        self.location = f'[{index!r}]{self.location}'
+        return self
+
+
+class UnsupportedHint(Exception):
+    """Raised for type hints that values cannot be checked against.
+
+    :native: Whether the type hint uses a native Python collection like
+             ``dict``, instead of leaving out the types of the elements of a
+             typing collection like ``Dict``
+    """
+
+    def __init__(self, native):
+        super().__init__(native)
+        self.native = native
+
+
+def is_container(field_type):
+    """Check whether a type hint is a Dict, Tuple, Set or FrozenSet.
+
+    Lists of these, like ``List[Dict[str, int]]``, are containers as well.
+    """
+    while getattr(field_type, '__origin__', None) is list:
+        # A bare List has no __args__ on later Python versions
+        field_type = getattr(field_type, '__args__', (None,))[0]
+    return getattr(field_type, '__origin__', None) in CONTAINER_ORIGINS
+
+
+def dict_depth(hint):
+    """Return the number of levels of typed dicts that a type hint nests.
+
+    The keys of these dicts are data rather than names, so mapping modes do
+    not rename them. ``Optional`` levels are looked through.
+
+    :hint: The type hint
+    :returns: 1 for ``Dict[str, int]``, 2 for ``Dict[str, Dict[str, int]]``
+              and 0 for type hints that are not a Dict
+    """
+    depth = 0
+    while True:
+        hint = optional_member(hint) or hint
+        if (getattr(hint, '__origin__', None) is not dict or
+                not getattr(hint, '__args__', None)):
+            return depth
+        depth += 1
+        hint = hint.__args__[1]
+
+
+def _identity(value):
+    return value
+
+
+def compile_converter(hint, resolve, check_types=True):
+    """Compile a type hint into a Converter.
+
+    :hint: The type hint
+    :resolve: A function that takes a type hint and returns a tuple of the
+              dataclass it stands for and the function that turns dicts into
+              that dataclass, or None for other type hints
+    :check_types: Whether values are checked, or only converted, which is
+                  what the trusted level does
+    :returns: The Converter
+    :raises UnsupportedHint: If the type hint contains a native collection
+                             or a collection without element types
+    """
+    if hint is typing.Any:
+        return Converter((object,), _identity)
+    target = resolve(hint)
+    if target is not None:
+        return _dataclass_converter(*target, check_types)
+    if isinstance(hint, typing.ForwardRef):
+        return _name_converter(hint.__forward_arg__, check_types)
+    if hint in NATIVE_COLLECTIONS:
+        raise UnsupportedHint(native=True)
+    if isinstance(hint, typing.TypeVar) or hint is typing.Tuple:
+        raise UnsupportedHint(native=False)
+
+    origin = getattr(hint, '__origin__', None)
+    if origin is None:
+        return _type_converter(hint, check_types)
+    args = getattr(hint, '__args__', None)
+    if origin is typing.Union:
+        return _union_converter(
+            [compile_converter(arg, resolve, check_types) for arg in args],
+            check_types)
+    if origin is tuple:
+        if args == ((),):
+            # Tuple[()] on Python 3.7
+            args = ()
+        if len(args) == 2 and args[1] is Ellipsis:
+            return _sequence_converter(
+                tuple, compile_converter(args[0], resolve, check_types),
+                check_types)
+        return _fixed_tuple_converter(
+            [compile_converter(arg, resolve, check_types) for arg in args])
+    if not args or any(isinstance(arg, typing.TypeVar) for arg in args):
+        raise UnsupportedHint(native=False)
+    if origin is dict:
+        return _dict_converter(
+            args[0], compile_converter(args[0], resolve, check_types),
+            compile_converter(args[1], resolve, check_types), check_types)
+    if origin in (list, set, frozenset):
+        return _sequence_converter(
+            origin, compile_converter(args[0], resolve, check_types),
+            check_types)
+    # Other generics are only checked against their origin
+    return _type_converter(origin, check_types)
+
+
+def _type_converter(types, check_types):
+    # A type, or a tuple of the types of the members of a Union
+    if not isinstance(types, tuple):
+        types = (types,)
+    if not check_types:
+        return Converter(types, _identity)
+
+    def convert(value):
+        if isinstance(value, types):
+            return value
+        raise Mismatch()
+    return Converter(types, convert)
+
+
+def _name_converter(name, check_types):
+    # A ForwardRef to another class is compared by name
+    def convert(value):
+        if check_types and value.__class__.__name__ != name:
+            raise Mismatch()
+        return value
+    return Converter(None, convert)
+
+
+def _dataclass_converter(expected_type, construct, check_types):
+    def convert(value):
+        if isinstance(value, dict):
+            try:
+                return construct(value)
+            except TypeError as e:
+                raise Mismatch(e) from None
+        if check_types and not isinstance(value, expected_type):
+            raise Mismatch()
+        return value
+    return Converter(None, convert)
+
+
+def _union_converter(members, check_types):
+    types = ()
+    converters = []
+    for member in members:
+        if member.types is not None:
+            types += member.types
+        else:
+            converters.append(member.convert)
+    if not converters:
+        return _type_converter(types, check_types)
+
+    def convert(value):
+        if types and isinstance(value, types):
+            return value
+        reason = None
+        for member_convert in converters:
+            try:
+                return member_convert(value)
+            except Mismatch as e:
+                reason = e.reason or reason
+        raise Mismatch(reason)
+    return Converter(None, convert)
+
+
+def _sequence_converter(sequence_type, element, check_types):
+    # Lists, variadic tuples, sets and frozensets
+    accepted = list if sequence_type is list else _ITERABLES
+
+    if element.types is not None:
+        element_types = element.types
+
+        def convert(value):
+            if not isinstance(value, accepted):
+                raise Mismatch()
+            if check_types and not all(isinstance(v, element_types)
+                                       for v in value):
+                raise Mismatch()
+            if value.__class__ is sequence_type:
+                return value
+            try:
+                return sequence_type(value)
+            except TypeError as e:
+                # Unhashable elements of sets
+                raise Mismatch(e) from None
+        return Converter(None, convert)
+
+    convert_element = element.convert
+
+    def convert_elements(value):
+        if not isinstance(value, accepted):
+            raise Mismatch()
+        elements = iter(value)
+        try:
+            converted = [convert_element(v) for v in elements]
+        except Mismatch as e:
+            raise e.within(failed_index(elements, len(value)))
+        try:
+            return sequence_type(converted)
+        except TypeError as e:
+            raise Mismatch(e) from None
+    return Converter(None, convert_elements)
+
+
+def _fixed_tuple_converter(elements):
+    length = len(elements)
+    converters = [element.convert for element in elements]
+
+    def convert(value):
+        if not isinstance(value, (list, tuple)) or len(value) != length:
+            raise Mismatch()
+        pairs = zip(converters, value)
+        try:
+            return tuple([convert_element(v)
+                          for convert_element, v in pairs])
+        except Mismatch as e:
+            raise e.within(failed_index(pairs, length))
+    return Converter(None, convert)
+
+
+def _dict_converter(key_type, key, value, check_types):
+    if key_type in _NUMERIC_KEYS:
+        key = _numeric_key_converter(key_type)
+
+    if key.types is not None and value.types is not None:
+        key_types = key.types
+        value_types = value.types
+
+        def convert(raw):
+            if not isinstance(raw, dict):
+                raise Mismatch()
+            if check_types and not (
+                    all(isinstance(k, key_types) for k in raw) and
+                    all(isinstance(v, value_types) for v in raw.values())):
+                raise Mismatch()
+            return raw
+        return Converter(None, convert)
+
+    convert_key = key.convert
+    convert_value = value.convert
+
+    def convert_items(raw):
+        if not isinstance(raw, dict):
+            raise Mismatch()
+        items = iter(raw.items())
+        try:
+            return {convert_key(k): convert_value(v) for k, v in items}
+        except Mismatch as e:
+            raise e.within(list(raw)[failed_index(items, len(raw))])
+    return Converter(None, convert_items)
+
+
+def failed_index(elements, length):
+    """Return the index of the element that a conversion failed at.
+
+    The elements are converted from an iterator, which stops right after
+    the failing one, so that the successful conversions stay comprehensions.
+
+    :elements: The iterator of the remaining elements
+    :length: The number of elements
+    """
+    return length - sum(1 for _ in elements) - 1
+
+
+def _numeric_key_converter(key_type):
+    # json.dumps writes int and float keys as strings, which are converted
+    # back here
+    def convert(key):
+        if key.__class__ is key_type:
+            return key
+        if key.__class__ is str:
+            try:
+                return key_type(key)
+            except ValueError as e:
+                raise Mismatch(e) from None
+        raise Mismatch()
+    return Converter(None, convert)
@@ -0,0 +1,136 @@
+"""Encoding of an instance into json, piece by piece.
+
+``to_json`` builds the dicts of ``to_dict`` for the whole instance, and then
+the whole json string. The encoder in here walks a view of the instance
+instead, see ``views.py``, with a stack rather than recursion, and produces
+the json in chunks of about ``chunk_size`` characters, so that only the
+chunk being produced and the path to the current value are kept in memory.
+
+The output is exactly what ``json.dumps`` returns for the dict of
+``to_dict`` with its default options, values that ``json`` cannot encode
+raise the same TypeError.
+"""
+import json
+from json.encoder import encode_basestring_ascii
+
+from typed_json_dataclass.views import DataclassView, DictView, \
+    SequenceView
+
+_INFINITY = float('inf')
+
+
+def _encode_float(value):
+    # The same as the float representation of json.dumps
+    if value != value:
+        return 'NaN'
+    if value == _INFINITY:
+        return 'Infinity'
+    if value == -_INFINITY:
+        return '-Infinity'
+    return float.__repr__(value)
+
+
+# Encoders of the values whose class is exactly one of these
+_ENCODERS = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: lambda value: 'true' if value else 'false',
+    type(None): lambda value: 'null',
+}
+
+
+def _encode_other(value):
+    # Subclasses like IntEnum, and the TypeError for everything else
+    return json.dumps(value)
+
+
+def _encode_key(key):
+    if key.__class__ is str:
+        return encode_basestring_ascii(key)
+    # json turns int, float, bool and None keys into strings, and raises a
+    # TypeError for the others
+    encoded = json.dumps({key: 0})
+    return encoded[1:encoded.rindex(':')]
+
+
+# The classes of the values that the views of views.py contain, besides the
+# scalars. numpy arrays become plain lists
+_MAPPINGS = frozenset({DataclassView, DictView})
+_SEQUENCES = frozenset({SequenceView, list})
+
+# Returned by next() once an iterator is exhausted
+_END = object()
+
+
+def iter_json_chunks(value, chunk_size):
+    """Encode a view into json, in chunks.
+
+    The view is walked with a stack of iterators over the mappings and
+    sequences that are being encoded, and the pieces of json are collected
+    until they add up to ``chunk_size`` characters.
+
+    :value: A view, see ``views.py``
+    :chunk_size: The number of characters after which a chunk is yielded,
+                 chunks are only cut between values
+    :returns: An iterator of the chunks, as str
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+
+    parts = []
+    append = parts.append
+    size = 0
+    # Each entry is [iterator, closing bracket, whether it iterates over
+    # items, whether the next element is the first]
+    stack = []
+    while True:
+        value_type = value.__class__
+        encode = _ENCODERS.get(value_type)
+        if encode is not None:
+            token = encode(value)
+            append(token)
+            size += len(token)
+        elif value_type in _MAPPINGS:
+            append('{')
+            size += 1
+            stack.append([value._iter_items(), '}', True, True])
+        elif value_type in _SEQUENCES:
+            append('[')
+            size += 1
+            stack.append([iter(value), ']', False, True])
+        else:
+            token = _encode_other(value)
+            append(token)
+            size += len(token)
+
+        while stack:
+            entry = stack[-1]
+            element = next(entry[0], _END)
+            if element is _END:
+                stack.pop()
+                append(entry[1])
+                size += 1
+                continue
+            if entry[3]:
+                entry[3] = False
+            else:
+                append(', ')
+                size += 2
+            if entry[2]:
+                key, value = element
+                token = _encode_key(key)
+                append(token)
+                append(': ')
+                size += len(token) + 2
+            else:
+                value = element
+            break
+        else:
+            break
+
+        if size >= chunk_size:
+            yield ''.join(parts)
+            parts.clear()
+            size = 0
+    yield ''.join(parts)
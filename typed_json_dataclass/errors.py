@@ -0,0 +1,112 @@
+"""Errors raised for values that do not match the type hints of fields.
+
+Messages embed the repr of the offending value, which for large payloads
+costs more than the validation itself. A ValidationError therefore only
+keeps what went wrong, and formats its message the first time it is turned
+into a str, so that rejected payloads nobody looks at stay cheap.
+"""
+
+
+class ValidationError(TypeError):
+    """A field whose value does not match its type hint.
+
+    This is a TypeError with the same message the checks always raised, so
+    existing handlers keep working.
+
+    :path: The class and field, like ``'Person.age'``, or only the class for
+           the errors of several fields
+    :expected_type: The type hint or type the value was expected to match,
+                    or None for the errors of several fields
+    :actual_type: The type of the value that was found, or None for the
+                  errors of several fields
+    """
+
+    def __init__(self, path, expected_type, actual_type, format_message,
+                 errors=None):
+        """
+        :path: The class and field of the error
+        :expected_type: The type the value was expected to match
+        :actual_type: The type of the value
+        :format_message: A function without arguments that returns the
+                         message, or the message itself
+        :errors: The errors of the fields, when this error stands for
+                 several of them
+        """
+        super().__init__()
+        self.path = path
+        self.expected_type = expected_type
+        self.actual_type = actual_type
+        self._format_message = format_message
+        self._message = format_message if isinstance(format_message,
+                                                     str) else None
+        self._errors = errors
+
+    @classmethod
+    def collect(cls, class_name, errors):
+        """Combine the errors of the fields of an instance into one error.
+
+        :class_name: The name of the class of the instance
+        :errors: A non empty list of ValidationError
+        :returns: The only error, or an error for all of them whose message
+                  has one line per error
+        """
+        if len(errors) == 1:
+            return errors[0]
+        return cls(class_name, None, None,
+                   lambda: '\n'.join(str(error) for error in errors),
+                   errors)
+
+    def within(self, path):
+        """Return the errors of this error as errors of an enclosing field.
+
+        The errors of a nested instance have paths like ``'Child.age'``,
+        which become ``'Parent.child.age'`` for the field ``'Parent.child'``
+        that holds the instance, or ``'Parent.kids[0].age'`` for the path
+        ``'Parent.kids[0]'`` of an element. Errors of the field itself, and
+        of its elements, are kept.
+
+        :path: The class and field that the instance was checked for,
+               followed by the index or key of an element
+        :returns: A list of ValidationError
+        """
+        element_path = f'{path}['
+        return [error if (error.path == path or
+                          error.path.startswith(element_path))
+                else error._prefixed(path)
+                for error in self.errors]
+
+    def _prefixed(self, path):
+        nested_path = self.path
+        _, _, field_path = nested_path.partition('.')
+        full_path = f'{path}.{field_path}' if field_path else path
+
+        def format_message():
+            # The messages of the checks start with their path
+            message = str(self)
+            if message.startswith(nested_path):
+                message = full_path + message[len(nested_path):]
+            return message
+        return type(self)(full_path, self.expected_type, self.actual_type,
+                          format_message)
+
+    @property
+    def errors(self):
+        """The errors of every invalid field, in field order."""
+        return self._errors or [self]
+
+    def __str__(self):
+        if self._message is None:
+            self._message = self._format_message()
+            # The formatter holds on to the value, which is not needed
+            # anymore
+            self._format_message = None
+        return self._message
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.path!r})'
+
+    def __reduce__(self):
+        # Errors are pickled by the workers of from_json_lines_parallel, with
+        # their message instead of the value it is formatted from
+        return type(self), (self.path, self.expected_type, self.actual_type,
+                            str(self), self._errors)
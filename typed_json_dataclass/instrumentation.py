@@ -0,0 +1,133 @@
+"""Opt-in counters of the time spent in validation, decoding and encoding.
+
+Instrumentation is disabled by default, in which case the mixin only checks
+``enabled`` on its hot paths. Once enabled, every call of ``__post_init__``,
+every instance created by a decoding method, every ``to_dict`` and every
+renaming of the keys of a decoded dict is timed and counted per class. The
+counters can be read with ``snapshot``, and every event is also passed to
+the callbacks registered with ``add_callback``, for example to forward them
+to StatsD or Prometheus.
+
+The counters only cover the current process, so instances decoded by the
+workers of ``from_json_lines_parallel`` are not counted.
+"""
+import threading
+from collections import namedtuple
+from time import perf_counter
+
+# The events that are counted
+EVENTS = ('post_init', 'from_dict', 'to_dict', 'rename')
+
+Event = namedtuple('Event', ['cls', 'name', 'seconds', 'failed'])
+
+# Checked by the mixin, use enable and disable to change it
+enabled = False
+
+_counters = {}
+_callbacks = []
+_lock = threading.Lock()
+
+
+def enable():
+    """Start counting events."""
+    global enabled
+    enabled = True
+
+
+def disable():
+    """Stop counting events. The counters are kept until ``reset``."""
+    global enabled
+    enabled = False
+
+
+def reset():
+    """Set all counters back to zero."""
+    with _lock:
+        _counters.clear()
+
+
+def add_callback(callback):
+    """Call ``callback`` with an Event for every counted event.
+
+    Callbacks are called in the thread that caused the event, and an
+    exception raised by a callback is raised to the caller of the
+    instrumented method.
+
+    :callback: A function that takes an Event
+    """
+    _callbacks.append(callback)
+
+
+def remove_callback(callback):
+    """Stop calling a callback that was added with ``add_callback``.
+
+    :callback: The callback to remove
+    """
+    _callbacks.remove(callback)
+
+
+def _class_name(cls):
+    return f'{cls.__module__}.{cls.__qualname__}'
+
+
+def record(cls, name, seconds, failed=False):
+    """Count an event of ``cls`` and pass it on to the callbacks.
+
+    :cls: The class the event happened for
+    :name: One of ``EVENTS``
+    :seconds: How long the event took
+    :failed: Whether the event raised an exception
+    """
+    with _lock:
+        class_counters = _counters.get(cls)
+        if class_counters is None:
+            class_counters = _counters[cls] = {
+                event: {'calls': 0, 'failures': 0, 'seconds': 0.0}
+                for event in EVENTS
+            }
+        counters = class_counters[name]
+        counters['calls'] += 1
+        counters['failures'] += failed
+        counters['seconds'] += seconds
+    if _callbacks:
+        event = Event(cls, name, seconds, failed)
+        for callback in list(_callbacks):
+            callback(event)
+
+
+def timed(cls, name, function, *args):
+    """Call ``function`` and record how long it took as an event of ``cls``.
+
+    :cls: The class the event happens for
+    :name: One of ``EVENTS``
+    :function: The function to call
+    :args: The arguments to call ``function`` with
+    :returns: What ``function`` returned
+    """
+    start = perf_counter()
+    try:
+        result = function(*args)
+    except BaseException:
+        record(cls, name, perf_counter() - start, failed=True)
+        raise
+    record(cls, name, perf_counter() - start)
+    return result
+
+
+def snapshot():
+    """Return a copy of the counters.
+
+    The times of events include the events they cause, so the time of a
+    ``from_dict`` includes the ``rename`` and the ``post_init`` of the
+    instance, and those of its nested instances are counted for their own
+    classes too.
+
+    :returns: A dict from the dotted name of each class to a dict from event
+              name to its ``calls``, ``failures`` and ``seconds``
+    """
+    with _lock:
+        return {
+            _class_name(cls): {event: dict(counters)
+                               for event, counters in class_counters.items()}
+            for cls, class_counters in _counters.items()
+        }
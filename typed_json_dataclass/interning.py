@@ -0,0 +1,102 @@
+"""Deduplication of the string values of decoded instances.
+
+Payloads often repeat the same few strings, like status codes or region
+names, in every record. Fields that opt in share one str object per distinct
+value through an InternTable, instead of keeping a copy per instance.
+"""
+import typing
+from collections import namedtuple
+from dataclasses import field
+
+# The key of the InternTable in the metadata of a field
+METADATA_KEY = 'typed_json_intern'
+
+# Number of distinct strings kept by the default table
+DEFAULT_INTERN_TABLE_SIZE = 64 * 1024
+
+InternStats = namedtuple('InternStats', ['hits', 'misses', 'size', 'maxsize'])
+
+
+class InternTable:
+    """A bounded table of shared strings.
+
+    Once the table is full, strings that are not in it yet are returned as
+    they are, so that the table never grows past ``maxsize`` entries.
+    """
+
+    def __init__(self, maxsize=DEFAULT_INTERN_TABLE_SIZE):
+        """
+        :maxsize: The maximum number of distinct strings in the table
+        """
+        self.maxsize = maxsize
+        self._strings = {}
+        self._hits = 0
+        self._misses = 0
+
+    def intern(self, value):
+        """Return the shared str object that is equal to ``value``.
+
+        :value: The str to deduplicate
+        :returns: The str from the table, or ``value`` itself if it is new
+        """
+        try:
+            interned = self._strings[value]
+        except KeyError:
+            self._misses += 1
+            if len(self._strings) < self.maxsize:
+                self._strings[value] = value
+            return value
+        self._hits += 1
+        return interned
+
+    def stats(self):
+        """Return the hits, misses, size and maxsize of the table."""
+        return InternStats(self._hits, self._misses, len(self._strings),
+                           self.maxsize)
+
+    def clear(self):
+        """Remove all strings from the table and reset the statistics."""
+        self._strings.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+# The table used by fields and classes that do not bring their own
+default_intern_table = InternTable()
+
+
+def intern_field(table=None, **kwargs):
+    """Declare a field whose str values are interned during validation.
+
+    :table: The InternTable to use, defaults to ``default_intern_table``
+    :kwargs: Passed on to ``dataclasses.field``
+    :returns: The field
+    """
+    metadata = dict(kwargs.pop('metadata', None) or {})
+    metadata[METADATA_KEY] = table or default_intern_table
+    return field(metadata=metadata, **kwargs)
+
+
+def holds_strings(field_type):
+    """Check whether a type hint is str, Optional[str] or List[str]."""
+    if field_type is str:
+        return True
+    origin = getattr(field_type, '__origin__', None)
+    if origin is typing.Union:
+        return str in field_type.__args__
+    return origin is list and getattr(field_type, '__args__', None) == (str,)
+
+
+def intern_table(cls, field_def):
+    """Return the InternTable of a field, or None if it is not interned.
+
+    :cls: The class of the field
+    :field_def: The field
+    """
+    table = field_def.metadata.get(METADATA_KEY)
+    if table is not None:
+        return table
+    class_table = cls._intern_strings
+    if not class_table or not holds_strings(field_def.type):
+        return None
+    return default_intern_table if class_table is True else class_table
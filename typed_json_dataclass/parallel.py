@@ -0,0 +1,61 @@
+"""Decoding of json lines in a pool of worker processes.
+
+Decoding and validation are pure Python, so a single process can only use
+one core. The lines are sent to the workers in chunks, and the decoded
+instances are pickled back to the parent in the order of the lines.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from typed_json_dataclass.utils import iter_batches
+
+
+def _decode_chunk(cls, lines, mapping_mode, validation_level):
+    """Decode a chunk of json lines, in a worker.
+
+    This is a module level function so that it can be pickled.
+    """
+    return cls.from_json_lines(lines, mapping_mode=mapping_mode,
+                               validation_level=validation_level)
+
+
+def decode_in_parallel(cls, lines, *, workers, chunk_size, mapping_mode,
+                       validation_level, executor=None):
+    """Lazily decode json lines into instances of ``cls`` in a pool.
+
+    Only a few chunks per worker are in flight at any time, so that the
+    lines do not have to be read into memory all at once.
+
+    :cls: The class to decode the lines into, which must be importable by
+          the workers
+    :lines: An iterable of json lines
+    :workers: The number of worker processes, or None for one per core
+    :chunk_size: The number of lines sent to a worker at once
+    :mapping_mode: Format for properties
+    :validation_level: The ValidationLevel of the call, or None
+    :executor: An executor to use instead of a new ProcessPoolExecutor. It is
+               not shut down afterwards
+    :returns: An iterator of instances, in the order of the lines
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    max_in_flight = 2 * (workers or os.cpu_count() or 1)
+    in_flight = deque()
+    try:
+        for chunk in iter_batches(lines, chunk_size):
+            in_flight.append(executor.submit(_decode_chunk, cls, chunk,
+                                             mapping_mode, validation_level))
+            if len(in_flight) >= max_in_flight:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
@@ -0,0 +1,99 @@
+"""Slotted dataclasses, for when many instances are kept in memory.
+
+``dataclass(slots=True)`` only exists since Python 3.10, so ``slotted``
+recreates a dataclass with ``__slots__`` in the same way.
+"""
+from dataclasses import fields, is_dataclass
+
+# Slots that the mixin stores state in, besides the fields
+_INTERNAL_SLOTS = ('_call_level',)
+
+
+def _inherited_slots(cls):
+    """Return the names of the slots defined by the bases of a class."""
+    names = set()
+    for base in cls.__mro__[1:]:
+        slots = base.__dict__.get('__slots__', ())
+        names.update((slots,) if isinstance(slots, str) else slots)
+    return names
+
+
+def _setstate(self, state):
+    """Restore a pickled instance of a frozen slotted class.
+
+    The default way of restoring slots uses ``setattr``, which frozen
+    dataclasses do not allow.
+    """
+    # The state is a (__dict__, slots) tuple, or only the __dict__ if no
+    # slot is set
+    dict_state, slot_state = state if isinstance(state, tuple) else (state,
+                                                                     None)
+    for part in (dict_state, slot_state):
+        for name, value in (part or {}).items():
+            object.__setattr__(self, name, value)
+
+
+def _update_class_cells(function, old_cls, new_cls):
+    """Point the ``__class__`` cell of a method to the recreated class.
+
+    The cell is used by ``super()`` without arguments, which would otherwise
+    still refer to the class without slots.
+    """
+    function = getattr(function, '__func__', function)
+    if isinstance(function, property):
+        for accessor in (function.fget, function.fset, function.fdel):
+            _update_class_cells(accessor, old_cls, new_cls)
+        return
+    for cell in getattr(function, '__closure__', None) or ():
+        if cell.cell_contents is old_cls:
+            cell.cell_contents = new_cls
+
+
+def slotted(cls):
+    """Recreate a dataclass with ``__slots__`` instead of a ``__dict__``.
+
+    Instances of the returned class only take the memory for their fields.
+    The decorator has to be applied on top of ``@dataclass``::
+
+        @slotted
+        @dataclass
+        class Person(TypedJsonMixin):
+            name: str
+
+    Slots do not work with the ``lazy`` option of ``TypedJsonMixin``, since
+    deferred fields are kept out of the instance until they are accessed.
+
+    :cls: The dataclass
+    :returns: A new class with the same fields, methods and options
+    :raises TypeError: If the class is not a dataclass, already has slots or
+                       is lazy
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f'{cls.__name__} must be a dataclass, apply '
+                        '@slotted on top of @dataclass')
+    if '__slots__' in cls.__dict__:
+        raise TypeError(f'{cls.__name__} already defines __slots__')
+    if getattr(cls, '_lazy', False):
+        raise TypeError(f'{cls.__name__} is lazy, which does not work with '
+                        '__slots__')
+
+    field_names = tuple(field_def.name for field_def in fields(cls))
+    inherited_slots = _inherited_slots(cls)
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = tuple(name
+                                  for name in field_names + _INTERNAL_SLOTS
+                                  if name not in inherited_slots)
+    # The defaults of the fields are class attributes, which would conflict
+    # with the slots. The dataclass methods keep their own references to
+    # the defaults.
+    for name in field_names:
+        cls_dict.pop(name, None)
+    for name in ('__dict__', '__weakref__', '_typed_json_cache'):
+        cls_dict.pop(name, None)
+    if cls.__dataclass_params__.frozen and '__setstate__' not in cls_dict:
+        cls_dict['__setstate__'] = _setstate
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    for value in cls_dict.values():
+        _update_class_cells(value, cls, new_cls)
+    return new_cls
@@ -0,0 +1,210 @@
+"""Incremental parsing of json documents that are too large for memory.
+
+A top-level json array is parsed one element at a time, so that only the
+element being parsed has to be held in memory, instead of the whole document
+and all of its decoded elements. Documents can be read from files and
+iterables of chunks, or from asyncio streams and async iterables of chunks.
+"""
+import codecs
+import json
+import re
+
+# Number of characters or bytes read from a file at a time
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER_START = frozenset('-0123456789')
+_VALUE_START = _NUMBER_START | frozenset('{["tfn')
+# A number is only complete once one of these follows it
+_NUMBER_END = frozenset(' \t\n\r,]')
+
+# States of the parser
+_START = 0
+_FIRST_VALUE = 1
+_VALUE = 2
+_COMMA = 3
+_DONE = 4
+
+
+class JsonArrayParser:
+    """Incrementally parses the elements of a top-level json array.
+
+    Chunks of the document are given to ``feed`` as they arrive, which
+    returns the elements that were completed by the chunk. ``close`` checks
+    that the whole array has been seen.
+    """
+
+    def __init__(self):
+        self._buffer = ''
+        self._state = _START
+        # An incomplete element is only parsed again once the buffer reaches
+        # this size, so that it is not parsed again for every small chunk
+        self._retry_at = 0
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+
+    def feed(self, chunk):
+        """Add a chunk of the document and return the completed elements.
+
+        :chunk: The next part of the document, as str or utf-8 bytes
+        :returns: A list of the elements that are now complete
+        """
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk)
+        self._buffer += chunk
+        if len(self._buffer) < self._retry_at:
+            return []
+        return self._parse(final=False)
+
+    def close(self):
+        """Signal the end of the document.
+
+        :returns: A list of the elements that are now complete
+        :raises json.JSONDecodeError: If the document is not a complete array
+        """
+        self._buffer += self._text_decoder.decode(b'', final=True)
+        elements = self._parse(final=True)
+        if self._state != _DONE:
+            raise json.JSONDecodeError('Unterminated json array',
+                                       self._buffer, len(self._buffer))
+        return elements
+
+    def _parse(self, final):
+        buffer = self._buffer
+        position = 0
+        retry_at = 0
+        elements = []
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position == len(buffer):
+                break
+            char = buffer[position]
+
+            if self._state == _START:
+                if char != '[':
+                    raise json.JSONDecodeError("Expecting '['", buffer,
+                                               position)
+                self._state = _FIRST_VALUE
+                position += 1
+            elif self._state == _DONE:
+                raise json.JSONDecodeError('Extra data', buffer, position)
+            elif self._state == _COMMA:
+                if char == ',':
+                    self._state = _VALUE
+                elif char == ']':
+                    self._state = _DONE
+                else:
+                    raise json.JSONDecodeError("Expecting ',' delimiter",
+                                               buffer, position)
+                position += 1
+            elif self._state == _FIRST_VALUE and char == ']':
+                self._state = _DONE
+                position += 1
+            elif char not in _VALUE_START:
+                raise json.JSONDecodeError('Expecting value', buffer,
+                                           position)
+            else:
+                try:
+                    element, end = self._decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    # Only try again once the rest of the buffer has doubled
+                    retry_at = 2 * (len(buffer) - position)
+                    break
+                if (char in _NUMBER_START and not final and
+                        (end == len(buffer) or
+                         buffer[end] not in _NUMBER_END)):
+                    # The number might continue in the next chunk, like
+                    # 1.5 that was cut after 1.
+                    break
+                elements.append(element)
+                self._state = _COMMA
+                position = end
+
+        self._buffer = buffer[position:]
+        self._retry_at = retry_at
+        return elements
+
+
+def iter_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Iterate over the chunks of a file object or an iterable of chunks.
+
+    :source: A file object opened in text or binary mode, or an iterable of
+             str or bytes chunks
+    :chunk_size: The number of characters or bytes read at a time
+    :returns: An iterator of chunks
+    """
+    read = getattr(source, 'read', None)
+    if read is None:
+        return iter(source)
+    return iter(lambda: read(chunk_size), source.read(0))
+
+
+def iter_json_array(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Lazily parse the elements of a top-level json array.
+
+    :source: A file object opened in text or binary mode, or an iterable of
+             str or bytes chunks
+    :chunk_size: The number of characters or bytes read at a time
+    :returns: An iterator of the decoded elements of the array
+    """
+    parser = JsonArrayParser()
+    for chunk in iter_chunks(source, chunk_size):
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Iterate over the chunks of an asyncio stream or an async iterable.
+
+    :source: An object with a ``read`` coroutine, like
+             ``asyncio.StreamReader``, or an async iterable of str or bytes
+             chunks
+    :chunk_size: The number of characters or bytes read at a time
+    :returns: An async iterator of chunks
+    """
+    read = getattr(source, 'read', None)
+    if read is None:
+        async for chunk in source:
+            yield chunk
+        return
+    while True:
+        chunk = await read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def aiter_line_batches(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Split an async source of chunks into lines, one batch per chunk.
+
+    :source: See ``aiter_chunks``
+    :chunk_size: The number of characters or bytes read at a time
+    :returns: An async iterator of lists of the lines that were completed
+              by each chunk, without their line endings
+    """
+    rest = None
+    async for chunk in aiter_chunks(source, chunk_size):
+        if rest is None:
+            rest = chunk[:0]
+        lines = (rest + chunk).split(b'\n' if isinstance(chunk, bytes)
+                                     else '\n')
+        rest = lines.pop()
+        yield lines
+    if rest:
+        yield [rest]
+
+
+async def aiter_json_array_batches(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Incrementally parse a top-level json array from an async source.
+
+    :source: See ``aiter_chunks``
+    :chunk_size: The number of characters or bytes read at a time
+    :returns: An async iterator of lists of the elements that were completed
+              by each chunk
+    """
+    parser = JsonArrayParser()
+    async for chunk in aiter_chunks(source, chunk_size):
+        yield parser.feed(chunk)
+    yield parser.close()
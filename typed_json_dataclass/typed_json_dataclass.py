@@ -1,11 +1,799 @@
 #!/usr/bin/env python3.7
-import json
+import asyncio
+import io
 import typing
-from dataclasses import InitVar, MISSING, asdict, fields, is_dataclass
+from dataclasses import InitVar, MISSING, fields, is_dataclass
 from enum import Enum
+from functools import partial
 from warnings import warn
 
-from typed_json_dataclass.utils import to_camel, to_snake, recursive_rename
+from typed_json_dataclass import instrumentation
+from typed_json_dataclass.arrays import array_spec, has_numpy_fields, \
+    numpy_fields_equal
+from typed_json_dataclass.backends import get_backend
+from typed_json_dataclass.bulk import iter_encoded
+from typed_json_dataclass.cache import class_cache
+from typed_json_dataclass.codegen import build_from_dict, serializer_for
+from typed_json_dataclass.containers import Mismatch, UnsupportedHint, \
+    compile_converter, dict_depth, failed_index, is_container
+from typed_json_dataclass.encoding import iter_json_chunks
+from typed_json_dataclass.errors import ValidationError
+from typed_json_dataclass.interning import intern_table
+from typed_json_dataclass.parallel import decode_in_parallel
+from typed_json_dataclass.streaming import DEFAULT_CHUNK_SIZE, \
+    aiter_json_array_batches, aiter_line_batches, iter_json_array
+from typed_json_dataclass.unions import is_union, optional_member, \
+    resolve_self, union_spec
+from typed_json_dataclass.utils import RenameRule, to_camel, to_snake, \
+    recursive_rename
+from typed_json_dataclass.validation import ValidationLevel, current_level, \
+    sample, with_level
+from typed_json_dataclass.views import DataclassView
+
+
+def _compile_element_validator(expected_type, sampled=False):
+    """Build a predicate that checks an element of a list.
+
+    :expected_type: The type hint of the element. Members of a Union are
+                    checked in turn, and lists of lists level by level, see
+                    ``_compile_list_validator``
+    :sampled: Whether only a sample of the elements of lists is checked
+    """
+    if isinstance(expected_type, typing.ForwardRef):
+        # Compare against the name of the class the ForwardRef points to
+        type_for_forward_ref = expected_type.__forward_arg__
+        return lambda v: type_for_forward_ref == v.__class__.__name__
+
+    if is_union(expected_type):
+        validators = [_compile_element_validator(member, sampled)
+                      for member in expected_type.__args__]
+        return lambda v: any(validate(v) for validate in validators)
+
+    if (getattr(expected_type, '__origin__', None) is list and
+            hasattr(expected_type, '__args__')):
+        # Only reached for lists in a Union, the lists of lists of a list
+        # are unrolled by _compile_list_validator
+        validate_list = _compile_list_validator(expected_type, sampled)
+        return lambda v: isinstance(v, list) and validate_list(v)
+
+    # Other type hints like Dict[str, int] are checked by their origin
+    expected_type = getattr(expected_type, '__origin__', expected_type)
+    return lambda v: isinstance(v, expected_type)
+
+
+def _compile_list_validator(expected_type, sampled=False):
+    """Build a predicate that checks nested lists like List[List[str]].
+
+    The predicate checks that all elements in the list are uniform. The type
+    hint is only inspected once, when the predicate is built, and unrolled
+    into the depth of the nesting and the type of the innermost elements, so
+    that the predicate walks nested lists with a worklist instead of
+    recursion. With ``sampled``, only a sample of the elements of each list
+    is checked.
+    """
+    # typing.List[type] will have __args__, a bare List may not
+    depth = 0
+    while (getattr(expected_type, '__origin__', None) is list and
+           hasattr(expected_type, '__args__')):
+        depth += 1
+        expected_type = expected_type.__args__[0]
+
+    validate_element = _compile_element_validator(expected_type, sampled)
+
+    # The predicate is only called with lists
+    if depth == 1:
+        def validate(actual_value):
+            if sampled:
+                actual_value = sample(actual_value)
+            return all(validate_element(v) for v in actual_value)
+        return validate
+
+    def validate_nested(actual_value):
+        # The elements are checked in the same order as a depth first
+        # recursion would, so the first mismatch found is the same
+        worklist = [(actual_value, 0)]
+        while worklist:
+            value, level = worklist.pop()
+            if level == depth:
+                if not validate_element(value):
+                    return False
+            elif isinstance(value, list):
+                if sampled:
+                    value = sample(value)
+                worklist.extend((v, level + 1) for v in reversed(value))
+            else:
+                return False
+        return True
+    return validate_nested
+
+
+def _nested_constructor(expected_type):
+    """Return the function that turns a dict into an ``expected_type``.
+
+    Classes that can contain themselves are built without recursion, see
+    ``_decode_tree``, other nested classes that opted into code generation
+    are built through their generated ``from_dict``, and everything else
+    through ``expected_type(**d)``.
+    """
+    if (isinstance(expected_type, type) and
+            issubclass(expected_type, TypedJsonMixin)):
+        if expected_type._decode_plan():
+            return expected_type._construct_tree
+        if expected_type._codegen:
+            return _generated_constructor(expected_type)
+    return lambda raw_dict: expected_type(**raw_dict)
+
+
+def _generated_constructor(cls):
+    """Return the constructor of a nested class with ``codegen=True``.
+
+    The generated ``from_dict`` skips ``__post_init__``, so while
+    instrumentation is enabled the class is instantiated instead, for its
+    validations to be counted. This is checked on every call, since the
+    constructors of nested classes are only looked up once.
+    """
+    generated = cls._compiled_from_dict(MappingMode.NoMap)
+
+    def construct(raw_dict):
+        if instrumentation.enabled:
+            return cls._construct(raw_dict)
+        return generated(raw_dict)
+    return construct
+
+
+def _is_init_var(field_type):
+    """Check whether a type hint is an ``InitVar``.
+
+    ``InitVar[T]`` is the InitVar class itself on Python 3.7, and an instance
+    of it on later versions.
+    """
+    return field_type is InitVar or isinstance(field_type, InitVar)
+
+
+def _has_non_default_init_vars(cls, previous_classes):
+    """Check a dataclass and its nested dataclasses for init-only vars.
+
+    :cls: The dataclass to check
+    :previous_classes: The set of previously checked classes
+    :returns: Whether an init-only var without a default was found
+    """
+    previous_classes.add(cls)
+
+    # The identify check (.. is MISSING) is fine, MISSING is a singleton
+    if any(_is_init_var(field.type) and field.default is MISSING
+           for field in cls.__dataclass_fields__.values()):
+        return True
+    return any(_has_non_default_init_vars(child.type, previous_classes)
+               for child in fields(cls)
+               if (is_dataclass(child.type)
+                   and child.type not in previous_classes))
+
+
+def _raw_nested_type(field_type):
+    """Return the type of raw value that holds nested dataclasses for a field.
+
+    ``Optional`` type hints hold the same raw value as their member.
+
+    :field_type: The type hint of the field
+    :returns: dict for nested dataclasses, list for lists of dataclasses, and
+              None for fields without nested dataclasses
+    """
+    field_type = optional_member(field_type) or field_type
+    if isinstance(field_type, type) and is_dataclass(field_type):
+        return dict
+    if (getattr(field_type, '__origin__', None) is list and
+            hasattr(field_type, '__args__')):
+        element_type = field_type.__args__[0]
+        if isinstance(element_type, type) and is_dataclass(element_type):
+            return list
+    return None
+
+
+def _nested_target(cls, field_type):
+    """Return the dataclass that raw dicts of a field of ``cls`` become.
+
+    Unlike ``_raw_nested_type``, a ForwardRef to ``cls`` itself resolves to
+    ``cls``, so that self-referencing trees can be decoded, and ``Optional``
+    type hints resolve to their member.
+
+    :cls: The class of the field
+    :field_type: The type hint of the field
+    :returns: A tuple of the dataclass and whether the field holds a list of
+              them, or None for fields without nested dataclasses
+    """
+    field_type = optional_member(field_type) or field_type
+    many = (getattr(field_type, '__origin__', None) is list and
+            hasattr(field_type, '__args__'))
+    if many:
+        field_type = field_type.__args__[0]
+    if isinstance(field_type, typing.ForwardRef):
+        field_type = field_type.__forward_arg__
+    if field_type == cls.__name__:
+        return cls, many
+    if isinstance(field_type, type) and is_dataclass(field_type):
+        return field_type, many
+    return None
+
+
+def _decode_tree(cls, raw_dict):
+    """Create an instance of ``cls`` and all the dataclasses nested in it.
+
+    Instead of letting each ``__post_init__`` construct the instances nested
+    in it, which takes several stack frames per level, the raw dicts of the
+    nested dataclasses are collected with a worklist and instantiated from
+    the deepest level up. By the time an instance is created, its nested
+    dicts have been replaced with instances, so its checks do not recurse.
+    The raw dicts and lists are not modified.
+
+    Anything that is not a dict of a known nested dataclass is left for the
+    checks of ``__post_init__``. If a nested dataclass fails, the error of a
+    regular instantiation is raised, see ``_construct_failed_path``.
+
+    :cls: The class to decode
+    :raw_dict: The raw dict, with keys that are field names
+    :returns: The instance of ``cls``
+    """
+    # Each node is (class, raw dict, parent node, field name, list index,
+    # constructor). Parents are always collected before their children
+    nodes = [(cls, raw_dict, None, None, None, None)]
+    i = 0
+    while i < len(nodes):
+        target, raw = nodes[i][:2]
+        for field_name, nested_cls, many, construct in target._decode_plan():
+            value = raw.get(field_name)
+            if not many:
+                if isinstance(value, dict):
+                    nodes.append((nested_cls, value, i, field_name, None,
+                                  construct))
+            elif isinstance(value, list):
+                for index, element in enumerate(value):
+                    # Empty dicts are rejected by the checks of the list
+                    if isinstance(element, dict) and element:
+                        nodes.append((nested_cls, element, i, field_name,
+                                      index, construct))
+        i += 1
+
+    # Copies of the raw dicts whose nested dicts were replaced
+    kwargs = [None] * len(nodes)
+    for i in range(len(nodes) - 1, 0, -1):
+        _, raw, parent, field_name, index, construct = nodes[i]
+        try:
+            instance = construct(kwargs[i] or raw)
+        except (TypeError, ValueError) as error:
+            return _construct_failed_path(nodes, kwargs, i, error)
+        # Inlined _replace_node, which is only called for failures
+        parent_kwargs = kwargs[parent]
+        if parent_kwargs is None:
+            parent_kwargs = kwargs[parent] = dict(nodes[parent][1])
+        if index is None:
+            parent_kwargs[field_name] = instance
+        else:
+            elements = parent_kwargs[field_name]
+            if elements is nodes[parent][1][field_name]:
+                elements = parent_kwargs[field_name] = list(elements)
+            elements[index] = instance
+    return cls(**(kwargs[0] or raw_dict))
+
+
+def _replace_node(nodes, kwargs, i, value):
+    """Replace the raw dict of a node in the copy of its parent's dict.
+
+    :nodes: The nodes of ``_decode_tree``
+    :kwargs: The copies of the raw dicts of the nodes, or None for nodes
+             that have nothing replaced yet
+    :i: The index of the node
+    :value: The instance or dict that takes the place of the raw dict
+    """
+    _, _, parent, field_name, index, _ = nodes[i]
+    parent_raw = nodes[parent][1]
+    parent_kwargs = kwargs[parent]
+    if parent_kwargs is None:
+        parent_kwargs = kwargs[parent] = dict(parent_raw)
+    if index is None:
+        parent_kwargs[field_name] = value
+    else:
+        elements = parent_kwargs[field_name]
+        if elements is parent_raw[field_name]:
+            elements = parent_kwargs[field_name] = list(elements)
+        elements[index] = value
+
+
+def _construct_failed_path(nodes, kwargs, i, error):
+    """Raise the error of a regular instantiation for a failing node.
+
+    The ancestors of the node wrap its error differently depending on their
+    fields, and may fail on their own fields first, so the root class is
+    instantiated regularly. Everything that ``_decode_tree`` already built
+    is passed as instances, so that only the failing node, its ancestors and
+    the nodes that were not reached yet are instantiated, instead of the
+    whole document a second time.
+
+    :nodes: The nodes of ``_decode_tree``
+    :kwargs: The copies of the raw dicts of the nodes
+    :i: The index of the failing node
+    :error: The error of the failing node, which is raised if the path is
+            too deep to be instantiated recursively
+    :returns: The instance of the root class, which is only created if the
+              regular instantiation accepts the node after all
+    """
+    kwargs[i] = kwargs[i] or nodes[i][1]
+    # The copies of the nodes that were not instantiated yet hold the
+    # instances of their descendants
+    for j in range(i, 0, -1):
+        if kwargs[j] is not None:
+            _replace_node(nodes, kwargs, j, kwargs[j])
+    try:
+        return nodes[0][0](**kwargs[0])
+    except RecursionError:
+        raise error from None
+
+
+def _hint_rename_rule(cls, hint, format_method):
+    """Return the RenameRule of the dicts of a field of ``cls``.
+
+    :cls: The class of the field
+    :hint: The type hint of the field
+    :format_method: The function that renames keys
+    :returns: A rule that keeps the keys of typed dicts, the rule of a
+              nested class, or None for values that are renamed all the way
+              down
+    """
+    hint = optional_member(hint) or hint
+    if dict_depth(hint):
+        return RenameRule(True, None, None, _hint_rename_rule(
+            cls, hint.__args__[1], format_method))
+    if hint == cls.__name__:
+        # A self reference written as a plain string
+        return cls._rename_rule(format_method)
+    hint = resolve_self(cls, hint)
+    if isinstance(hint, type) and issubclass(hint, TypedJsonMixin):
+        return hint._rename_rule(format_method)
+    return None
+
+
+def _compile_array_checker(class_name, field_def, spec):
+    """Build the checker of a field that is stored in an array.
+
+    The checker replaces the list of the field with an array, which checks
+    the type of all elements at once.
+
+    :class_name: The name of the class of the field
+    :field_def: The field
+    :spec: The ArraySpec of the field
+    """
+    field_name = field_def.name
+    field_type = field_def.type
+    path = f'{class_name}.{field_name}'
+    array_type = spec.array_type()
+
+    def check_array(instance, field_value):
+        if isinstance(field_value, array_type):
+            return
+        actual_type = type(field_value)
+        if not isinstance(field_value, list):
+            raise ValidationError(
+                path, field_type, actual_type,
+                lambda: (f'{path} is expected to be {field_type}, but value '
+                         f'{field_value} with type {actual_type} was found '
+                         'instead'))
+        try:
+            converted = spec.convert(field_value)
+        except (TypeError, ValueError, OverflowError) as e:
+            # The name of the exception is unbound after the except clause
+            reason = e
+            raise ValidationError(
+                path, field_type, actual_type,
+                lambda: (f'{path} is {field_value} which does not match '
+                         f'{field_type}: {reason}')) from None
+        object.__setattr__(instance, field_name, converted)
+    return check_array
+
+
+def _member_constructor(cls, member):
+    """Return the function that turns a dict into a member of a field of cls.
+
+    The checkers of ``cls`` are compiled while its own constructor may be
+    compiled, for example by its generated ``from_dict``, so for ``cls``
+    itself the constructor is only looked up when it is first called.
+
+    :cls: The class of the field
+    :member: The dataclass that dicts of the field become
+    """
+    if member is not cls:
+        return _nested_constructor(member)
+    construct = None
+
+    def construct_self(raw_dict):
+        nonlocal construct
+        if construct is None:
+            construct = _nested_constructor(cls)
+        return construct(raw_dict)
+    return construct_self
+
+
+def _resolve_member(cls, hint):
+    """Resolve the type hint of a member of a container of ``cls``.
+
+    :returns: A tuple of the dataclass and the function that turns dicts
+              into it, or None if the type hint is not a dataclass
+    """
+    hint = resolve_self(cls, hint)
+    if isinstance(hint, type) and is_dataclass(hint):
+        return hint, _member_constructor(cls, hint)
+    return None
+
+
+def _compile_union_checker(cls, field_def, level=ValidationLevel.Full):
+    """Build the checker of a Union or Optional field.
+
+    The members are sorted once, when the checker is built. A value whose
+    class is one of the members is accepted with a single set lookup, other
+    values are checked against the members in order, so that subclasses and
+    members like List[int] still match. Members like Dict or Tuple convert
+    values like the fields of these types do, see
+    ``_compile_container_checker``. Dicts that no member accepts are turned
+    into one of the dataclass members, see ``unions.py``, and so are the
+    dicts in lists of dataclasses.
+
+    At the trusted level values are only converted.
+
+    :cls: The class of the field
+    :field_def: The field
+    :level: The ValidationLevel of the checker
+    """
+    field_name = field_def.name
+    field_type = field_def.type
+    path = f'{cls.__name__}.{field_name}'
+    possible_types = field_type.__args__
+    check_types = level is not ValidationLevel.Trusted
+
+    plain_types = []
+    # (predicate, constructor of dict elements or None) for each List member
+    list_members = []
+    # Converters of the Dict, Tuple, Set and FrozenSet members
+    container_members = []
+    # ForwardRefs to other classes can only be compared by name
+    forward_names = set()
+    for member in possible_types:
+        member = resolve_self(cls, member)
+        if isinstance(member, typing.ForwardRef):
+            forward_names.add(member.__forward_arg__)
+        elif is_container(member):
+            try:
+                container_members.append(compile_converter(
+                    member, partial(_resolve_member, cls),
+                    check_types).convert)
+            except UnsupportedHint:
+                plain_types.append(member.__origin__)
+        elif (getattr(member, '__origin__', None) is list and
+                hasattr(member, '__args__')):
+            element_type = resolve_self(cls, member.__args__[0])
+            construct_element = None
+            if isinstance(element_type, type) and is_dataclass(element_type):
+                construct_element = _member_constructor(cls, element_type)
+            list_members.append((
+                _compile_list_validator(member,
+                                        level is ValidationLevel.Sampled),
+                construct_element))
+        else:
+            plain_types.append(getattr(member, '__origin__', member))
+    exact_types = frozenset(plain_types)
+    plain_types = tuple(plain_types)
+    constructors = [(member, _member_constructor(cls, member))
+                    for member in plain_types if is_dataclass(member)]
+
+    spec = union_spec(field_def)
+    if spec is not None:
+        discriminator = spec.discriminator
+        tagged = {
+            tag: (member, _member_constructor(cls, member),
+                  discriminator in member.__dataclass_fields__)
+            for tag, member in spec.members_by_tag(
+                [member for member, _ in constructors]).items()
+        }
+
+    def union_error(actual_type):
+        return ValidationError(
+            path, field_type, actual_type,
+            lambda: (f'{path} was defined to be any of: {possible_types} '
+                     f'but was found to be {actual_type} instead'))
+
+    def decode_tagged(field_value):
+        tag = field_value.get(discriminator)
+        try:
+            member, construct, keep_tag = tagged[tag]
+        except (KeyError, TypeError):
+            raise ValidationError(
+                path, field_type, dict,
+                lambda: (f'{path} has {tag!r} as its {discriminator!r}, '
+                         f'which is not any of: {list(tagged)}')) from None
+        kwargs = field_value
+        if not keep_tag:
+            kwargs = {key: value for key, value in field_value.items()
+                      if key != discriminator}
+        try:
+            return construct(kwargs)
+        except ValidationError:
+            # The keys are the ones of the member, but a value is not
+            raise
+        except TypeError:
+            raise ValidationError(
+                path, member, dict,
+                lambda: (f'{path} is expected to be {member}, but value '
+                         f'{field_value} is a dict with unexpected keys'))
+
+    def decode_dict(field_value):
+        if spec is not None:
+            return decode_tagged(field_value)
+        # The first error of a member whose keys matched but whose values
+        # did not, which is raised if no other member accepts the dict
+        error = None
+        for _, construct in constructors:
+            try:
+                return construct(field_value)
+            except ValidationError as member_error:
+                error = error or member_error
+            except TypeError:
+                continue
+        raise error or union_error(dict)
+
+    def convert_list(field_value):
+        # Returns the list with its dicts converted, or None if no List
+        # member matches. Errors of the elements are kept like in
+        # decode_dict
+        error = None
+        for validate, construct_element in list_members:
+            converted = field_value
+            if (construct_element is not None and
+                    any(isinstance(v, dict) for v in field_value)):
+                elements = iter(field_value)
+                try:
+                    converted = [construct_element(v)
+                                 if isinstance(v, dict) else v
+                                 for v in elements]
+                except ValidationError as element_error:
+                    if cls._collect_errors:
+                        i = failed_index(elements, len(field_value))
+                        element_error = ValidationError.collect(
+                            cls.__name__, element_error.within(f'{path}[{i}]'))
+                    error = error or element_error
+                    continue
+                except TypeError:
+                    continue
+            if not check_types or validate(converted):
+                return converted
+        if error is not None:
+            raise error
+        return None
+
+    def check_union(instance, field_value):
+        actual_type = field_value.__class__
+        if actual_type in exact_types:
+            return
+        if check_types and isinstance(field_value, plain_types):
+            return
+        for convert in container_members:
+            try:
+                converted = convert(field_value)
+            except Mismatch:
+                continue
+            if converted is not field_value:
+                setattr(instance, field_name, converted)
+            return
+        if actual_type is dict and constructors:
+            setattr(instance, field_name, decode_dict(field_value))
+            return
+        if actual_type is list and list_members:
+            converted = convert_list(field_value)
+            if converted is not None:
+                if converted is not field_value:
+                    setattr(instance, field_name, converted)
+                return
+        if actual_type.__name__ in forward_names or not check_types:
+            return
+        raise union_error(actual_type)
+    return check_union
+
+
+def _union_converts(cls, field_type):
+    """Check whether a Union has a member that values are converted to.
+
+    :returns: True if a member is a dataclass, a list of dataclasses or a
+              container like Dict or Tuple
+    """
+    for member in field_type.__args__:
+        member = resolve_self(cls, member)
+        if is_container(member):
+            return True
+        if (getattr(member, '__origin__', None) is list and
+                hasattr(member, '__args__')):
+            member = resolve_self(cls, member.__args__[0])
+        if isinstance(member, type) and is_dataclass(member):
+            return True
+    return False
+
+
+def _compile_container_checker(cls, field_def, level=ValidationLevel.Full):
+    """Build the checker of a Dict, Tuple, Set or FrozenSet field.
+
+    The type hint is compiled into a converter, see ``containers.py``, which
+    replaces the value of the field if it had to be converted. All elements
+    are checked at the sampled level too, only lists are sampled.
+
+    At the trusted level values are converted without being checked.
+
+    :cls: The class of the field
+    :field_def: The field
+    :level: The ValidationLevel of the checker
+    """
+    field_name = field_def.name
+    field_type = field_def.type
+    path = f'{cls.__name__}.{field_name}'
+    check_types = level is not ValidationLevel.Trusted
+
+    try:
+        convert = compile_converter(field_type, partial(_resolve_member, cls),
+                                    check_types).convert
+    except UnsupportedHint as e:
+        native = e.native
+
+        def reject(instance, field_value):
+            actual_type = type(field_value)
+            if native:
+                raise ValidationError(
+                    path, field_type, actual_type,
+                    lambda: (f'{path} was detected to use a native Python '
+                             'collection in its type definition. We should '
+                             'only use typing collections like '
+                             'typing.Dict[] for these'))
+            raise ValidationError(
+                path, field_type, actual_type,
+                lambda: (f'{path} was defined as a {field_type}, but is '
+                         'missing information about the type of the '
+                         'elements inside it'))
+        return reject
+
+    def check_container(instance, field_value):
+        try:
+            converted = convert(field_value)
+        except Mismatch as e:
+            if not check_types:
+                return
+            actual_type = type(field_value)
+            reason = e.reason
+            if (cls._collect_errors and e.location and
+                    isinstance(reason, ValidationError)):
+                # Listed with the path of the element, see _check_all_fields
+                raise ValidationError.collect(
+                    cls.__name__,
+                    reason.within(f'{path}{e.location}')) from None
+            suffix = '' if reason is None else f': {reason}'
+            raise ValidationError(
+                path, field_type, actual_type,
+                lambda: (f'{path} is {field_value} which does not match '
+                         f'{field_type}{suffix}')) from None
+        if converted is not field_value:
+            object.__setattr__(instance, field_name, converted)
+    return check_container
+
+
+def _compile_trusted_converter(cls, field_def):
+    """Build the converter of a field for the trusted validation level.
+
+    The converter takes the instance and the (non None) value of a field
+    that holds nested dataclasses, including ``cls`` itself, and replaces
+    nested dicts with instances of the nested type without checking
+    anything else. Fields stored in arrays are converted like at the other
+    levels.
+    """
+    field_name = field_def.name
+
+    spec = array_spec(field_def)
+    if spec is not None:
+        return _compile_array_checker(cls.__name__, field_def, spec)
+
+    nested_cls, many = _nested_target(cls, field_def.type)
+    if not many:
+        construct = _nested_constructor(nested_cls)
+
+        def convert(instance, field_value):
+            if isinstance(field_value, dict):
+                setattr(instance, field_name, construct(field_value))
+        return convert
+
+    construct_element = _nested_constructor(nested_cls)
+
+    def convert_elements(instance, field_value):
+        if isinstance(field_value, list):
+            for i, element in enumerate(field_value):
+                if isinstance(element, dict):
+                    field_value[i] = construct_element(element)
+    return convert_elements
+
+
+def _compile_interning(field_def, check, table):
+    """Extend the checker of a field to intern its strings.
+
+    :field_def: The field
+    :check: The checker of the field, or None
+    :table: The InternTable of the field
+    :returns: A checker that runs ``check`` and then replaces the str value
+              of the field, or the str elements of its list, with the ones
+              from the table
+    """
+    field_name = field_def.name
+    intern = table.intern
+
+    if getattr(field_def.type, '__origin__', None) is list:
+        def check_and_intern_elements(instance, field_value):
+            if check is not None:
+                check(instance, field_value)
+            if isinstance(field_value, list):
+                field_value[:] = [intern(v) if v.__class__ is str else v
+                                  for v in field_value]
+        return check_and_intern_elements
+
+    def check_and_intern(instance, field_value):
+        if check is not None:
+            check(instance, field_value)
+        if field_value.__class__ is str:
+            object.__setattr__(instance, field_name, intern(field_value))
+    return check_and_intern
+
+
+def _discard_pending(state, field_name):
+    """Remove a field from the deferred fields of an instance.
+
+    The dict of pending fields is replaced instead of changed, because
+    ``copy.copy`` shares it between the copy and the original.
+
+    :state: The ``__dict__`` of the instance
+    :field_name: The name of the field
+    :returns: Whether the field was pending
+    """
+    pending = state.get('_pending_fields')
+    if pending is None or field_name not in pending:
+        return False
+    if len(pending) == 1:
+        del state['_pending_fields']
+    else:
+        state['_pending_fields'] = {name: value
+                                    for name, value in pending.items()
+                                    if name != field_name}
+    return True
+
+
+class _LazyField:
+    """Class attribute that materializes a deferred field on first access.
+
+    Values that are assigned replace the deferred raw value, and deleting
+    the field removes both, so that a stale raw value never comes back.
+    """
+
+    def __init__(self, name, default):
+        self.name = name
+        self.default = default
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            if self.default is MISSING:
+                raise AttributeError(self.name)
+            return self.default
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            return instance._materialize_field(self.name)
+
+    def __set__(self, instance, value):
+        state = instance.__dict__
+        state[self.name] = value
+        _discard_pending(state, self.name)
+
+    def __delete__(self, instance):
+        state = instance.__dict__
+        pending = _discard_pending(state, self.name)
+        if state.pop(self.name, MISSING) is MISSING and not pending:
+            raise AttributeError(self.name)
 
 
 class MappingMode(Enum):
@@ -14,193 +802,572 @@ class MappingMode(Enum):
     NoMap = 3
 
 
+def _is_binary(fileobj):
+    """Check whether a file object was opened in binary mode."""
+    return (isinstance(fileobj, (io.RawIOBase, io.BufferedIOBase)) or
+            'b' in getattr(fileobj, 'mode', ''))
+
+
+def _format_method(mapping_mode):
+    """Return the function that renames keys for a mapping mode, or None."""
+    if mapping_mode == MappingMode.NoMap:
+        return None
+    return to_snake if mapping_mode == MappingMode.SnakeCase else to_camel
+
+
 class TypedJsonMixin:
     """
     A very small Mixin that we can use in conjunction with Python 3.7
     @dataclass in order to get typed DTO validation.
+
+    Options can be given as keyword arguments in the class definition, for
+    example ``class Person(TypedJsonMixin, codegen=True)``:
+
+    :codegen: Generate a dedicated ``from_dict`` function for the class and
+              each mapping mode, instead of going through the generic path
+    :json_backend: The name of the json implementation used by the json
+                   methods, see ``backends.get_backend``. Defaults to the
+                   global default backend
+    :lazy: Defer the validation and construction of nested dataclasses and
+           lists of dataclasses until the field is first accessed, see
+           ``materialize``
+    :validation_level: The ValidationLevel that instances are checked with,
+                       unless a decoding method is given another one.
+                       Defaults to ``ValidationLevel.Full``
+    :intern_strings: Intern the values of all str, Optional[str] and
+                     List[str] fields, either in the given InternTable or,
+                     with True, in ``interning.default_intern_table``
+    :collect_errors: Check every field before raising, instead of stopping
+                     at the first invalid one. The ValidationError raised
+                     then lists the errors of all invalid fields
     """
 
+    # Slotted subclasses must not get a __dict__ from the mixin, see
+    # ``slots.slotted``
+    __slots__ = ()
+
+    _codegen = False
+    _json_backend = None
+    _lazy = False
+    _validation_level = ValidationLevel.Full
+    _intern_strings = None
+    _collect_errors = False
+
+    def __init_subclass__(cls, *, codegen=None, json_backend=None, lazy=None,
+                          validation_level=None, intern_strings=None,
+                          collect_errors=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if codegen is not None:
+            cls._codegen = codegen
+        if json_backend is not None:
+            cls._json_backend = json_backend
+        if lazy is not None:
+            cls._lazy = lazy
+        if validation_level is not None:
+            cls._validation_level = validation_level
+        if intern_strings is not None:
+            cls._intern_strings = intern_strings
+        if collect_errors is not None:
+            cls._collect_errors = collect_errors
+        if '__eq__' not in cls.__dict__ and has_numpy_fields(cls):
+            # dataclass keeps this __eq__ instead of generating one that
+            # compares numpy arrays element-wise
+            cls.__eq__ = numpy_fields_equal
+
     def __post_init__(self):
         """Validation logic that runs after an object has been instantiated.
 
         Based heavily on:
         https://stackoverflow.com/questions/50563546/validating-detailed-types-in-python-dataclasses
+
+        The checks for each field are compiled once per class, see
+        ``_validation_plan``, so that instantiation does not have to inspect
+        the type hints again.
         """
-        for field_def in fields(self):
-            field_name = field_def.name
+        if instrumentation.enabled:
+            instrumentation.timed(type(self), 'post_init', self._check_fields)
+        else:
+            self._check_fields()
+
+    def _check_fields(self):
+        """Run the validation plan of the level of the current call."""
+        level = current_level.get()
+        if level is None:
+            level = self._validation_level
+        else:
+            # The level of the call is recorded on the instance
+            object.__setattr__(self, '_call_level', level)
+
+        if self._lazy:
+            self._defer_fields(level)
+            return
+        if self._collect_errors:
+            self._check_all_fields(self._validation_plan(level))
+            return
+        for field_name, check in self._validation_plan(level):
             field_value = getattr(self, field_name)
-            actual_type = type(field_value)
+            if field_value is not None:
+                check(self, field_value)
 
-            if hasattr(field_def.type, '__origin__'):
-                # If a type hint uses typing.List, we need to check the origin
-                # in order to see that it's a list
-                expected_type = field_def.type.__origin__
-            else:
-                expected_type = field_def.type
+    def _check_all_fields(self, plan):
+        """Run every check of a validation plan, then raise all errors.
 
-            # Lists are a special case, because we have to get the list element
-            # type in a different way
+        The errors of nested instances are raised with the path of the
+        field that holds them, like ``'Parent.child.age'``.
+
+        :plan: The validation plan of the instance
+        """
+        class_name = type(self).__name__
+        errors = []
+        for field_name, check in plan:
+            field_value = getattr(self, field_name)
             if field_value is not None:
-                class_name = self.__class__.__name__
-
-                # A ForwardRef will appear to just be a str
-                # Check that the expected type is a str instead of an actual
-                # type definition, and check that the name of the current class
-                # matches the string in the ForwardRef.
-                if (class_name == expected_type and
-                        isinstance(expected_type, str)):
-                    # Double check that the type itself and the current class
-                    # are the same
-                    if actual_type != self.__class__:
-                        raise TypeError((f'{class_name}.{field_name} was '
-                                        'defined as a <class '
-                                         f"'{expected_type}'>, "
-                                         f'but we found a {actual_type} '
-                                         'instead'))
-                else:
-                    # Optionals are technically just Union[T, None]
-                    if expected_type == typing.Union:
-                        possible_types = field_def.type.__args__
-                        matches = (isinstance(field_value, possible_type) for
-                                   possible_type in possible_types)
-                        if not any(matches):
-                            raise TypeError((f'{class_name}.{field_name} was '
-                                             'defined to be any of: '
-                                             f'{possible_types} but was found '
-                                             f'to be {actual_type} instead'))
-
-                    elif (isinstance(field_value, expected_type) and
-                          isinstance(field_value, list)):
-                        if not hasattr(field_def.type, '__args__'):
-                            raise TypeError((f'{class_name}.{field_name} was '
-                                            f'defined as a {actual_type}, '
-                                             'but you must use '
-                                             'typing.List[type] '
-                                             'instead'))
-
-                        expected_element_type = field_def.type.__args__[0]
-                        if isinstance(expected_element_type, typing.TypeVar):
-                            raise TypeError((f'{class_name}.{field_name} was '
-                                            f'defined as a {actual_type}, '
-                                             'but is missing information '
-                                             'about the'
-                                             ' type of the elements inside '
-                                             'it'))
-
-                        if not self._ensure_no_native_collections(
-                                expected_element_type
-                                ):
-                            raise TypeError(((f'{class_name}.{field_name} was '
-                                              'detected to use a native '
-                                              'Python '
-                                              'collection in its type '
-                                              'definition. '
-                                              'We should only use '
-                                              'typing.List[] '
-                                              'for these')))
-
-                        for i, element in enumerate(field_value):
-                            if isinstance(element, dict):
-                                if not element:
-                                    raise TypeError(((f'{class_name}.'
-                                                      f'{field_name} '
-                                                      'was found to have an '
-                                                      'empty dictionary. An '
-                                                      'empty '
-                                                      'dictionary will not '
-                                                      'properly instantiate a '
-                                                      'nested object')))
-
-                                # Set reference of the specific list index.
-                                # Kind of a hack, to get around the fact that
-                                # __setattr__ can only seem to take field
-                                # names, but not indices
-                                getattr(
-                                    self, field_name
-                                )[i] = expected_element_type(**element)
-
-                        if not self._validate_list_types(
-                                field_value, field_def.type
-                                ):
-                            raise TypeError((f'{class_name}.{field_name} is '
-                                             f'{field_value} which does not '
-                                             'match '
-                                             f'{field_def.type}. '
-                                             'Unfortunately, '
-                                             'we are unable to infer the '
-                                             'explicit '
-                                             f'type of {class_name}.'
-                                             f'{field_name}'))
-
-                    elif not isinstance(field_value, expected_type):
-                        if isinstance(field_value, dict):
-                            if not self._ensure_no_native_collections(
-                                    expected_type
-                                  ):
-                                raise TypeError((f'{class_name}.{field_name} '
-                                                 'was '
-                                                 'detected to use a native '
-                                                 'Python '
-                                                 'dict in its type '
-                                                 'definition. '
-                                                 'We should only use custom '
-                                                 'objects for these'))
-                            try:
-                                setattr(
-                                    self,
-                                    field_name,
-                                    expected_type(**field_value)
-                                )
-                            except TypeError:
-                                raise TypeError(f'{class_name}.{field_name} '
-                                                'is '
-                                                'expected to be '
-                                                f'{expected_type}, but value '
-                                                f'{field_value} is a dict '
-                                                'with unexpected keys')
-                        else:
-                            raise TypeError(f'{class_name}.{field_name} is '
-                                            'expected to be '
-                                            f'{expected_type}, but value '
-                                            f'{field_value} with '
-                                            f'type {actual_type} was found '
-                                            'instead')
-
-    def _ensure_no_native_collections(self, expected_type):
-        """
-        Recursively drills down a type hint like List[List[list]] to make
-        sure we never use a native collections.
-        """
-        if hasattr(expected_type, '__origin__'):
-            return self._ensure_no_native_collections(
-                expected_type.__args__[0]
-            )
+                try:
+                    check(self, field_value)
+                except ValidationError as error:
+                    # Errors of nested instances are listed one by one
+                    errors += error.within(f'{class_name}.{field_name}')
+        if errors:
+            raise ValidationError.collect(class_name, errors)
+
+    @classmethod
+    def _validation_plan(cls, level=ValidationLevel.Full):
+        """Return the list of ``(field_name, checker)`` pairs for this class.
+
+        There is a plan for each ValidationLevel. The plan of the trusted
+        level only contains the fields that hold nested dataclasses, also
+        as members of a Union, hold containers like Dict or Tuple, are
+        stored in arrays or have their strings interned.
+
+        The plan is built on first use instead of in ``__init_subclass__``,
+        because the ``@dataclass`` decorator only adds the fields after the
+        class body has been executed. It is stored on the class itself, so
+        that subclasses build their own plan.
+        """
+        key = 'plan' if level is ValidationLevel.Full else ('plan', level)
+        try:
+            return cls.__dict__['_typed_json_cache'][key]
+        except KeyError:
+            pass
+
+        plan = []
+        for field_def in fields(cls):
+            if level is not ValidationLevel.Trusted:
+                check = cls._compile_field_checker(field_def, level)
+            elif (array_spec(field_def) is not None or
+                    (not is_union(field_def.type) and
+                     _nested_target(cls, field_def.type) is not None)):
+                # Unions, Optional included, are converted by the union
+                # checker below
+                check = _compile_trusted_converter(cls, field_def)
+            elif is_container(field_def.type):
+                check = _compile_container_checker(cls, field_def, level)
+            elif (is_union(field_def.type) and
+                    _union_converts(cls, field_def.type)):
+                check = _compile_union_checker(cls, field_def, level)
+            else:
+                check = None
+
+            table = intern_table(cls, field_def)
+            if table is not None:
+                check = _compile_interning(field_def, check, table)
+            if check is not None:
+                plan.append((field_def.name, check))
+        class_cache(cls)[key] = plan
+        return plan
+
+    @classmethod
+    def _field_checkers(cls, level):
+        """Return the checkers of the validation plan of a level by name."""
+        key = ('checkers', level)
+        try:
+            return cls.__dict__['_typed_json_cache'][key]
+        except KeyError:
+            checkers = dict(cls._validation_plan(level))
+            class_cache(cls)[key] = checkers
+            return checkers
+
+    @classmethod
+    def _nested_fields(cls):
+        """Return the fields of this class that hold nested dataclasses.
+
+        :returns: A list of (field name, nested dataclass, whether the field
+                  is a list) tuples
+        """
+        nested_fields = []
+        for field_def in fields(cls):
+            target = _nested_target(cls, field_def.type)
+            if (target is not None and array_spec(field_def) is None and
+                    union_spec(field_def) is None):
+                nested_fields.append((field_def.name,) + target)
+        return nested_fields
+
+    @classmethod
+    def _decode_plan(cls):
+        """Return the fields whose raw dicts ``_decode_tree`` instantiates.
+
+        Only classes that can contain themselves, directly or through other
+        classes, have a plan: the depth of any other document is bounded by
+        the class definitions. Lazy classes keep the raw values of their
+        nested dataclasses, so they do not have a plan either.
+
+        :returns: A list of (field name, nested dataclass, whether the field
+                  is a list, constructor of the nested dataclass) tuples
+        """
+        try:
+            return cls.__dict__['_typed_json_cache']['decode_plan']
+        except KeyError:
+            pass
+
+        plan = []
+        if not cls._lazy and cls._is_recursive():
+            # The dicts nested in the dicts of the plan are already replaced
+            # when these constructors are called
+            plan = [(field_name, nested_cls, many,
+                     _generated_constructor(nested_cls)
+                     if nested_cls._codegen else nested_cls._construct)
+                    for field_name, nested_cls, many in cls._nested_fields()
+                    if issubclass(nested_cls, TypedJsonMixin)]
+        class_cache(cls)['decode_plan'] = plan
+        return plan
+
+    @classmethod
+    def _is_recursive(cls):
+        """Check whether instances of this class can be nested in each other.
+
+        :returns: True if the class can be reached from its own fields
+        """
+        seen = set()
+        worklist = [cls]
+        while worklist:
+            current = worklist.pop()
+            for _, nested_cls, _ in current._nested_fields():
+                if nested_cls is cls:
+                    return True
+                if (nested_cls not in seen and
+                        issubclass(nested_cls, TypedJsonMixin)):
+                    seen.add(nested_cls)
+                    worklist.append(nested_cls)
+        return False
+
+    @classmethod
+    def _lazy_fields(cls):
+        """Return the fields whose checks lazy instances may defer.
+
+        The fields are the ones holding a nested dataclass or a list of
+        dataclasses. A ``_LazyField`` is put on the class for each of them,
+        which runs the deferred checks on first access.
+
+        :returns: A dict from field name to the type of raw value that is
+                  deferred
+        """
+        try:
+            return cls.__dict__['_typed_json_cache']['lazy_fields']
+        except KeyError:
+            pass
+
+        lazy_fields = {}
+        for field_def in fields(cls):
+            raw_type = _raw_nested_type(field_def.type)
+            if raw_type is None:
+                continue
+            lazy_fields[field_def.name] = raw_type
+            if not isinstance(cls.__dict__.get(field_def.name), _LazyField):
+                setattr(cls, field_def.name,
+                        _LazyField(field_def.name, field_def.default))
+        class_cache(cls)['lazy_fields'] = lazy_fields
+        return lazy_fields
+
+    def _defer_fields(self, level):
+        """Run the validation plan, keeping nested raw values for later.
+
+        Raw dicts of nested dataclasses and lists of dataclasses are moved
+        from the instance into ``_pending_fields`` without being checked.
+        All other fields are checked right away.
+
+        :level: The ValidationLevel of the instance
+        """
+        lazy_fields = self._lazy_fields()
+        pending = {}
+        checks = []
+        for field_name, check in self._validation_plan(level):
+            field_value = getattr(self, field_name)
+            if field_value is None:
+                continue
+            if isinstance(field_value, lazy_fields.get(field_name, ())):
+                pending[field_name] = field_value
+            else:
+                checks.append((field_name, check))
+        if self._collect_errors:
+            self._check_all_fields(checks)
         else:
-            return expected_type not in {dict, list, set, tuple}
-
-    def _validate_list_types(self, actual_value, expected_type):
-        """
-        Recursively checks nested lists like List[List[str]] and checks that
-        all elements in the list are uniform
-        """
-        # typing.List[type] will have __args__
-        if isinstance(actual_value, list) and \
-           hasattr(expected_type, '__args__'):
-            nested_type = expected_type.__args__[0]
-            if isinstance(nested_type, typing.ForwardRef):
-                # Strip out ForwardRef(' and ') as a hack for getting the
-                # expected class
-                type_for_forward_ref = str(nested_type)[12:-2]
-                return all(
-                    type_for_forward_ref == v.__class__.__name__
-                    for v in actual_value
-                )
-
-            return all(
-                self._validate_list_types(v, nested_type) for v in actual_value
-            )
+            for field_name, check in checks:
+                check(self, getattr(self, field_name))
+
+        if pending:
+            state = self.__dict__
+            for field_name in pending:
+                del state[field_name]
+            state['_pending_fields'] = pending
+
+    def _materialize_field(self, field_name):
+        """Check and construct a deferred field, and return its value.
+
+        The check runs at the level the instance was created with. If it
+        fails the raw value stays pending, so that every access raises the
+        same error.
+
+        :field_name: The name of the field
+        :returns: The value of the field
+        :raises AttributeError: If the field is neither set nor pending
+        """
+        state = self.__dict__
+        pending = state.get('_pending_fields')
+        if pending is None or field_name not in pending:
+            raise AttributeError(f"'{type(self).__name__}' object has no "
+                                 f"attribute '{field_name}'")
+
+        field_value = pending[field_name]
+        state[field_name] = field_value
+        check = self._field_checkers(self.validation_level())[field_name]
+        token = current_level.set(state.get('_call_level'))
+        try:
+            check(self, field_value)
+        except Exception:
+            del state[field_name]
+            raise
+        finally:
+            current_level.reset(token)
+        # Checks that replace the value already discarded it, see _LazyField
+        _discard_pending(state, field_name)
+        return state[field_name]
+
+    def materialize(self):
+        """Check and construct every deferred field, recursively.
+
+        Only instances of lazy classes defer any work, for all other
+        instances this only descends into the nested instances.
+
+        :returns: The instance itself
+        :raises TypeError: If a deferred field does not match its type
+        """
+        for field_def in fields(self):
+            field_value = getattr(self, field_def.name, None)
+            if isinstance(field_value, dict):
+                elements = field_value.values()
+            elif isinstance(field_value, (list, tuple, set, frozenset)):
+                elements = field_value
+            else:
+                elements = (field_value,)
+            for element in elements:
+                if isinstance(element, TypedJsonMixin):
+                    element.materialize()
+        return self
+
+    def validation_level(self):
+        """Return the ValidationLevel that this instance was checked with.
+
+        This is the level given to the decoding method that created the
+        instance, or the level of its class.
+        """
+        return getattr(self, '_call_level', None) or self._validation_level
+
+    @classmethod
+    def _compile_field_checker(cls, field_def, level=ValidationLevel.Full):
+        """Build the checker for a single field of this class.
+
+        The returned callable takes the instance and the (non None) value of
+        the field. It raises a TypeError if the value does not match the type
+        hint, and replaces nested dicts with instances of the nested type.
+
+        At the sampled level, only a sample of the elements of lists is
+        checked, and only lists of dataclasses are searched for dicts to
+        replace.
+        """
+        field_name = field_def.name
+        field_type = field_def.type
+        class_name = cls.__name__
+        path = f'{class_name}.{field_name}'
+
+        spec = array_spec(field_def)
+        if spec is not None:
+            return _compile_array_checker(class_name, field_def, spec)
+
+        if hasattr(field_type, '__origin__'):
+            # If a type hint uses typing.List, we need to check the origin
+            # in order to see that it's a list
+            expected_type = field_type.__origin__
         else:
-            return isinstance(actual_value, expected_type)
+            expected_type = field_type
+
+        # A ForwardRef will appear to just be a str
+        # Check that the expected type is a str instead of an actual
+        # type definition, and check that the name of the current class
+        # matches the string in the ForwardRef.
+        if class_name == expected_type and isinstance(expected_type, str):
+            def check_forward_ref(instance, field_value):
+                actual_type = type(field_value)
+                if actual_type is dict:
+                    try:
+                        setattr(instance, field_name, cls(**field_value))
+                    except TypeError as error:
+                        if (cls._collect_errors and
+                                isinstance(error, ValidationError)):
+                            # Listed with the path of this field, see
+                            # _check_all_fields
+                            raise
+                        raise ValidationError(
+                            path, cls, actual_type,
+                            lambda: (f'{path} is expected to be {cls}, but '
+                                     f'value {field_value} is a dict with '
+                                     'unexpected keys'))
+                # Double check that the type itself and the current class
+                # are the same
+                elif actual_type != cls:
+                    raise ValidationError(
+                        path, cls, actual_type,
+                        lambda: (f'{path} was defined as a <class '
+                                 f"'{expected_type}'>, but we found a "
+                                 f'{actual_type} instead'))
+            return check_forward_ref
+
+        # Optionals are technically just Union[T, None]
+        if expected_type == typing.Union:
+            return _compile_union_checker(cls, field_def, level)
+
+        if is_container(field_type):
+            return _compile_container_checker(cls, field_def, level)
+
+        has_element_type = hasattr(field_type, '__args__')
+        if has_element_type:
+            expected_element_type = field_type.__args__[0]
+            element_is_type_var = isinstance(expected_element_type,
+                                             typing.TypeVar)
+            element_is_native = not cls._ensure_no_native_collections(
+                expected_element_type
+            )
+            validate_list = _compile_list_validator(
+                field_type, level is ValidationLevel.Sampled)
+            if (isinstance(expected_element_type, typing.ForwardRef) and
+                    expected_element_type.__forward_arg__ == class_name):
+                def construct_element(raw_dict):
+                    return cls(**raw_dict)
+            else:
+                construct_element = _nested_constructor(
+                    expected_element_type)
+            construct_elements = (level is ValidationLevel.Full or
+                                  _nested_target(cls, field_type) is not None)
+        expected_type_is_native = not cls._ensure_no_native_collections(
+            expected_type
+        )
+        construct = _nested_constructor(expected_type)
+
+        def check(instance, field_value):
+            actual_type = type(field_value)
+            # Lists are a special case, because we have to get the list
+            # element type in a different way
+            if (isinstance(field_value, expected_type) and
+                    isinstance(field_value, list)):
+                if not has_element_type:
+                    raise ValidationError(
+                        path, field_type, actual_type,
+                        lambda: (f'{path} was defined as a {actual_type}, '
+                                 'but you must use typing.List[type] '
+                                 'instead'))
+
+                if element_is_type_var:
+                    raise ValidationError(
+                        path, field_type, actual_type,
+                        lambda: (f'{path} was defined as a {actual_type}, '
+                                 'but is missing information about the '
+                                 'type of the elements inside it'))
+
+                if element_is_native:
+                    raise ValidationError(
+                        path, field_type, actual_type,
+                        lambda: (f'{path} was detected to use a native '
+                                 'Python collection in its type '
+                                 'definition. We should only use '
+                                 'typing.List[] for these'))
+
+                if construct_elements:
+                    for i, element in enumerate(field_value):
+                        if isinstance(element, dict):
+                            if not element:
+                                raise ValidationError(
+                                    path, field_type, actual_type,
+                                    lambda: (f'{path} was found to have an '
+                                             'empty dictionary. An empty '
+                                             'dictionary will not '
+                                             'properly instantiate a '
+                                             'nested object'))
+
+                            # Replace the element in place, the list is the
+                            # same object as the attribute of the instance
+                            try:
+                                field_value[i] = construct_element(element)
+                            except ValidationError as error:
+                                if not cls._collect_errors:
+                                    raise
+                                # Listed with the path of the element, see
+                                # _check_all_fields
+                                raise ValidationError.collect(
+                                    class_name,
+                                    error.within(f'{path}[{i}]')) from None
+
+                if not validate_list(field_value):
+                    raise ValidationError(
+                        path, field_type, actual_type,
+                        lambda: (f'{path} is {field_value} which does not '
+                                 f'match {field_type}. Unfortunately, we '
+                                 'are unable to infer the explicit type of '
+                                 f'{path}'))
+
+            elif not isinstance(field_value, expected_type):
+                if isinstance(field_value, dict):
+                    if expected_type_is_native:
+                        raise ValidationError(
+                            path, expected_type, actual_type,
+                            lambda: (f'{path} was detected to use a native '
+                                     'Python dict in its type definition. '
+                                     'We should only use custom objects '
+                                     'for these'))
+                    try:
+                        setattr(
+                            instance,
+                            field_name,
+                            construct(field_value)
+                        )
+                    except TypeError as error:
+                        if (cls._collect_errors and
+                                isinstance(error, ValidationError)):
+                            # Listed with the path of this field, see
+                            # _check_all_fields
+                            raise
+                        raise ValidationError(
+                            path, expected_type, actual_type,
+                            lambda: (f'{path} is expected to be '
+                                     f'{expected_type}, but value '
+                                     f'{field_value} is a dict with '
+                                     'unexpected keys'))
+                else:
+                    raise ValidationError(
+                        path, expected_type, actual_type,
+                        lambda: (f'{path} is expected to be '
+                                 f'{expected_type}, but value '
+                                 f'{field_value} with type {actual_type} '
+                                 'was found instead'))
+        return check
+
+    @staticmethod
+    def _ensure_no_native_collections(expected_type):
+        """
+        Drills down a type hint like List[List[list]] to make sure we never
+        use a native collections.
+        """
+        while hasattr(expected_type, '__origin__'):
+            expected_type = expected_type.__args__[0]
+        return expected_type not in {dict, list, set, tuple}
 
     @classmethod
     def _contains_non_default_init_vars(cls, previous_classes=None):
@@ -211,32 +1378,161 @@ class TypedJsonMixin:
         variables. The ``previous_classes`` argument is a set of previously
         checked classes to prevent infinite recursion on recursive structures.
 
+        The answer only depends on the class definitions, so it is computed
+        once per class, see ``invalidate_caches``.
+
         :param previous_classes: The set of previously checked classes.
         """
+        if previous_classes is not None:
+            return _has_non_default_init_vars(cls, previous_classes)
+
+        try:
+            return cls.__dict__['_typed_json_cache']['init_vars']
+        except KeyError:
+            has_init_vars = _has_non_default_init_vars(cls, set())
+            class_cache(cls)['init_vars'] = has_init_vars
+            return has_init_vars
+
+    @classmethod
+    def _can_bypass_init(cls):
+        """Check whether instances may be built without calling __init__.
+
+        This is only the case when both ``__init__`` and ``__post_init__``
+        are the ones from ``dataclasses`` and this mixin, every field is
+        a regular ``__init__`` argument, and the class is neither lazy, nor
+        collecting errors, nor checked at another level than the full one.
+        """
+        init = cls.__init__
+        return (cls.__post_init__ is TypedJsonMixin.__post_init__ and
+                not cls._lazy and
+                not cls._collect_errors and
+                cls._validation_level is ValidationLevel.Full and
+                cls.__new__ is object.__new__ and
+                cls.__dataclass_params__.init and
+                getattr(init, '__code__', None) is not None and
+                init.__code__.co_filename == '<string>' and
+                all(field.init for field in fields(cls)) and
+                not any(_is_init_var(field.type)
+                        for field in cls.__dataclass_fields__.values()))
+
+    @classmethod
+    def _field_name_table(cls, format_method):
+        """Return the raw keys that map to the fields of this class.
+
+        The table contains the field names, and their snake and camel case
+        versions, that ``format_method`` converts into a field name. It lets
+        the keys of the fields be renamed without calling ``format_method``.
+
+        :format_method: The function that renames raw keys
+        :returns: A dict from raw key to field name
+        """
+        key = ('field_names', format_method)
         try:
-            previous_classes.add(cls)
-        except AttributeError:  # NoneType
-            previous_classes = {cls}
-
-        # The identify check (.. is MISSING) is fine, MISSING is a singleton
-        has_init_vars = any(field.type == InitVar and field.default is MISSING
-                            for field in cls.__dataclass_fields__.values())
-        children_have_init_vars = any(
-                child.type._contains_non_default_init_vars(previous_classes)
-                for child in fields(cls)
-                if (is_dataclass(child.type)
-                    and child.type not in previous_classes))
-        return has_init_vars or children_have_init_vars
+            return cls.__dict__['_typed_json_cache'][key]
+        except KeyError:
+            table = {}
+            for field_def in fields(cls):
+                for raw_key in {field_def.name, to_camel(field_def.name),
+                                to_snake(field_def.name)}:
+                    if format_method(raw_key) == field_def.name:
+                        table[raw_key] = field_def.name
+            class_cache(cls)[key] = table
+            return table
 
     @classmethod
-    def from_dict(cls, raw_dict, *, mapping_mode=MappingMode.NoMap):
-        """Given a python dict, create an instance of the implementing class.
+    def _rename_rule(cls, format_method):
+        """Return the RenameRule of the dicts of this class, or None.
+
+        Only classes with typed dict fields, directly or through their
+        nested classes, have a rule, see ``utils.RenameRule``. The dicts of
+        other classes are renamed all the way down.
+
+        :format_method: The function that renames raw keys
+        """
+        key = ('rename_rule', format_method)
+        try:
+            return cls.__dict__['_typed_json_cache'][key]
+        except KeyError:
+            pass
+
+        field_rules = {}
+        rule = RenameRule(False, cls._field_name_table(format_method),
+                          field_rules, None)
+        # Stored before the rules of the fields are built, which may refer
+        # to the class itself
+        class_cache(cls)[key] = rule
+        for field_def in fields(cls):
+            field_rule = _hint_rename_rule(cls, field_def.type, format_method)
+            if field_rule is not None:
+                field_rules[field_def.name] = field_rule
+        if not field_rules:
+            rule = class_cache(cls)[key] = None
+        return rule
+
+    @classmethod
+    def _compiled_from_dict(cls, mapping_mode):
+        """Return the generated ``from_dict`` function for a mapping mode.
+
+        The functions are generated on first use and stored on the class.
 
-        :raw_dict: A dictionary that represents the DTO to create
         :mapping_mode: Format for properties
-        :returns: Returns an instance of the DTO, instantiated via the dict
+        :returns: A function that takes a raw dict and returns an instance
+        """
+        key = ('from_dict', mapping_mode)
+        try:
+            return cls.__dict__['_typed_json_cache'][key]
+        except KeyError:
+            pass
+
+        format_method = _format_method(mapping_mode)
+        bypass_init = cls._can_bypass_init()
+        nested_decoders = {}
+        if format_method is not None and bypass_init:
+            nested_decoders = {
+                field_def.name:
+                    field_def.type._compiled_from_dict(mapping_mode)
+                for field_def in fields(cls)
+                if (isinstance(field_def.type, type) and
+                    issubclass(field_def.type, TypedJsonMixin) and
+                    field_def.type._codegen)
+            }
+        known_names = None
+        field_rules = {}
+        if format_method is not None:
+            known_names = cls._field_name_table(format_method)
+            rule = cls._rename_rule(format_method)
+            if rule is not None:
+                field_rules = rule.fields
+        decoder = build_from_dict(cls,
+                                  format_method=format_method,
+                                  known_names=known_names,
+                                  field_rules=field_rules,
+                                  nested_decoders=nested_decoders,
+                                  bypass_init=bypass_init)
+        class_cache(cls)[key] = decoder
+        return decoder
+
+    @classmethod
+    def _backend(cls):
+        """Return the json backend of this class.
+
+        The backend is looked up on every call, so that changes of the
+        default backend apply to classes that did not select one.
         """
+        return get_backend(cls._json_backend)
 
+    @classmethod
+    def _decoder(cls, mapping_mode, validation_level=None):
+        """Check the options of from_dict and return the decoding function.
+
+        This is done once per call of the decoding methods, so that decoding
+        many dicts only pays for it once.
+
+        :mapping_mode: Format for properties
+        :validation_level: The ValidationLevel of the call, or None for the
+                           levels of the classes
+        :returns: A function that takes a raw dict and returns an instance
+        """
         if not isinstance(mapping_mode, MappingMode):
             raise ValueError('Invalid mapping mode')
 
@@ -244,58 +1540,229 @@ class TypedJsonMixin:
             raise TypeError('Cannot instantiate a dataclass with non-default '
                             'init-only variables')
 
-        if mapping_mode == MappingMode.NoMap:
-            return cls(**raw_dict)
+        format_method = _format_method(mapping_mode)
+        # Generated decoders rename the keys inline, so the generic path is
+        # taken while instrumented to time the renaming on its own
+        instrumented = instrumentation.enabled
+        # Classes that can contain themselves are always decoded without
+        # recursion, see _decode_tree
+        recursive = bool(cls._decode_plan())
+        construct = cls._construct_tree if recursive else cls._construct
+        if cls._codegen and not instrumented and not recursive:
+            decode = cls._compiled_from_dict(mapping_mode)
+        elif format_method is None:
+            decode = construct
+        else:
+            known_names = cls._field_name_table(format_method)
+            rule = cls._rename_rule(format_method)
+            rename = recursive_rename
+            if instrumented:
+                rename = partial(instrumentation.timed, cls, 'rename',
+                                 recursive_rename)
 
-        format_method = to_snake if mapping_mode == MappingMode.SnakeCase \
-            else to_camel
-        mapped_dict = recursive_rename(raw_dict, format_method)
-        return cls(**mapped_dict)
+            def decode(raw_dict):
+                return construct(rename(raw_dict, format_method, known_names,
+                                        rule))
+        if instrumented:
+            decode = partial(instrumentation.timed, cls, 'from_dict', decode)
+        return with_level(validation_level, decode)
 
     @classmethod
-    def from_json(cls, raw_json, *, mapping_mode=MappingMode.NoMap):
+    def _construct(cls, raw_dict):
+        """Instantiate the class from a dict whose keys are field names."""
+        return cls(**raw_dict)
+
+    @classmethod
+    def _construct_tree(cls, raw_dict):
+        """Instantiate the class and its nested dataclasses from a dict.
+
+        The nested dataclasses are instantiated without recursion, see
+        ``_decode_tree``, which raises the error of a regular instantiation.
+        """
+        return _decode_tree(cls, raw_dict)
+
+    @classmethod
+    def from_dict(cls, raw_dict, *, mapping_mode=MappingMode.NoMap,
+                  validation_level=None):
+        """Given a python dict, create an instance of the implementing class.
+
+        :raw_dict: A dictionary that represents the DTO to create
+        :mapping_mode: Format for properties
+        :validation_level: The ValidationLevel to check the DTO and its
+                           nested DTOs with, instead of the class defaults
+        :returns: Returns an instance of the DTO, instantiated via the dict
+        """
+        return cls._decoder(mapping_mode, validation_level)(raw_dict)
+
+    @classmethod
+    def from_json(cls, raw_json, *, mapping_mode=MappingMode.NoMap,
+                  validation_level=None):
         """Given a raw json string, create an instance of the implementing class.
 
         :raw_json: A json string that represents the DTO to create
         :mapping_mode: Format for properties
+        :validation_level: The ValidationLevel to check the DTO and its
+                           nested DTOs with, instead of the class defaults
         :returns: Returns an instance of the DTO, instantiated via the json
         """
 
-        return cls.from_dict(json.loads(raw_json), mapping_mode=mapping_mode)
+        return cls.from_dict(cls._backend().loads(raw_json),
+                             mapping_mode=mapping_mode,
+                             validation_level=validation_level)
 
-    def to_dict(self, *, keep_none=False, mapping_mode=MappingMode.NoMap,
-                warn_on_initvar=True):
-        """Express the DTO as a dictionary.
+    @classmethod
+    def from_dicts(cls, raw_dicts, *, mapping_mode=MappingMode.NoMap,
+                   as_iterator=False, validation_level=None):
+        """Given an iterable of python dicts, create an instance for each.
 
-        :keep_none: Filter keys that are None
+        :raw_dicts: An iterable of dictionaries that represent the DTOs
         :mapping_mode: Format for properties
-        :warn_on_initvar: Emit a warning if the instance contains non-default
+        :as_iterator: Return an iterator that creates the instances as it is
+                      consumed, instead of a list
+        :validation_level: The ValidationLevel to check the DTOs and their
+                           nested DTOs with, instead of the class defaults
+        :returns: Returns a list of DTOs, in the order of the dicts
+        """
+        decoder = cls._decoder(mapping_mode, validation_level)
+        if as_iterator:
+            return map(decoder, raw_dicts)
+        return [decoder(raw_dict) for raw_dict in raw_dicts]
+
+    @classmethod
+    def from_json_array(cls, raw_json, *, mapping_mode=MappingMode.NoMap,
+                        as_iterator=False, validation_level=None):
+        """Given a json array of objects, create an instance for each.
+
+        :raw_json: A json string of an array of DTOs
+        :mapping_mode: Format for properties
+        :as_iterator: Return an iterator that creates the instances as it is
+                      consumed, instead of a list
+        :validation_level: The ValidationLevel to check the DTOs and their
+                           nested DTOs with, instead of the class defaults
+        :returns: Returns a list of DTOs, in the order of the array
+        """
+        raw_dicts = cls._backend().loads(raw_json)
+        if not isinstance(raw_dicts, list):
+            raise TypeError('Expected a json array, but found a '
+                            f'{type(raw_dicts)} instead')
+        return cls.from_dicts(raw_dicts, mapping_mode=mapping_mode,
+                              as_iterator=as_iterator,
+                              validation_level=validation_level)
+
+    @classmethod
+    def from_json_lines(cls, raw_lines, *, mapping_mode=MappingMode.NoMap,
+                        as_iterator=False, validation_level=None):
+        """Given json lines, create an instance for each line.
+
+        Blank lines are skipped.
+
+        :raw_lines: A string with one json object per line, or an iterable of
+                    such lines
+        :mapping_mode: Format for properties
+        :as_iterator: Return an iterator that creates the instances as it is
+                      consumed, instead of a list
+        :validation_level: The ValidationLevel to check the DTOs and their
+                           nested DTOs with, instead of the class defaults
+        :returns: Returns a list of DTOs, in the order of the lines
+        """
+        if isinstance(raw_lines, (str, bytes)):
+            raw_lines = raw_lines.splitlines()
+        loads = cls._backend().loads
+        raw_dicts = (loads(line) for line in raw_lines if line.strip())
+        return cls.from_dicts(raw_dicts, mapping_mode=mapping_mode,
+                              as_iterator=as_iterator,
+                              validation_level=validation_level)
+
+    @classmethod
+    def from_json_lines_parallel(cls, raw_lines, *, workers=None,
+                                 chunk_size=1000,
+                                 mapping_mode=MappingMode.NoMap,
+                                 as_iterator=False, validation_level=None,
+                                 executor=None):
+        """Given json lines, create an instance for each line in a pool.
+
+        The lines are decoded and validated in a pool of worker processes,
+        ``chunk_size`` lines at a time, and the instances are pickled back.
+        The class must therefore be importable by the workers. Strings that
+        are interned are only shared within a chunk. Blank lines are
+        skipped.
+
+        :raw_lines: A string with one json object per line, or an iterable of
+                    such lines, like a file object
+        :workers: The number of worker processes, or None for one per core
+        :chunk_size: The number of lines sent to a worker at once
+        :mapping_mode: Format for properties
+        :as_iterator: Return an iterator that creates the instances as it is
+                      consumed, instead of a list
+        :validation_level: The ValidationLevel to check the DTOs and their
+                           nested DTOs with, instead of the class defaults
+        :executor: An executor to use instead of a new ProcessPoolExecutor.
+                   It is not shut down afterwards
+        :returns: Returns a list of DTOs, in the order of the lines
+        """
+        # Check the options before any worker is started
+        cls._decoder(mapping_mode, validation_level)
+        if isinstance(raw_lines, (str, bytes)):
+            raw_lines = raw_lines.splitlines()
+        instances = decode_in_parallel(cls, raw_lines, workers=workers,
+                                       chunk_size=chunk_size,
+                                       mapping_mode=mapping_mode,
+                                       validation_level=validation_level,
+                                       executor=executor)
+        return instances if as_iterator else list(instances)
+
+    @classmethod
+    def _prepare_encoding(cls, mapping_mode, warn_on_initvar):
+        """Check the options of to_dict and return the format method.
+
+        :mapping_mode: Format for properties
+        :warn_on_initvar: Emit a warning if the class contains non-default
                           init-only variables.
-        :returns: Returns the instantiated DTO as a dictionary
+        :returns: The function to rename keys with, or None
         """
         if not isinstance(mapping_mode, MappingMode):
             raise ValueError('Invalid mapping mode')
 
-        if self._contains_non_default_init_vars() and warn_on_initvar:
+        if warn_on_initvar and cls._contains_non_default_init_vars():
             warn('Dataclasses with init-only variables cannot be '
                  're-instantiated from a dict or JSON string')
 
-        self_dict = None
-        mapped_dict = {}
+        return _format_method(mapping_mode)
 
-        if keep_none:
-            self_dict = asdict(self)
-        else:
-            self_dict = {k: v for k, v in asdict(self).items()
-                         if v is not None}
+    def to_dict(self, *, keep_none=False, mapping_mode=MappingMode.NoMap,
+                warn_on_initvar=True):
+        """Express the DTO as a dictionary.
 
-        if mapping_mode == MappingMode.NoMap:
-            return self_dict
+        :keep_none: Filter keys that are None
+        :mapping_mode: Format for properties
+        :warn_on_initvar: Emit a warning if the instance contains non-default
+                          init-only variables.
+        :returns: Returns the instantiated DTO as a dictionary
+        """
+        format_method = self._prepare_encoding(mapping_mode, warn_on_initvar)
+        serialize = serializer_for(type(self), keep_none, format_method)
+        if instrumentation.enabled:
+            return instrumentation.timed(type(self), 'to_dict', serialize,
+                                         self)
+        return serialize(self)
+
+    def to_mapping_view(self, *, keep_none=False,
+                        mapping_mode=MappingMode.NoMap, warn_on_initvar=True):
+        """Express the DTO as a read-only mapping, without copying it.
 
-        format_method = to_snake if mapping_mode == MappingMode.SnakeCase \
-            else to_camel
-        mapped_dict = recursive_rename(self_dict, format_method)
-        return mapped_dict
+        The mapping has the keys and values that ``to_dict`` would return,
+        but they are looked up on the instance when they are accessed.
+        Nested DTOs and dicts are mappings too, and lists, tuples, sets and
+        arrays are read-only sequences, see ``views.py``.
+
+        :keep_none: Filter keys that are None
+        :mapping_mode: Format for properties
+        :warn_on_initvar: Emit a warning if the instance contains non-default
+                          init-only variables.
+        :returns: Returns a Mapping of the instantiated DTO
+        """
+        format_method = self._prepare_encoding(mapping_mode, warn_on_initvar)
+        return DataclassView(self, keep_none, format_method)
 
     def to_json(self, *, keep_none=False, mapping_mode=MappingMode.NoMap,
                 warn_on_initvar=True):
@@ -307,7 +1774,254 @@ class TypedJsonMixin:
                           init-only variables.
         :returns: Returns the instantiated DTO as a json string
         """
-        return json.dumps(self.to_dict(
+        return self._backend().dumps(self.to_dict(
             keep_none=keep_none,
             mapping_mode=mapping_mode,
             warn_on_initvar=warn_on_initvar))
+
+    def to_json_bytes(self, *, keep_none=False,
+                      mapping_mode=MappingMode.NoMap, warn_on_initvar=True):
+        """Express the DTO as utf-8 encoded json bytes.
+
+        Backends like orjson produce bytes directly, which avoids encoding
+        the json string again.
+
+        :keep_none: Filter keys that are None
+        :mapping_mode: Format for properties
+        :warn_on_initvar: Emit a warning if the instance contains non-default
+                          init-only variables.
+        :returns: Returns the instantiated DTO as json bytes
+        """
+        return self._backend().dumps_bytes(self.to_dict(
+            keep_none=keep_none,
+            mapping_mode=mapping_mode,
+            warn_on_initvar=warn_on_initvar))
+
+    def iter_json(self, *, keep_none=False, mapping_mode=MappingMode.NoMap,
+                  warn_on_initvar=True, chunk_size=DEFAULT_CHUNK_SIZE,
+                  as_bytes=False):
+        """Express the DTO as json, in chunks.
+
+        The DTO is encoded as it is walked, without building its dict or the
+        whole json string, see ``encoding.py``. Joined together, the chunks
+        are what ``to_json`` returns with the default json backend, which
+        the other backends are not used for.
+
+        :keep_none: Filter keys that are None
+        :mapping_mode: Format for properties
+        :warn_on_initvar: Emit a warning if the instance contains non-default
+                          init-only variables.
+        :chunk_size: The number of characters of each chunk, approximately
+        :as_bytes: Produce utf-8 encoded bytes instead of str
+        :returns: Returns an iterator of the chunks of the json
+        """
+        chunks = iter_json_chunks(
+            self.to_mapping_view(keep_none=keep_none,
+                                 mapping_mode=mapping_mode,
+                                 warn_on_initvar=warn_on_initvar),
+            chunk_size)
+        if as_bytes:
+            return (chunk.encode('utf-8') for chunk in chunks)
+        return chunks
+
+    def dump_json(self, fileobj, *, keep_none=False,
+                  mapping_mode=MappingMode.NoMap, warn_on_initvar=True,
+                  chunk_size=DEFAULT_CHUNK_SIZE):
+        """Write the DTO to a file as json, one chunk at a time.
+
+        See ``iter_json``.
+
+        :fileobj: A file object opened in text or binary mode
+        :keep_none: Filter keys that are None
+        :mapping_mode: Format for properties
+        :warn_on_initvar: Emit a warning if the instance contains non-default
+                          init-only variables.
+        :chunk_size: The number of characters written at once, approximately
+        """
+        for chunk in self.iter_json(keep_none=keep_none,
+                                    mapping_mode=mapping_mode,
+                                    warn_on_initvar=warn_on_initvar,
+                                    chunk_size=chunk_size,
+                                    as_bytes=_is_binary(fileobj)):
+            fileobj.write(chunk)
+
+    @classmethod
+    def iter_jsonl(cls, fileobj, *, mapping_mode=MappingMode.NoMap,
+                   validation_level=None):
+        """Lazily create an instance for each line of a json lines file.
+
+        Only one line is held in memory at a time. Blank lines are skipped.
+
+        :fileobj: A file object opened in text or binary mode, or any other
+                  iterable of lines
+        :mapping_mode: Format for properties
+        :validation_level: The ValidationLevel to check the DTOs and their
+                           nested DTOs with, instead of the class defaults
+        :returns: Returns an iterator of DTOs, in the order of the lines
+        """
+        return cls.from_json_lines(fileobj, mapping_mode=mapping_mode,
+                                   as_iterator=True,
+                                   validation_level=validation_level)
+
+    @classmethod
+    def iter_json_array(cls, source, *, mapping_mode=MappingMode.NoMap,
+                        chunk_size=DEFAULT_CHUNK_SIZE, validation_level=None):
+        """Lazily create an instance for each element of a json array.
+
+        The array is parsed incrementally, so only the element being parsed
+        is held in memory, instead of the whole document.
+
+        :source: A file object opened in text or binary mode, or an iterable
+                 of str or bytes chunks of the document
+        :mapping_mode: Format for properties
+        :chunk_size: The number of characters or bytes read at a time
+        :validation_level: The ValidationLevel to check the DTOs and their
+                           nested DTOs with, instead of the class defaults
+        :returns: Returns an iterator of DTOs, in the order of the array
+        """
+        decoder = cls._decoder(mapping_mode, validation_level)
+        return map(decoder, iter_json_array(source, chunk_size))
+
+    @classmethod
+    async def aiter_jsonl(cls, source, *, mapping_mode=MappingMode.NoMap,
+                          chunk_size=DEFAULT_CHUNK_SIZE,
+                          validation_level=None):
+        """Asynchronously create an instance for each line of json lines.
+
+        The source is read ``chunk_size`` at a time, and control is given
+        back to the event loop after the lines of each chunk, so that a
+        large body does not block other tasks. Blank lines are skipped.
+
+        :source: An ``asyncio.StreamReader`` or any object with a ``read``
+                 coroutine, or an async iterable of str or bytes chunks
+        :mapping_mode: Format for properties
+        :chunk_size: The number of characters or bytes read at a time
+        :validation_level: The ValidationLevel to check the DTOs and their
+                           nested DTOs with, instead of the class defaults
+        :returns: Returns an async iterator of DTOs, in the order of the lines
+        """
+        decoder = cls._decoder(mapping_mode, validation_level)
+        loads = cls._backend().loads
+        async for lines in aiter_line_batches(source, chunk_size):
+            for line in lines:
+                if line.strip():
+                    yield decoder(loads(line))
+            await asyncio.sleep(0)
+
+    @classmethod
+    async def aiter_json_array(cls, source, *,
+                               mapping_mode=MappingMode.NoMap,
+                               chunk_size=DEFAULT_CHUNK_SIZE,
+                               validation_level=None):
+        """Asynchronously create an instance for each element of an array.
+
+        The array is parsed incrementally, ``chunk_size`` at a time, and
+        control is given back to the event loop after the elements of each
+        chunk, so that a large body does not block other tasks.
+
+        :source: An ``asyncio.StreamReader`` or any object with a ``read``
+                 coroutine, or an async iterable of str or bytes chunks
+        :mapping_mode: Format for properties
+        :chunk_size: The number of characters or bytes read at a time
+        :validation_level: The ValidationLevel to check the DTOs and their
+                           nested DTOs with, instead of the class defaults
+        :returns: Returns an async iterator of DTOs, in the order of the array
+        """
+        decoder = cls._decoder(mapping_mode, validation_level)
+        async for raw_dicts in aiter_json_array_batches(source, chunk_size):
+            for raw_dict in raw_dicts:
+                yield decoder(raw_dict)
+            await asyncio.sleep(0)
+
+    @classmethod
+    def dump_jsonl(cls, instances, fileobj, *, keep_none=False,
+                   mapping_mode=MappingMode.NoMap, warn_on_initvar=True,
+                   chunk_size=1000):
+        """Write DTOs to a file, as one json object per line.
+
+        The lines are written in chunks of ``chunk_size`` lines, so that
+        neither a single write per line nor the whole output in memory is
+        needed.
+
+        :instances: An iterable of DTOs
+        :fileobj: A file object opened in text or binary mode
+        :keep_none: Filter keys that are None
+        :mapping_mode: Format for properties
+        :warn_on_initvar: Emit a warning if the class contains non-default
+                          init-only variables.
+        :chunk_size: The number of lines written at once
+        :returns: Returns the number of DTOs written
+        """
+        return cls.dump_json_many(instances, fileobj, lines=True,
+                                  keep_none=keep_none,
+                                  mapping_mode=mapping_mode,
+                                  warn_on_initvar=warn_on_initvar,
+                                  chunk_size=chunk_size)
+
+    @classmethod
+    def to_json_many(cls, instances, *, lines=False, keep_none=False,
+                     mapping_mode=MappingMode.NoMap, warn_on_initvar=True,
+                     as_bytes=False, chunk_size=1000, workers=None):
+        """Express many DTOs as a single json array, or as json lines.
+
+        The DTOs are encoded ``chunk_size`` at a time. With ``workers``, the
+        chunks are encoded by a pool of threads, which only helps with json
+        backends that release the GIL while encoding.
+
+        :instances: An iterable of DTOs
+        :lines: Produce one json object per line instead of an array
+        :keep_none: Filter keys that are None
+        :mapping_mode: Format for properties
+        :warn_on_initvar: Emit a warning if the class contains non-default
+                          init-only variables.
+        :as_bytes: Return utf-8 encoded bytes instead of a str
+        :chunk_size: The number of DTOs encoded at once
+        :workers: The number of threads that encode chunks, or None
+        :returns: Returns the DTOs as a json string, or bytes
+        """
+        format_method = cls._prepare_encoding(mapping_mode, warn_on_initvar)
+        backend = cls._backend()
+        dumps = backend.dumps_bytes if as_bytes else backend.dumps
+        parts = iter_encoded(instances, dumps=dumps, keep_none=keep_none,
+                             format_method=format_method, lines=lines,
+                             chunk_size=chunk_size, workers=workers)
+        return (b'' if as_bytes else '').join(parts)
+
+    @classmethod
+    def dump_json_many(cls, instances, fileobj, *, lines=False,
+                       keep_none=False, mapping_mode=MappingMode.NoMap,
+                       warn_on_initvar=True, chunk_size=1000, workers=None):
+        """Write many DTOs to a file, as a json array or as json lines.
+
+        Each chunk of ``chunk_size`` DTOs is written as soon as it is
+        encoded, so that neither a single write per DTO nor the whole output
+        in memory is needed. See ``to_json_many`` for ``workers``.
+
+        :instances: An iterable of DTOs
+        :fileobj: A file object opened in text or binary mode
+        :lines: Write one json object per line instead of an array
+        :keep_none: Filter keys that are None
+        :mapping_mode: Format for properties
+        :warn_on_initvar: Emit a warning if the class contains non-default
+                          init-only variables.
+        :chunk_size: The number of DTOs written at once
+        :workers: The number of threads that encode chunks, or None
+        :returns: Returns the number of DTOs written
+        """
+        format_method = cls._prepare_encoding(mapping_mode, warn_on_initvar)
+        backend = cls._backend()
+        dumps = backend.dumps_bytes if _is_binary(fileobj) else backend.dumps
+
+        count = 0
+
+        def counted():
+            nonlocal count
+            for instance in instances:
+                count += 1
+                yield instance
+
+        for part in iter_encoded(counted(), dumps=dumps, keep_none=keep_none,
+                                 format_method=format_method, lines=lines,
+                                 chunk_size=chunk_size, workers=workers):
+            fileobj.write(part)
+        return count
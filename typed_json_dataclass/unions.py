@@ -0,0 +1,116 @@
+"""Decoding of the values of Union and Optional fields.
+
+The members of a Union are sorted into the plain types a value can be
+matched against with a single lookup, and the dataclasses a json object can
+be turned into. By default a dict becomes the first dataclass member it
+instantiates. A field declared with ``union_field`` instead selects the
+member from the value of a discriminator key of the dict.
+"""
+import typing
+from dataclasses import dataclass, field, is_dataclass
+
+# The key of the UnionSpec in the metadata of a field
+METADATA_KEY = 'typed_json_union'
+
+_NONE_TYPE = type(None)
+
+
+@dataclass(frozen=True)
+class UnionSpec:
+    """How the dicts of a Union field select their dataclass member.
+
+    :discriminator: The key of the dicts whose value selects the member
+    :tags: A dict from the values of the discriminator to the members, or
+           None to use the names of the member classes
+    """
+    discriminator: str
+    tags: dict = field(default=None, hash=False)
+
+    def members_by_tag(self, members):
+        """Return the dict from discriminator values to members.
+
+        :members: The dataclass members of the Union
+        :returns: ``tags``, or the names of the members
+        """
+        if self.tags is not None:
+            return dict(self.tags)
+        return {member.__name__: member for member in members}
+
+
+def union_field(discriminator, *, tags=None, **kwargs):
+    """Declare a Union field whose dicts select their member by a key.
+
+    The key is kept in the dict if the selected member has a field of the
+    same name, and dropped otherwise. Likewise, ``to_dict`` adds the key to
+    the dicts of the members without such a field, see ``member_tags``.
+
+    :discriminator: The key of the dicts whose value selects the member
+    :tags: A dict from the values of the discriminator to the dataclass
+           members of the Union. Defaults to the names of the members
+    :kwargs: Passed on to ``dataclasses.field``
+    :returns: The field
+    """
+    metadata = dict(kwargs.pop('metadata', None) or {})
+    metadata[METADATA_KEY] = UnionSpec(discriminator, tags)
+    return field(metadata=metadata, **kwargs)
+
+
+def union_spec(field_def):
+    """Return the UnionSpec of a field, or None for regular fields."""
+    return field_def.metadata.get(METADATA_KEY)
+
+
+def resolve_self(cls, member):
+    """Resolve a ForwardRef member of a Union of a field of ``cls``.
+
+    :returns: ``cls`` for a ForwardRef to ``cls`` itself, and the member
+              unchanged otherwise
+    """
+    if (isinstance(member, typing.ForwardRef) and
+            member.__forward_arg__ == cls.__name__):
+        return cls
+    return member
+
+
+def member_tags(cls, field_def):
+    """Return the tags that the dicts of a Union field are serialized with.
+
+    Members that have a field named like the discriminator write the key
+    themselves. The dicts of the other members get the key added, so that
+    they select the same member when they are decoded again.
+
+    :cls: The class of the field
+    :field_def: The field
+    :returns: A tuple of the discriminator and a dict from the members
+              without a field of that name to their tags, or None for
+              fields that are not declared with ``union_field``
+    """
+    spec = union_spec(field_def)
+    if spec is None:
+        return None
+    members = [resolve_self(cls, member) for member in field_def.type.__args__]
+    tags = {}
+    for tag, member in spec.members_by_tag(
+            [member for member in members if is_dataclass(member)]).items():
+        if spec.discriminator not in member.__dataclass_fields__:
+            tags.setdefault(member, tag)
+    return spec.discriminator, tags
+
+
+def is_union(field_type):
+    """Check whether a type hint is a Union, which includes Optional."""
+    return getattr(field_type, '__origin__', None) is typing.Union
+
+
+def optional_member(field_type):
+    """Return ``T`` for a type hint like ``Optional[T]``.
+
+    :field_type: The type hint
+    :returns: The only member of a Union besides None, or None for other
+              type hints
+    """
+    if not is_union(field_type):
+        return None
+    members = [member for member in field_type.__args__
+               if member is not _NONE_TYPE]
+    return members[0] if len(members) == 1 else None
@@ -1,44 +1,150 @@
-def to_snake(string_to_convert: str):
-    converted = ''
+from collections import namedtuple
+from functools import lru_cache
+from itertools import islice
+
+# Default number of names that to_snake and to_camel each remember
+NAME_CACHE_SIZE = 4096
+
+
+def _to_snake(string_to_convert: str):
+    converted = []
     for i, c in enumerate(string_to_convert):
-        if c == c.lower():
-            converted += c
+        lower = c.lower()
+        if c == lower:
+            converted.append(c)
         else:
             if 0 < i:
-                converted += '_'
-            converted += c.lower()
-    return converted
+                converted.append('_')
+            converted.append(lower)
+    return ''.join(converted)
 
 
-def to_camel(string_to_convert: str):
-    converted = ''
+def _to_camel(string_to_convert: str):
+    converted = []
     next_is_capital = False
     for i, c in enumerate(string_to_convert):
         if c == '_':
-            next_is_capital = i != 0 and converted != ''
+            next_is_capital = i != 0 and bool(converted)
             continue
 
         if c == c.upper():
             next_is_capital = True
 
         if i == 0:
-            converted += c.lower()
+            converted.append(c.lower())
             next_is_capital = False
             continue
 
         if next_is_capital:
-            converted += c.upper()
+            converted.append(c.upper())
             next_is_capital = False
         else:
-            converted += c.lower()
+            converted.append(c.lower())
+
+    return ''.join(converted)
+
+
+def configure_name_cache(maxsize=NAME_CACHE_SIZE):
+    """Set the number of names that to_snake and to_camel remember.
+
+    Keys usually come from a small, fixed set of names, so the converted
+    names are kept in a least recently used cache. Reconfiguring the cache
+    also empties it and resets its statistics.
+
+    :maxsize: The number of names per function, or None for no limit
+    """
+    global _cached_to_snake, _cached_to_camel
+    _cached_to_snake = lru_cache(maxsize=maxsize)(_to_snake)
+    _cached_to_camel = lru_cache(maxsize=maxsize)(_to_camel)
+
+
+def name_cache_info():
+    """Return the statistics of the name cache of to_snake and to_camel.
+
+    :returns: A dict from function name to its ``functools`` ``CacheInfo``,
+              with the hits, misses, maxsize and currsize of the cache
+    """
+    return {
+        'to_snake': _cached_to_snake.cache_info(),
+        'to_camel': _cached_to_camel.cache_info(),
+    }
+
 
-    return converted
+configure_name_cache()
 
 
-def recursive_rename(raw_dict, format_method):
+def to_snake(string_to_convert: str):
+    return _cached_to_snake(string_to_convert)
+
+
+def to_camel(string_to_convert: str):
+    return _cached_to_camel(string_to_convert)
+
+
+# How recursive_rename treats a dict and the dicts nested in it. The dict of
+# a class has its keys renamed, with ``names`` as its known names, and the
+# dicts of its fields are renamed by the rules in ``fields``. The keys of a
+# typed dict like Dict[str, V] are data, so with ``keep_keys`` they are kept,
+# and its dict values are renamed by the rule ``values``. Dicts without a
+# rule have their keys renamed all the way down
+RenameRule = namedtuple('RenameRule',
+                        ['keep_keys', 'names', 'fields', 'values'])
+
+
+def recursive_rename(raw_dict, format_method, known_names=None, rule=None):
+    """Rename the keys of a dict, and of the dicts nested in it.
+
+    The nested dicts are renamed from a worklist rather than by recursion,
+    so that documents of any depth can be renamed.
+
+    :raw_dict: The dict to rename the keys of
+    :format_method: The function that converts a key
+    :known_names: An optional dict of keys of ``raw_dict`` that are already
+                  converted, such as the keys expected for the fields of a
+                  class
+    :rule: An optional RenameRule of ``raw_dict``
+    :returns: A new dict with the renamed keys
+    """
     renamed_dict = {}
-    for k, v in raw_dict.items():
-        if isinstance(v, dict):
-            v = recursive_rename(v, format_method)
-        renamed_dict[format_method(k)] = v
+    worklist = [(raw_dict, renamed_dict, known_names, rule)]
+    while worklist:
+        source, renamed, names, rule = worklist.pop()
+        if rule is not None and rule.keep_keys:
+            for k, v in source.items():
+                if isinstance(v, dict):
+                    nested = {}
+                    worklist.append((v, nested, None, rule.values))
+                    v = nested
+                renamed[k] = v
+            continue
+        field_rules = None
+        if rule is not None:
+            names = rule.names
+            field_rules = rule.fields
+        for k, v in source.items():
+            name = names.get(k) if names is not None else None
+            if name is None:
+                name = format_method(k)
+            if isinstance(v, dict):
+                nested = {}
+                nested_rule = (field_rules.get(name)
+                               if field_rules is not None else None)
+                worklist.append((v, nested, None, nested_rule))
+                v = nested
+            renamed[name] = v
     return renamed_dict
+
+
+def iter_batches(iterable, size):
+    """Group the elements of an iterable into lists of ``size`` elements.
+
+    :iterable: The elements to group
+    :size: The number of elements per list, the last list may be shorter
+    :returns: An iterator of lists
+    """
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
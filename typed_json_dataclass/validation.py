@@ -0,0 +1,64 @@
+"""Levels of validation that instances can be created with.
+
+The level of a class is given in its definition, and decoding methods can
+override it for a single call. The level of a call applies to the nested
+instances that are created during the call as well, which is why it is kept
+in a context variable instead of being passed around.
+"""
+import contextvars
+import random
+from enum import Enum
+
+# Number of random elements of a list checked by the sampled level, on top of
+# the first and the last element
+SAMPLE_SIZE = 8
+
+# The level given to the decoding method that is running, or None
+current_level = contextvars.ContextVar('validation_level', default=None)
+
+
+class ValidationLevel(Enum):
+    """How thoroughly values are checked against their type hints.
+
+    :Full: Every value is checked, including every element of every list
+    :Sampled: Like Full, but only the first, the last and ``SAMPLE_SIZE``
+              random elements of each list are checked
+    :Trusted: Nothing is checked, nested dicts are only turned into instances
+    """
+    Full = 1
+    Sampled = 2
+    Trusted = 3
+
+
+def sample(values):
+    """Return the elements of a list that the sampled level checks.
+
+    :values: The list to check
+    :returns: The list itself if it is short, otherwise a list of its first,
+              its last and ``SAMPLE_SIZE`` random elements in between
+    """
+    if len(values) <= SAMPLE_SIZE + 2:
+        return values
+    middle = random.sample(range(1, len(values) - 1), SAMPLE_SIZE)
+    return [values[0], *(values[i] for i in middle), values[-1]]
+
+
+def with_level(level, function):
+    """Wrap a function so that it runs at a validation level.
+
+    :level: The ValidationLevel, or None to run at the levels of the classes
+    :function: The function to wrap
+    :returns: The wrapped function, or ``function`` itself if level is None
+    """
+    if level is None:
+        return function
+    if not isinstance(level, ValidationLevel):
+        raise ValueError('Invalid validation level')
+
+    def run_at_level(*args):
+        token = current_level.set(level)
+        try:
+            return function(*args)
+        finally:
+            current_level.reset(token)
+    return run_at_level
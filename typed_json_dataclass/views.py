@@ -0,0 +1,265 @@
+"""Read-only views of instances that look like the result of ``to_dict``.
+
+``to_dict`` builds new dicts and lists for the whole instance. A view wraps
+the instance instead, and looks values up when they are accessed, so walking
+a view only creates the small views of the nested instances and containers
+that are reached. The keys and values are the ones ``to_dict`` would return,
+quirks included: nested instances keep their None fields, keys are not
+renamed inside of lists or typed dicts, and members of ``union_field``
+fields have their discriminator added.
+
+Views reflect the current state of the instance, so changes to it after the
+view was created are visible through the view.
+"""
+from array import array
+from collections.abc import ItemsView, Mapping, Sequence
+from dataclasses import fields
+
+from typed_json_dataclass.arrays import array_spec
+from typed_json_dataclass.cache import class_cache
+from typed_json_dataclass.containers import dict_depth
+from typed_json_dataclass.unions import member_tags
+
+# Values of these classes are returned as they are
+_ATOMIC = frozenset({str, int, float, bool, type(None)})
+
+
+def view_of(value, format_method, keep_keys=0):
+    """Return the view of a value, or the value itself if it is atomic.
+
+    :value: The value
+    :format_method: The function to rename keys with, or None
+    :keep_keys: The number of levels of dicts whose keys are not renamed,
+                see ``containers.dict_depth``
+    :returns: A DataclassView for dataclasses, a DictView for dicts, a
+              SequenceView for lists, tuples, sets and arrays, and the value
+              itself for anything else
+    """
+    value_type = value.__class__
+    if value_type in _ATOMIC:
+        return value
+    if hasattr(value_type, '__dataclass_fields__'):
+        return DataclassView(value, True, format_method)
+    if isinstance(value, (list, tuple, array)):
+        return SequenceView(value)
+    if isinstance(value, (set, frozenset)):
+        # Sets cannot be indexed, so their elements are put in a tuple
+        return SequenceView(tuple(value))
+    if isinstance(value, dict):
+        return DictView(value, format_method, keep_keys)
+    return value
+
+
+def _field_keys(cls, format_method):
+    """Return the keys of the fields of a dataclass in its views.
+
+    :returns: A tuple of a list of (key, field name, array type or None,
+              tagging or None, levels of kept keys) tuples in field order,
+              and a dict from key to the last four. The tagging is a tuple
+              of the key of the discriminator and the tags of the members,
+              see ``unions.member_tags``
+    """
+    cache_key = ('view_keys', format_method)
+    try:
+        return cls.__dict__['_typed_json_cache'][cache_key]
+    except KeyError:
+        pass
+
+    keys = []
+    for field_def in fields(cls):
+        key = field_def.name
+        if format_method is not None:
+            key = format_method(key)
+        spec = array_spec(field_def)
+        tagging = member_tags(cls, field_def)
+        if tagging is not None:
+            discriminator, tags = tagging
+            if format_method is not None:
+                discriminator = format_method(discriminator)
+            tagging = (discriminator, tags) if tags else None
+        keep_keys = 0
+        if format_method is not None:
+            keep_keys = dict_depth(field_def.type)
+        keys.append((key, field_def.name,
+                     None if spec is None else spec.array_type(), tagging,
+                     keep_keys))
+    field_keys = keys, {key: rest for key, *rest in keys}
+    class_cache(cls)[cache_key] = field_keys
+    return field_keys
+
+
+class _ItemsView(ItemsView):
+    """The items of a view, iterated without looking up every key."""
+    __slots__ = ()
+
+    def __iter__(self):
+        return self._mapping._iter_items()
+
+
+class DataclassView(Mapping):
+    """A read-only mapping of the fields of a dataclass instance.
+
+    :instance: The instance
+    :keep_none: Whether fields that are None are kept
+    :format_method: The function to rename keys with, or None
+    :tag: A tuple of a key and value put before the fields, or None
+    """
+    __slots__ = ('_instance', '_keep_none', '_format_method', '_keys',
+                 '_names', '_tag')
+
+    def __init__(self, instance, keep_none, format_method, tag=None):
+        self._instance = instance
+        self._keep_none = keep_none
+        self._format_method = format_method
+        self._keys, self._names = _field_keys(type(instance), format_method)
+        self._tag = tag
+
+    def _value(self, field_name, array_type, tagging, keep_keys):
+        value = getattr(self._instance, field_name)
+        if tagging is not None:
+            discriminator, tags = tagging
+            if value.__class__ in tags:
+                return DataclassView(value, True, self._format_method,
+                                     (discriminator, tags[value.__class__]))
+        if array_type is not None and isinstance(value, array_type):
+            # numpy arrays hold numpy scalars, so they become lists like in
+            # to_dict, while the elements of an array.array are numbers
+            if not isinstance(value, array):
+                return value.tolist()
+            return SequenceView(value)
+        return view_of(value, self._format_method, keep_keys)
+
+    def __getitem__(self, key):
+        if self._tag is not None and key == self._tag[0]:
+            return self._tag[1]
+        field_name, *rest = self._names[key]
+        if getattr(self._instance, field_name) is None:
+            if not self._keep_none:
+                raise KeyError(key)
+            return None
+        return self._value(field_name, *rest)
+
+    def __iter__(self):
+        if self._tag is not None:
+            yield self._tag[0]
+        instance = self._instance
+        for key, field_name, *_ in self._keys:
+            if self._keep_none or getattr(instance, field_name) is not None:
+                yield key
+
+    def __len__(self):
+        if self._keep_none:
+            return len(self._keys) + (self._tag is not None)
+        return sum(1 for _ in self)
+
+    def items(self):
+        return _ItemsView(self)
+
+    def _iter_items(self):
+        # Looks up every field once, instead of once for the key and once
+        # for the value
+        if self._tag is not None:
+            yield self._tag
+        instance = self._instance
+        for key, field_name, *rest in self._keys:
+            value = getattr(instance, field_name)
+            if value is None:
+                if self._keep_none:
+                    yield key, None
+            else:
+                yield key, self._value(field_name, *rest)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._instance!r})'
+
+
+class DictView(Mapping):
+    """A read-only mapping of a dict, with the keys renamed.
+
+    Only str keys are renamed, like ``to_dict`` does, and none of the keys
+    of typed dicts.
+
+    :raw: The dict
+    :format_method: The function to rename keys with, or None
+    :keep_keys: The number of levels of dicts, starting with this one, whose
+                keys are not renamed
+    """
+    __slots__ = ('_raw', '_format_method', '_keep_keys', '_originals')
+
+    def __init__(self, raw, format_method, keep_keys=0):
+        self._raw = raw
+        self._format_method = format_method
+        self._keep_keys = keep_keys
+        # The renamed keys of the dict, built on first lookup
+        self._originals = None
+
+    def _rename(self, key):
+        if (self._format_method is None or self._keep_keys or
+                key.__class__ is not str):
+            return key
+        return self._format_method(key)
+
+    def _nested_keep_keys(self):
+        return self._keep_keys - 1 if self._keep_keys else 0
+
+    def __getitem__(self, key):
+        if self._format_method is not None and not self._keep_keys:
+            if self._originals is None:
+                self._originals = {self._rename(k): k for k in self._raw}
+            key = self._originals[key]
+        return view_of(self._raw[key], self._format_method,
+                       self._nested_keep_keys())
+
+    def __iter__(self):
+        for key in self._raw:
+            yield self._rename(key)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def items(self):
+        return _ItemsView(self)
+
+    def _iter_items(self):
+        format_method = self._format_method
+        keep_keys = self._nested_keep_keys()
+        for key, value in self._raw.items():
+            yield self._rename(key), view_of(value, format_method, keep_keys)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._raw!r})'
+
+
+class SequenceView(Sequence):
+    """A read-only sequence of the views of the elements of a list.
+
+    Like ``to_dict``, keys of the dataclasses and dicts in the sequence are
+    never renamed.
+
+    :raw: The list, tuple or array
+    """
+    __slots__ = ('_raw',)
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SequenceView(self._raw[index])
+        return view_of(self._raw[index], None)
+
+    def __iter__(self):
+        for value in self._raw:
+            yield view_of(value, None)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __eq__(self, other):
+        if not isinstance(other, (SequenceView, list, tuple, array)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._raw!r})'